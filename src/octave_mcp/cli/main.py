@@ -20,16 +20,13 @@ def cli():
 @click.option("--verbose", is_flag=True, help="Show pipeline stages")
 def ingest(file: str, schema: str | None, fix: bool, verbose: bool):
     """Ingest lenient OCTAVE and emit canonical."""
-    from octave_mcp.core.emitter import emit
-    from octave_mcp.core.parser import parse
+    from octave_mcp.core.pipeline import process
 
     with open(file) as f:
         content = f.read()
 
     try:
-        doc = parse(content)
-        canonical = emit(doc)
-        click.echo(canonical)
+        click.echo(process(content).canonical)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         raise click.Abort() from e
@@ -41,15 +38,13 @@ def ingest(file: str, schema: str | None, fix: bool, verbose: bool):
 @click.option("--mode", type=click.Choice(["canonical", "authoring", "executive", "developer"]), default="canonical")
 def eject(file: str, schema: str | None, mode: str):
     """Eject OCTAVE to projected format."""
-    from octave_mcp.core.emitter import emit
-    from octave_mcp.core.parser import parse
+    from octave_mcp.core.pipeline import process
 
     with open(file) as f:
         content = f.read()
 
     try:
-        doc = parse(content)
-        output = emit(doc)  # For now, just emit canonical
+        output = process(content).canonical  # For now, just emit canonical
         click.echo(output)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -57,30 +52,46 @@ def eject(file: str, schema: str | None, mode: str):
 
 
 @cli.command()
-@click.argument("file", type=click.Path(exists=True))
+@click.argument("files", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
 @click.option("--schema", help="Schema name for validation")
 @click.option("--strict", is_flag=True, help="Strict mode (reject unknown fields)")
-def validate(file: str, schema: str | None, strict: bool):
-    """Validate OCTAVE against schema."""
-    from octave_mcp.core.parser import parse
-    from octave_mcp.core.validator import validate as validate_doc
-
-    with open(file) as f:
-        content = f.read()
-
-    try:
-        doc = parse(content)
-        errors = validate_doc(doc, strict=strict)
-
-        if errors:
-            for error in errors:
-                click.echo(f"{error.code}: {error.message}", err=True)
-            raise click.Abort()
-        else:
-            click.echo("Valid")
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort() from e
+@click.option(
+    "--cache-dir",
+    envvar="OCTAVE_CACHE_DIR",
+    type=click.Path(file_okay=False),
+    help="Reuse parsed documents of unchanged files from this directory",
+)
+def validate(files: tuple[str, ...], schema: str | None, strict: bool, cache_dir: str | None):
+    """Validate OCTAVE files against schema."""
+    from octave_mcp.core.disk_cache import DiskCache
+    from octave_mcp.core.lexer import tokenize_file
+    from octave_mcp.core.parser import iter_events
+    from octave_mcp.core.validator import validate as validate_document
+    from octave_mcp.core.validator import validate_events
+
+    cache = DiskCache(cache_dir) if cache_dir else None
+    failed = False
+    for file in files:
+        prefix = f"{file}: " if len(files) > 1 else ""
+        try:
+            if cache is not None:
+                errors = validate_document(cache.parse_file(file), strict=strict)
+            else:
+                # Lex through a memory map so large archives are never decoded whole,
+                # and validate from parser events so no AST is built
+                errors = validate_events(iter_events(tokenize_file(file)), strict=strict)
+        except Exception as e:
+            click.echo(f"{prefix}Error: {e}", err=True)
+            failed = True
+            continue
+
+        for error in errors:
+            click.echo(f"{prefix}{error.code}: {error.message}", err=True)
+        failed = failed or bool(errors)
+
+    if failed:
+        raise click.Abort()
+    click.echo("Valid")
 
 
 if __name__ == "__main__":
@@ -1,21 +1,46 @@
 """AST node definitions for OCTAVE parser.
 
-Implements data structures for the abstract syntax tree.
+Implements data structures for the abstract syntax tree. Nodes are slotted
+dataclasses, so large documents do not pay for a __dict__ per node; keys
+come from the lexer interned, so repeated field names share one string.
+
+Every node has a digest: a SHA-256 Merkle hash of its canonical form, built
+from the node's own emitted header and its children's digests. Nodes can be
+changed in place, so digests are computed from the current tree when asked
+for rather than cached on the nodes; changed_paths() hashes each node at
+most once and skips subtrees two documents share.
+
+Blocks and sections near the top of the tree can also cache their emitted
+text (see emitter.emit_to(), reuse), so re-emitting a document after
+with_values() renders only the nodes on the changed paths and splices the
+text of the rest.
 """
 
-from dataclasses import dataclass, field
-from typing import Any
+import hashlib
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any, cast
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTNode:
     """Base class for all AST nodes."""
 
     line: int = 0
     column: int = 0
 
+    @property
+    def digest(self) -> bytes:
+        """SHA-256 Merkle hash of the node's canonical form.
+
+        Nodes with equal digests emit the same canonical text, wherever they
+        are in the source. The digest is computed from the node's current
+        subtree on each access, so it reflects in-place changes.
+        """
+        return _digest_tree(self, {})
+
 
-@dataclass
+@dataclass(slots=True)
 class Assignment(ASTNode):
     """KEY::value assignment."""
 
@@ -23,15 +48,16 @@ class Assignment(ASTNode):
     value: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Block(ASTNode):
     """KEY: with nested children."""
 
     key: str = ""
     children: list[ASTNode] = field(default_factory=list)
+    _text: tuple[int, str] | None = field(default=None, init=False, repr=False, compare=False)  # (indent, text)
 
 
-@dataclass
+@dataclass(slots=True)
 class Section(ASTNode):
     """§NUMBER::NAME section with nested children.
 
@@ -43,34 +69,377 @@ class Section(ASTNode):
     key: str = ""
     annotation: str | None = None
     children: list[ASTNode] = field(default_factory=list)
+    _text: tuple[int, str] | None = field(default=None, init=False, repr=False, compare=False)  # (indent, text)
 
 
-@dataclass
+@dataclass(slots=True)
 class Document(ASTNode):
-    """Top-level OCTAVE document with envelope."""
+    """Top-level OCTAVE document with envelope.
+
+    index maps dotted paths to nodes. It is built on first use and kept
+    until sections is reassigned or invalidate_caches() is called, so it
+    stays valid while the tree is only changed through with_values(), whose
+    copies build their own. Changes made in place inside sections keep the
+    index and the emitted text cached on nodes until invalidate_caches().
+    """
 
     name: str = "INFERRED"
     meta: dict[str, Any] = field(default_factory=dict)
     sections: list[ASTNode] = field(default_factory=list)
     has_separator: bool = False
+    _index: "PathIndex | None" = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name == "sections":
+            object.__setattr__(self, "_index", None)
+
+    def __getstate__(self) -> list[Any]:
+        # The index is rebuilt on demand rather than pickled
+        return [self.line, self.column, self.name, self.meta, self.sections, self.has_separator]
+
+    def __setstate__(self, state: list[Any]) -> None:
+        self.line, self.column, self.name, self.meta, self.sections, self.has_separator = state
+
+    @property
+    def index(self) -> "PathIndex":
+        """Dotted-path index of the document's nodes, built on first use (see invalidate_caches())."""
+        index = self._index
+        if index is None:
+            index = self._index = PathIndex(self)
+        return index
+
+    def invalidate_caches(self, path: str | None = None) -> None:
+        """Drop the index and cached emitted text after changing nodes in place.
+
+        Documents built by with_values() and other copies start without
+        them, so this is only needed for in-place changes.
+
+        Args:
+            path: Dotted path of the changed node, as indexed before the
+                change (see index); only its own and its ancestors' text is
+                dropped. None drops it for every node.
+
+        Raises:
+            KeyError: If no node has path
+        """
+        if path is None:
+            stack = list(self.sections)
+        else:
+            index = self.index
+            stack = [index[path], *index.ancestors(path)]
+        self._index = None
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Block | Section):
+                node._text = None
+                if path is None:
+                    stack.extend(node.children)
+
+    def changed_paths(self, other: "Document") -> list[str]:
+        """Return the dotted paths of nodes that differ between this document and other.
+
+        Children are matched by key and, for duplicate keys, by occurrence.
+        Subtrees shared by both documents (as with with_values() copies) are
+        skipped without being hashed; others are hashed once and skipped if
+        their digests are equal. Each difference is reported once, at the
+        deepest path that contains it: an added or removed node, a changed
+        assignment or section header, or a node that only moved among its
+        siblings. Differences in the
+        envelope (name, META, separator) have no path and are not reported.
 
+        Args:
+            other: Document to compare with
 
-@dataclass
+        Returns:
+            Paths in document order, possibly repeated for duplicate keys
+        """
+        changed: list[str] = []
+        digests: dict[int, bytes] = {}  # id of node -> digest, for both documents
+        # Items are (path, None, None) to report path, or (path, old, new) to compare two containers' children
+        stack: list[tuple[str | None, list[ASTNode] | None, list[ASTNode] | None]] = [
+            (None, self.sections, other.sections)
+        ]
+        while stack:
+            path, old_children, new_children = stack.pop()
+            if old_children is None or new_children is None:
+                changed.append(cast(str, path))
+                continue
+            old = _keyed_children(old_children)
+            new = _keyed_children(new_children)
+            # A node moved if the node before it, among those in both lists, is not the same
+            old_before = _predecessors([match for match in old if match in new])
+            new_before = _predecessors([match for match in new if match in old])
+            pending: list[tuple[str | None, list[ASTNode] | None, list[ASTNode] | None]] = []
+            for match in [*old, *(match for match in new if match not in old)]:
+                child_path = match[0] if path is None else f"{path}.{match[0]}"
+                if match not in old or match not in new:
+                    pending.append((child_path, None, None))
+                    continue
+                a, b = old[match], new[match]
+                if a is not b and _digest_tree(a, digests) != _digest_tree(b, digests):
+                    if isinstance(a, Block | Section) and type(a) is type(b) and _header(a) == _header(b):
+                        pending.append((child_path, a.children, b.children))
+                    else:
+                        pending.append((child_path, None, None))
+                elif old_before[match] != new_before[match]:
+                    pending.append((child_path, None, None))
+            stack.extend(reversed(pending))
+        return changed
+
+    def section(self, section_id: str) -> "Section":
+        """Return the § section with section_id (e.g. "2b").
+
+        Raises:
+            KeyError: If there is no such section
+        """
+        return self.index.section(section_id)
+
+    def with_value(self, path: str, value: Any) -> "Document":
+        """Return a copy of the document with the assignment at path set to value.
+
+        See with_values().
+        """
+        return self.with_values({path: value})
+
+    def with_values(self, changes: Mapping[str, Any]) -> "Document":
+        """Return a copy of the document with assignments set to new values.
+
+        Only the changed assignments and their ancestors are copied; every
+        other node is shared by reference with this document, which is left
+        unchanged. Shared subtrees must therefore not be modified in place
+        through either document afterwards.
+
+        Args:
+            changes: New values keyed by dotted path (see index)
+
+        Returns:
+            New Document
+
+        Raises:
+            KeyError: If no node has one of the paths
+            TypeError: If a path names a block or section rather than an assignment
+        """
+        index = self.index
+        updated: dict[int, ASTNode] = {}  # id of changed assignment -> its copy
+        spine: set[int] = set()  # ids of containers on the way to a changed assignment
+        for path, value in changes.items():
+            node = index[path]
+            if not isinstance(node, Assignment):
+                raise TypeError(f"{path} is a {type(node).__name__}, not an assignment")
+            updated[id(node)] = replace(node, value=value)
+            for ancestor in index.ancestors(path):
+                if id(ancestor) in spine:
+                    break  # The rest of the way up is already marked
+                spine.add(id(ancestor))
+
+        # Copy the spine bottom-up with an explicit stack, so depth is unlimited
+        # (container or None for the document, its remaining children, its copied children)
+        stack: list[tuple[Block | Section | None, Iterator[ASTNode], list[ASTNode]]] = [(None, iter(self.sections), [])]
+        while True:
+            container, children, copied = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if container is None:
+                    return replace(self, sections=copied)
+                stack[-1][2].append(replace(container, children=copied))
+            elif id(child) in spine and isinstance(child, Block | Section):
+                stack.append((child, iter(child.children), []))
+            else:
+                copied.append(updated.get(id(child), child))
+
+
+@dataclass(slots=True)
 class Comment(ASTNode):
     """Comment node."""
 
     text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ListValue:
     """List value [a, b, c]."""
 
     items: list[Any] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class InlineMap:
     """Inline map [k::v, k2::v2] (data mode only)."""
 
     pairs: dict[str, Any] = field(default_factory=dict)
+
+
+class PathIndex:
+    """Dotted-path lookup of the nodes of a Document.
+
+    Paths join the keys of Assignment, Block and Section nodes from the top
+    level down, e.g. "BLOCK.CHILD.KEY" for KEY inside CHILD inside BLOCK;
+    children of a § section are reached through the section's key. Where
+    several nodes share a path, the first in document order wins. Keys may
+    contain dots, so a path can also name nodes under keys split differently
+    ("A.B" at the top level and B inside A); such paths are ambiguous (see
+    ambiguous()). § sections are also indexed by section id.
+    """
+
+    __slots__ = ("_ambiguous", "_nodes", "_parents", "_sections")
+
+    def __init__(self, doc: Document):
+        """Index every node of doc (iteratively, so depth is unlimited).
+
+        Args:
+            doc: Document to index
+        """
+        self._nodes: dict[str, tuple[ASTNode, ASTNode]] = {}
+        # id of every Block and Section -> its parent (including those shadowed by a duplicate path)
+        self._parents: dict[int, ASTNode] = {}
+        self._sections: dict[str, Section] = {}
+        self._ambiguous: set[str] = set()
+        # Depth-first, so nodes are visited in document order
+        stack: list[tuple[str | None, ASTNode, Iterator[ASTNode]]] = [(None, doc, iter(doc.sections))]
+        while stack:
+            parent_path, parent, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                continue
+            if not isinstance(child, Assignment | Block | Section):
+                continue
+            path = child.key if parent_path is None else f"{parent_path}.{child.key}"
+            entry = self._nodes.get(path)
+            if entry is None:
+                self._nodes[path] = (child, parent)
+            elif cast(Assignment | Block | Section, entry[0]).key != child.key or parent_path in self._ambiguous:
+                self._ambiguous.add(path)  # Same path from keys split differently
+            if isinstance(child, Section):
+                self._sections.setdefault(child.section_id, child)
+            if isinstance(child, Block | Section):
+                self._parents[id(child)] = parent
+                stack.append((path, child, iter(child.children)))
+
+    def __getitem__(self, path: str) -> ASTNode:
+        return self._nodes[path][0]
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._nodes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get(self, path: str, default: ASTNode | None = None) -> ASTNode | None:
+        """Return the node at path, or default."""
+        entry = self._nodes.get(path)
+        return default if entry is None else entry[0]
+
+    def ambiguous(self, path: str) -> bool:
+        """Return whether path names nodes under keys split differently, e.g. "A.B" and B inside A."""
+        return path in self._ambiguous
+
+    def parent(self, path: str) -> ASTNode:
+        """Return the Block, Section or Document containing the node at path.
+
+        Raises:
+            KeyError: If no node has this path
+        """
+        return self._nodes[path][1]
+
+    def section(self, section_id: str) -> Section:
+        """Return the § section with section_id.
+
+        Raises:
+            KeyError: If there is no such section
+        """
+        return self._sections[section_id]
+
+    def ancestors(self, path: str) -> Iterator[Block | Section]:
+        """Yield the Blocks and Sections containing the node at path, innermost first.
+
+        Raises:
+            KeyError: If no node has this path
+        """
+        parent = self._nodes[path][1]
+        while isinstance(parent, Block | Section):
+            yield parent
+            parent = self._parents[id(parent)]
+
+
+def _keyed_children(children: list[ASTNode]) -> dict[tuple[str, int], Assignment | Block | Section]:
+    """Map (key, occurrence of key) to the keyed children, in order."""
+    keyed: dict[tuple[str, int], Assignment | Block | Section] = {}
+    occurrences: dict[str, int] = {}
+    for child in children:
+        if isinstance(child, Assignment | Block | Section):
+            occurrence = occurrences[child.key] = occurrences.get(child.key, -1) + 1
+            keyed[child.key, occurrence] = child
+    return keyed
+
+
+def _predecessors(matches: list[tuple[str, int]]) -> dict[tuple[str, int], tuple[str, int] | None]:
+    """Map each item of a list to the item before it (None for the first)."""
+    return dict(zip(matches, [None, *matches], strict=False))
+
+
+def _header(node: ASTNode) -> str:
+    """Return the canonical text a node emits itself, without its children."""
+    # The emitter imports this module, so import it on first use
+    from octave_mcp.core.emitter import emit_meta, emit_value
+
+    if isinstance(node, Assignment):
+        return f"{node.key}::{emit_value(node.value)}"
+    if isinstance(node, Block):
+        return f"{node.key}:"
+    if isinstance(node, Section):
+        annotation = f"[{node.annotation}]" if node.annotation else ""
+        return f"§{node.section_id}::{node.key}{annotation}"
+    if isinstance(node, Document):
+        return f"==={node.name}===\n{emit_meta(node.meta)}\n{'---' if node.has_separator else ''}"
+    if isinstance(node, Comment):
+        return node.text
+    return ""
+
+
+def _digest_tree(root: ASTNode, digests: dict[int, bytes]) -> bytes:
+    """Compute the digests of root and its descendants that are not in digests yet.
+
+    Post-order with an explicit stack, so depth is unlimited. Digests are
+    added to digests by node id, so callers hashing several trees that share
+    nodes hash those once. Comments are not emitted and so do not contribute
+    to their container's digest.
+    """
+    stack: list[tuple[ASTNode, list[ASTNode]]] = [(root, _digest_children(root))]
+    while stack:
+        node, children = stack[-1]
+        pending = [child for child in children if id(child) not in digests and _digest_children(child)]
+        if pending:
+            # Revisit node once these subtrees are done; leaves are hashed with their parent
+            stack.extend((child, _digest_children(child)) for child in pending)
+            continue
+        stack.pop()
+        if id(node) not in digests:  # Else a shared subtree reached twice
+            digests[id(node)] = _hash_node(node, children, digests)
+    return digests[id(root)]
+
+
+def _hash_node(node: ASTNode, children: list[ASTNode], digests: dict[int, bytes]) -> bytes:
+    """Hash a node's header with its children's digests, hashing leaf children as needed."""
+    digest = hashlib.sha256(f"{type(node).__name__}\0{_header(node)}\0".encode())
+    for child in children:
+        if isinstance(child, Assignment | Block | Section):
+            child_digest = digests.get(id(child))
+            if child_digest is None:  # A leaf: non-empty containers are hashed first
+                child_digest = digests[id(child)] = _hash_node(child, [], digests)
+            digest.update(child_digest)
+    return digest.digest()
+
+
+def _digest_children(node: ASTNode) -> list[ASTNode]:
+    """Return the nodes whose digests make up node's digest."""
+    if isinstance(node, Document):
+        return node.sections
+    if isinstance(node, Block | Section):
+        return node.children
+    return []
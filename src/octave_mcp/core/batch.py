@@ -0,0 +1,123 @@
+"""Parallel parsing of many OCTAVE documents.
+
+Lexing and parsing are pure CPU work, so large corpora are parsed in a
+ProcessPoolExecutor. Work is split at file boundaries for paths and at
+envelope boundaries (see parser.split_documents) for text, and results are
+gathered back in input order with one error per input item. Workers send
+documents back in the binary AST encoding, which is cheaper to produce and
+load than pickling the node graph.
+"""
+
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from octave_mcp.core import binary
+from octave_mcp.core.ast_nodes import Document
+from octave_mcp.core.parser import DocumentText, iter_documents, split_documents
+
+# Task batches sent to each worker; larger batches amortize IPC, smaller ones balance load
+_TASKS_PER_WORKER = 4
+
+
+@dataclass
+class ParseResult:
+    """Documents parsed from one input item.
+
+    Documents are those parsed before the first error, in source order; error
+    is that error, or None when the whole item parsed.
+    """
+
+    source: str  # File path, or "<text N>" for the Nth of the texts
+    documents: list[Document] = field(default_factory=list)
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the whole item parsed."""
+        return self.error is None
+
+
+def _parse_task(task: str | DocumentText) -> tuple[list[Document], Exception | None]:
+    """Parse a file (given by path) or a single document's text in a worker."""
+    documents: list[Document] = []
+    try:
+        if isinstance(task, DocumentText):
+            documents.append(task.parse())
+        else:
+            with open(task, encoding="utf-8") as f:
+                documents.extend(iter_documents(f))
+    except Exception as e:
+        return documents, e
+    return documents, None
+
+
+def _parse_task_encoded(task: str | DocumentText) -> tuple[list[bytes], Exception | None]:
+    """Parse like _parse_task, returning the documents encoded for the trip back."""
+    documents, error = _parse_task(task)
+    return [binary.dumps(doc) for doc in documents], error
+
+
+def parse_many(
+    paths: Iterable[str | os.PathLike[str]] = (),
+    texts: Iterable[str] = (),
+    workers: int | None = None,
+) -> list[ParseResult]:
+    """Parse files and texts in parallel worker processes.
+
+    Each path is parsed by one worker as a stream of envelopes; each text is
+    split at envelope boundaries first, so the documents of one large text
+    are spread across workers. Errors do not stop the batch: they are
+    reported on the result of the item they occurred in.
+
+    Args:
+        paths: Paths of OCTAVE files (str or os.PathLike)
+        texts: OCTAVE text
+        workers: Number of worker processes (defaults to the CPU count);
+            1 parses in the calling process
+
+    Returns:
+        One ParseResult per path, in order, then one per text, in order
+
+    Raises:
+        TypeError: If paths or texts is a single str rather than a collection
+    """
+    if isinstance(paths, str | os.PathLike) or isinstance(texts, str):
+        raise TypeError("paths and texts must be iterables of items, not a single str or path")
+
+    results: list[ParseResult] = []
+    tasks: list[str | DocumentText] = []
+    owners: list[int] = []  # Index into results of each task
+    for path in paths:
+        results.append(ParseResult(os.fspath(path)))
+        tasks.append(os.fspath(path))
+        owners.append(len(results) - 1)
+    for index, text in enumerate(texts):
+        results.append(ParseResult(f"<text {index}>"))
+        chunks = list(split_documents(text))
+        tasks.extend(chunks)
+        owners.extend([len(results) - 1] * len(chunks))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) < 2:
+        _collect(results, owners, map(_parse_task, tasks))
+    else:
+        chunksize = max(1, len(tasks) // (workers * _TASKS_PER_WORKER))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            _collect(results, owners, executor.map(_parse_task_encoded, tasks, chunksize=chunksize))
+    return results
+
+
+def _collect(
+    results: list[ParseResult],
+    owners: list[int],
+    outcomes: Iterable[tuple[list[Document], Exception | None] | tuple[list[bytes], Exception | None]],
+) -> None:
+    """Attach task outcomes to their items, keeping only documents before an item's first error."""
+    for owner, (documents, error) in zip(owners, outcomes, strict=True):
+        result = results[owner]
+        if result.error is not None:
+            continue
+        result.documents.extend(binary.loads(doc) if isinstance(doc, bytes) else doc for doc in documents)
+        result.error = error
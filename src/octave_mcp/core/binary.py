@@ -0,0 +1,321 @@
+"""Compact binary encoding of OCTAVE ASTs.
+
+A Document is encoded as a fixed header, a string table, the nodes as an
+array of fixed-size records in preorder, and the values of assignments (and
+META) as a second preorder array. Every key, name and string value is stored
+once in the string table, so decoded documents share repeated strings the
+way parsed ones do.
+
+loads() reads straight from any buffer (bytes, memoryview, mmap) without
+copying it, and is much faster than parsing the text again, so encoded
+documents suit caches and sending results between processes.
+
+Layout (little-endian):
+    header      _HEADER
+    offsets     (string count + 1) x u32, start of each string in the blob,
+                in characters, so the blob is decoded in one call
+    blob        UTF-8 string data
+    nodes       node count x _NODE: kind, line, column, key, a, b, child count
+    values      value count x _VALUE: tag, payload
+"""
+
+import struct
+from collections.abc import Iterator
+from typing import Any
+
+from octave_mcp.core.ast_nodes import Assignment, ASTNode, Block, Comment, Document, InlineMap, ListValue, Section
+
+MAGIC = b"OCTB"
+# Bump when the layout changes; loads() rejects other versions
+FORMAT_VERSION = 1
+
+# magic, version, has_separator, line, column, name, top-level node count,
+# string count, blob size, node count, value count
+_HEADER = struct.Struct("<4sH?xIIIIIIII")
+_NODE = struct.Struct("<BIIIIII")
+_VALUE = struct.Struct("<Bq")
+
+# Node kinds. a and b are: Section: section_id, annotation + 1 (0 for None)
+_ASSIGNMENT = 0
+_BLOCK = 1
+_SECTION = 2
+_COMMENT = 3  # key is the comment text
+
+# Value tags and their payloads
+_NULL = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3  # The int
+_FLOAT = 4  # The float's IEEE 754 bits
+_STR = 5  # String index
+_BIG_INT = 6  # String index of the decimal digits (ints outside int64)
+_LIST = 7  # Item count; the items follow
+_INLINE_MAP = 8  # Pair count; each pair follows as a _STR key and its value
+_DICT = 9  # As _INLINE_MAP, for META
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+_FLOAT_BITS = struct.Struct("<d")
+_INT_BITS = struct.Struct("<q")
+
+
+class _Encoder:
+    """Accumulates the string table, node records and value records of one document."""
+
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.nodes: list[bytes] = []
+        self.values: list[bytes] = []
+
+    def string(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def value(self, value: Any) -> None:
+        """Append value's records in preorder (explicit stack, so nesting is unlimited)."""
+        pack = _VALUE.pack
+        stack = [value]
+        while stack:
+            value = stack.pop()
+            if value is None:
+                self.values.append(pack(_NULL, 0))
+            elif value is True or value is False:
+                self.values.append(pack(_TRUE if value else _FALSE, 0))
+            elif isinstance(value, int):
+                if _INT64_MIN <= value <= _INT64_MAX:
+                    self.values.append(pack(_INT, value))
+                else:
+                    self.values.append(pack(_BIG_INT, self.string(str(value))))
+            elif isinstance(value, float):
+                self.values.append(pack(_FLOAT, _INT_BITS.unpack(_FLOAT_BITS.pack(value))[0]))
+            elif isinstance(value, str):
+                self.values.append(pack(_STR, self.string(value)))
+            elif isinstance(value, ListValue):
+                self.values.append(pack(_LIST, len(value.items)))
+                stack.extend(reversed(value.items))
+            elif isinstance(value, InlineMap | dict):
+                pairs = value.pairs if isinstance(value, InlineMap) else value
+                self.values.append(pack(_INLINE_MAP if isinstance(value, InlineMap) else _DICT, len(pairs)))
+                for key, item in reversed(pairs.items()):
+                    stack.append(item)
+                    stack.append(str(key))
+            else:
+                raise TypeError(f"Cannot encode value of type {type(value).__name__}")
+
+    def nodes_of(self, roots: list[ASTNode]) -> None:
+        """Append the records of roots and their descendants in preorder."""
+        pack = _NODE.pack
+        stack = list(reversed(roots))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Assignment):
+                self.nodes.append(pack(_ASSIGNMENT, node.line, node.column, self.string(node.key), 0, 0, 0))
+                self.value(node.value)
+            elif isinstance(node, Block):
+                self.nodes.append(pack(_BLOCK, node.line, node.column, self.string(node.key), 0, 0, len(node.children)))
+                stack.extend(reversed(node.children))
+            elif isinstance(node, Section):
+                annotation = 0 if node.annotation is None else self.string(node.annotation) + 1
+                self.nodes.append(
+                    pack(
+                        _SECTION,
+                        node.line,
+                        node.column,
+                        self.string(node.key),
+                        self.string(node.section_id),
+                        annotation,
+                        len(node.children),
+                    )
+                )
+                stack.extend(reversed(node.children))
+            elif isinstance(node, Comment):
+                self.nodes.append(pack(_COMMENT, node.line, node.column, self.string(node.text), 0, 0, 0))
+            else:
+                raise TypeError(f"Cannot encode node of type {type(node).__name__}")
+
+
+def dumps(doc: Document) -> bytes:
+    """Encode a Document.
+
+    Args:
+        doc: Document AST
+
+    Returns:
+        Encoded document (see the module docstring for the layout)
+
+    Raises:
+        TypeError: If the document contains a node or value type the
+            parser does not produce
+    """
+    encoder = _Encoder()
+    name = encoder.string(doc.name)
+    encoder.value(doc.meta)
+    encoder.nodes_of(doc.sections)
+
+    offsets = [0]
+    for string in encoder.strings:
+        offsets.append(offsets[-1] + len(string))
+    blob = "".join(encoder.strings).encode("utf-8")
+    return b"".join(
+        [
+            _HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                doc.has_separator,
+                doc.line,
+                doc.column,
+                name,
+                len(doc.sections),
+                len(encoder.strings),
+                len(blob),
+                len(encoder.nodes),
+                len(encoder.values),
+            ),
+            struct.pack(f"<{len(offsets)}I", *offsets),
+            blob,
+            *encoder.nodes,
+            *encoder.values,
+        ]
+    )
+
+
+def loads(data: bytes | bytearray | memoryview | Any) -> Document:
+    """Decode a Document encoded by dumps().
+
+    Args:
+        data: Encoded document in any buffer (bytes, memoryview, mmap);
+            it is read in place, not copied
+
+    Returns:
+        New Document
+
+    Raises:
+        ValueError: If data is not an encoded document of this format version
+    """
+    view = memoryview(data).cast("B")
+    try:
+        return _decode(view)
+    except (struct.error, IndexError, StopIteration, UnicodeDecodeError) as e:
+        raise ValueError(f"Truncated or corrupt encoded document: {e}") from e
+    finally:
+        view.release()
+
+
+def _decode(view: memoryview) -> Document:
+    """Decode a document from a byte-format memoryview."""
+    (
+        magic,
+        version,
+        has_separator,
+        line,
+        column,
+        name,
+        top_level,
+        string_count,
+        blob_size,
+        node_count,
+        value_count,
+    ) = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not an encoded OCTAVE document")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported encoded document version {version} (expected {FORMAT_VERSION})")
+
+    position = _HEADER.size
+    offsets = struct.unpack_from(f"<{string_count + 1}I", view, position)
+    position += 4 * (string_count + 1)
+    text = str(view[position : position + blob_size], "utf-8")
+    if len(text) != offsets[-1]:
+        raise ValueError("Truncated or corrupt encoded document: string table does not match its offsets")
+    strings = [text[start:end] for start, end in zip(offsets, offsets[1:], strict=False)]
+    position += blob_size
+    nodes_end = position + node_count * _NODE.size
+    values_end = nodes_end + value_count * _VALUE.size
+    if values_end != len(view):
+        raise ValueError("Truncated or corrupt encoded document: size does not match its header")
+
+    values = _decode_values(view[nodes_end:values_end], strings)
+    doc = Document(line=line, column=column, name=strings[name], meta=next(values), has_separator=has_separator)
+
+    # Containers still being filled: (children, number of children left)
+    stack: list[list[Any]] = [[doc.sections, top_level]]
+    for kind, node_line, node_column, key, a, b, count in _NODE.iter_unpack(view[position:nodes_end]):
+        while not stack[-1][1]:
+            stack.pop()
+        parent = stack[-1]
+        parent[1] -= 1
+        node: ASTNode
+        if kind == _ASSIGNMENT:
+            node = Assignment(node_line, node_column, strings[key], next(values))
+        elif kind == _BLOCK:
+            node = Block(node_line, node_column, strings[key])
+            if count:
+                stack.append([node.children, count])
+        elif kind == _SECTION:
+            node = Section(node_line, node_column, strings[a], strings[key], strings[b - 1] if b else None)
+            if count:
+                stack.append([node.children, count])
+        elif kind == _COMMENT:
+            node = Comment(node_line, node_column, strings[key])
+        else:
+            raise ValueError(f"Truncated or corrupt encoded document: unknown node kind {kind}")
+        parent[0].append(node)
+    if any(remaining for _, remaining in stack) or next(values, values) is not values:
+        raise ValueError("Truncated or corrupt encoded document: node and value counts do not match")
+    return doc
+
+
+def _decode_values(view: memoryview, strings: list[str]) -> Iterator[Any]:
+    """Yield the decoded values of a value array, one per root value."""
+    # Lists and maps being filled: [value, its items list or pairs dict, items left, pending map key]
+    stack: list[list[Any]] = []
+    for tag, payload in _VALUE.iter_unpack(view):
+        value: Any
+        if tag == _STR:
+            value = strings[payload]
+        elif tag == _INT:
+            value = payload
+        elif tag == _NULL:
+            value = None
+        elif tag == _TRUE:
+            value = True
+        elif tag == _FALSE:
+            value = False
+        elif tag == _FLOAT:
+            value = _FLOAT_BITS.unpack(_INT_BITS.pack(payload))[0]
+        elif tag == _BIG_INT:
+            value = int(strings[payload])
+        elif tag == _LIST:
+            value = ListValue()
+            if payload:
+                stack.append([value, value.items, payload, None])
+                continue
+        elif tag == _INLINE_MAP or tag == _DICT:
+            value = InlineMap() if tag == _INLINE_MAP else {}
+            if payload:
+                # A key and a value per pair
+                stack.append([value, value.pairs if tag == _INLINE_MAP else value, 2 * payload, None])
+                continue
+        else:
+            raise ValueError(f"Truncated or corrupt encoded document: unknown value tag {tag}")
+
+        # Add value to its container, closing containers that are now full
+        while stack:
+            container = stack[-1]
+            items = container[1]
+            if isinstance(items, list):
+                items.append(value)
+            elif container[3] is None:
+                container[3] = value  # A map key; its value comes next
+            else:
+                items[container[3]] = value
+                container[3] = None
+            container[2] -= 1
+            if container[2]:
+                break
+            stack.pop()
+            value = container[0]
+        else:
+            yield value
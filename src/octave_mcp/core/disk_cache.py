@@ -0,0 +1,148 @@
+"""Persistent on-disk cache of parsed OCTAVE files.
+
+Keeps an encoded Document (see binary) per source file in a cache
+directory, so files that have not changed since they were last parsed are
+loaded instead of lexed and parsed again, across CLI runs and server
+restarts.
+
+Entry layout: _ENTRY header (magic, version, source mtime in ns, source
+size, SHA-256 of the source), then the binary encoding of the document.
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from octave_mcp.core import binary
+from octave_mcp.core.ast_nodes import Document
+from octave_mcp.core.lexer import tokenize_bytes
+from octave_mcp.core.parser import PARSER_VERSION, parse
+
+_MAGIC = b"OCTC"
+# magic, version (NUL-padded), mtime_ns, size, SHA-256 digest
+_ENTRY = struct.Struct("<4s16sqQ32s")
+
+
+def _version() -> bytes:
+    """Version recorded in entries: entries are reused only by the same parser and encoding."""
+    return f"{PARSER_VERSION}/{binary.FORMAT_VERSION}".encode()
+
+
+class DiskCache:
+    """Parse cache stored as one file per source file in a directory.
+
+    Entries are named by a hash of the source's resolved path and record the
+    parser and encoding versions, the source's mtime and size, and the
+    SHA-256 of its content. An entry is used without reading the source when version, mtime
+    and size all match; when only mtime or size differ, the source is read
+    and the entry is still used if the content hash matches. Entries from
+    another parser version, and unreadable ones, are replaced.
+
+    Entries are written to a temporary file and renamed into place, so
+    concurrent writers never leave a partial entry: readers see either entry
+    whole and the last rename wins. Entries are plain data (a fixed header
+    and the binary encoding), so reading one never runs code from it.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        """Open (and create if needed) a cache directory.
+
+        Args:
+            directory: Cache directory
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def parse_file(self, path: str | os.PathLike[str]) -> Document:
+        """Return the Document for an OCTAVE file, parsing it only if needed.
+
+        Args:
+            path: OCTAVE file (UTF-8)
+
+        Returns:
+            Document AST, owned by the caller
+
+        Raises:
+            OSError: If the file cannot be read
+            LexerError: On invalid syntax
+            ParserError: On syntax errors
+        """
+        source = Path(path).resolve()
+        # Stat before reading: a file changed in between is seen as changed next time
+        stat = source.stat()
+        entry_path = self.directory / (hashlib.sha256(os.fsencode(source)).hexdigest() + ".ast")
+        entry = self._read(entry_path)
+
+        if entry is not None and entry[1:3] == (stat.st_mtime_ns, stat.st_size):
+            cached = self._decode(entry[4])
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+        data = source.read_bytes()
+        digest = hashlib.sha256(data).digest()
+        doc = None
+        if entry is not None and entry[3] == digest:
+            payload = entry[4]
+            doc = self._decode(payload)
+        if doc is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            doc = parse(tokenize_bytes(data))
+            payload = binary.dumps(doc)
+
+        self._write(entry_path, (_version(), stat.st_mtime_ns, stat.st_size, digest, payload))
+        return doc
+
+    def clear(self) -> None:
+        """Delete all entries and reset the counters."""
+        for entry_path in self.directory.glob("*.ast"):
+            entry_path.unlink(missing_ok=True)
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def _read(entry_path: Path) -> tuple[Any, ...] | None:
+        """Load an entry of the current parser version, or None if there is none.
+
+        Returns:
+            (version, mtime_ns, size, digest, encoded document), or None
+        """
+        try:
+            data = entry_path.read_bytes()
+        except OSError:
+            return None  # Missing or unreadable: parse again and overwrite it
+        if len(data) < _ENTRY.size:
+            return None  # Truncated or foreign file
+        magic, version, mtime_ns, size, digest = _ENTRY.unpack_from(data)
+        if magic != _MAGIC or version.rstrip(b"\0") != _version():
+            return None
+        return (version, mtime_ns, size, digest, memoryview(data)[_ENTRY.size :])
+
+    @staticmethod
+    def _decode(payload: Any) -> Document | None:
+        """Decode an entry's document, or None if it is corrupt."""
+        try:
+            return binary.loads(payload)
+        except (TypeError, ValueError):
+            return None
+
+    def _write(self, entry_path: Path, entry: tuple[Any, ...]) -> None:
+        """Write an entry atomically (temp file then rename); failures only lose the entry."""
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_ENTRY.pack(_MAGIC, *entry[:4]))
+                f.write(entry[4])
+            os.replace(temp_path, entry_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
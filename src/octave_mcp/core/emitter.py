@@ -10,13 +10,33 @@ Emits strict canonical OCTAVE from AST with:
 - 2-space indentation
 """
 
+import functools
+import io
+import itertools
 import re
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, TextIO
 
-from octave_mcp.core.ast_nodes import Assignment, Block, Document, InlineMap, ListValue, Section
+from octave_mcp.core.ast_nodes import Assignment, ASTNode, Block, Document, InlineMap, ListValue, Section
 
 IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
 
+# Lines joined into each write by emit_to()
+_WRITE_BATCH = 1024
+
+# With reuse, blocks and sections indented less than this many levels keep
+# their emitted text (Block._text, Section._text) if it is at most this many
+# characters, so each level keeps at most about one copy of the document's text
+_CACHED_LEVELS = 2
+_CACHED_TEXT_SIZE = 256 * 1024
+
+# Memoized emitted forms of strings up to this length, at most this many
+_CACHED_STRING_LENGTH = 256
+_STRING_CACHE_SIZE = 4096
+
+# Escapes of quoted strings, applied in one pass
+_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\t": "\\t"})
+
 
 def needs_quotes(value: Any) -> bool:
     """Check if a string value needs quotes."""
@@ -45,29 +65,57 @@ def needs_quotes(value: Any) -> bool:
 
 def emit_value(value: Any) -> str:
     """Emit a value in canonical form."""
-    if value is None:
-        return "null"
-    elif isinstance(value, bool):
-        return "true" if value else "false"
-    elif isinstance(value, int | float):
-        return str(value)
-    elif isinstance(value, str):
-        if needs_quotes(value):
-            # Escape special characters
-            escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\t", "\\t")
-            return f'"{escaped}"'
-        return value
-    elif isinstance(value, ListValue):
-        if not value.items:
-            return "[]"
-        items = [emit_value(item) for item in value.items]
-        return f"[{','.join(items)}]"
-    elif isinstance(value, InlineMap):
-        pairs = [f"{k}::{emit_value(v)}" for k, v in value.pairs.items()]
-        return f"[{','.join(pairs)}]"
-    else:
-        # Fallback for unknown types
-        return str(value)
+    emitter = _VALUE_EMITTERS.get(type(value))
+    if emitter is not None:
+        return emitter(value)
+    # Subclasses of the value types, then unknown types
+    for value_type, emitter in _VALUE_EMITTERS.items():
+        if isinstance(value, value_type):
+            return emitter(value)
+    return str(value)
+
+
+def _emit_string(value: str) -> str:
+    """Emit a string, quoted and escaped if needed; short strings are memoized."""
+    if len(value) > _CACHED_STRING_LENGTH:
+        return _quote_string(value)
+    return _emit_short_string(value)
+
+
+def _quote_string(value: str) -> str:
+    """Quote and escape a string if it needs quotes."""
+    if needs_quotes(value):
+        # Escape special characters
+        return f'"{value.translate(_ESCAPES)}"'
+    return value
+
+
+# Documents repeat the same enum-like values many times
+_emit_short_string = functools.lru_cache(maxsize=_STRING_CACHE_SIZE)(_quote_string)
+
+
+def _emit_list(value: ListValue) -> str:
+    """Emit a list [a,b,c]."""
+    if not value.items:
+        return "[]"
+    return f"[{','.join(map(emit_value, value.items))}]"
+
+
+def _emit_inline_map(value: InlineMap) -> str:
+    """Emit an inline map [k::v,k2::v2]."""
+    return f"[{','.join(f'{k}::{emit_value(v)}' for k, v in value.pairs.items())}]"
+
+
+# Emitter per value type, looked up by exact type; bool precedes int for subclass lookups
+_VALUE_EMITTERS: dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: "null",
+    bool: lambda value: "true" if value else "false",
+    int: str,
+    float: str,
+    str: _emit_string,
+    ListValue: _emit_list,
+    InlineMap: _emit_inline_map,
+}
 
 
 def emit_assignment(assignment: Assignment, indent: int = 0) -> str:
@@ -79,19 +127,7 @@ def emit_assignment(assignment: Assignment, indent: int = 0) -> str:
 
 def emit_block(block: Block, indent: int = 0) -> str:
     """Emit a block in canonical form."""
-    indent_str = "  " * indent
-    lines = [f"{indent_str}{block.key}:"]
-
-    # Emit children
-    for child in block.children:
-        if isinstance(child, Assignment):
-            lines.append(emit_assignment(child, indent + 1))
-        elif isinstance(child, Block):
-            lines.append(emit_block(child, indent + 1))
-        elif isinstance(child, Section):
-            lines.append(emit_section(child, indent + 1))
-
-    return "\n".join(lines)
+    return "\n".join(_iter_lines([block], indent))
 
 
 def emit_section(section: Section, indent: int = 0) -> str:
@@ -100,22 +136,115 @@ def emit_section(section: Section, indent: int = 0) -> str:
     Supports both plain numbers ("1", "2") and suffix forms ("2b", "2c").
     Includes optional bracket annotation if present.
     """
-    indent_str = "  " * indent
-    section_line = f"{indent_str}§{section.section_id}::{section.key}"
-    if section.annotation:
-        section_line += f"[{section.annotation}]"
-    lines = [section_line]
-
-    # Emit children
-    for child in section.children:
-        if isinstance(child, Assignment):
-            lines.append(emit_assignment(child, indent + 1))
-        elif isinstance(child, Block):
-            lines.append(emit_block(child, indent + 1))
-        elif isinstance(child, Section):
-            lines.append(emit_section(child, indent + 1))
+    return "\n".join(_iter_lines([section], indent))
 
-    return "\n".join(lines)
+
+def _iter_lines(nodes: Iterable[ASTNode], indent: int, reuse: bool = False) -> Iterator[str]:
+    """Yield the canonical lines of nodes and their descendants in order.
+
+    Walks the tree with an explicit stack, so depth is unlimited and each
+    line is built once, however deeply it is nested. Only assignments,
+    blocks and § sections are emitted. With reuse, blocks and sections
+    indented less than _CACHED_LEVELS go through _cached_lines(), so their
+    text may come as one multi-line item.
+    """
+    indents = ["  " * indent]
+    stack: list[Iterator[ASTNode]] = [iter(nodes)]
+    while stack:
+        depth = len(stack) - 1
+        for node in stack[-1]:
+            if isinstance(node, Assignment):
+                yield f"{indents[depth]}{node.key}::{emit_value(node.value)}"
+            elif isinstance(node, Block | Section):
+                if reuse and indent + depth < _CACHED_LEVELS:
+                    yield from _cached_lines(node, indent + depth)
+                    continue
+                yield indents[depth] + _container_header(node)
+                if len(indents) == depth + 1:
+                    indents.append(indents[depth] + "  ")
+                stack.append(iter(node.children))
+                break
+        else:
+            stack.pop()
+
+
+def _cached_lines(node: Block | Section, indent: int) -> Iterator[str]:
+    """Yield the canonical text of a block or section, from its cache if it has one.
+
+    Text up to _CACHED_TEXT_SIZE characters is kept on the node with its
+    indent as it is emitted, so unchanged subtrees (shared by with_values()
+    copies) are spliced in when a document is emitted again. Copies and
+    Document.invalidate_caches() start the node over.
+    """
+    cached = node._text
+    if cached is not None and cached[0] == indent:
+        yield cached[1]
+        return
+
+    lines = itertools.chain(["  " * indent + _container_header(node)], _iter_lines(node.children, indent + 1, True))
+    captured = []
+    size = 0
+    for line in lines:
+        captured.append(line)
+        size += len(line) + 1
+        if size > _CACHED_TEXT_SIZE:
+            # Too large to keep (its children may still be kept): stream the rest
+            yield from captured
+            yield from lines
+            return
+    text = "\n".join(captured)
+    node._text = (indent, text)
+    yield text
+
+
+def _container_header(node: Block | Section) -> str:
+    """Return the unindented first line of a block or section."""
+    if isinstance(node, Block):
+        return f"{node.key}:"
+    annotation = f"[{node.annotation}]" if node.annotation else ""
+    return f"§{node.section_id}::{node.key}{annotation}"
+
+
+def export_text_cache(doc: Document) -> list[tuple[int, str] | None]:
+    """Return the emitted text cached on a document's top-level blocks and sections.
+
+    Args:
+        doc: Document AST, usually just emitted with reuse
+
+    Returns:
+        Cached text of each block and section the emitter caches, in
+        document order, for restore_text_cache()
+    """
+    return [node._text for node in _cacheable_nodes(doc)]
+
+
+def restore_text_cache(doc: Document, texts: list[tuple[int, str] | None]) -> None:
+    """Attach text exported by export_text_cache() from an identical document.
+
+    Lets copies of a document (such as ones decoded from binary) be emitted
+    again without rendering what the original already rendered.
+
+    Args:
+        doc: Document AST with the same tree as the exported one
+        texts: Result of export_text_cache()
+    """
+    for node, text in zip(_cacheable_nodes(doc), texts, strict=False):
+        node._text = text
+
+
+def _cacheable_nodes(doc: Document) -> Iterator[Block | Section]:
+    """Yield the blocks and sections indented less than _CACHED_LEVELS, in document order."""
+    stack: list[tuple[Iterator[ASTNode], int]] = [(iter(doc.sections), 0)]
+    while stack:
+        children, level = stack[-1]
+        for node in children:
+            if isinstance(node, Block | Section):
+                yield node
+                if level + 1 < _CACHED_LEVELS:
+                    stack.append((iter(node.children), level + 1))
+                    break
+        else:
+            stack.pop()
 
 
 def emit_meta(meta: dict[str, Any]) -> str:
@@ -131,39 +260,57 @@ def emit_meta(meta: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def emit(doc: Document) -> str:
+def emit(doc: Document, reuse: bool = False) -> str:
     """Emit canonical OCTAVE from AST.
 
     Args:
         doc: Document AST
+        reuse: Reuse and keep emitted subtree text on the nodes (see emit_to())
 
     Returns:
         Canonical OCTAVE text with explicit envelope,
         unicode operators, and deterministic formatting
     """
-    lines = []
+    output = io.StringIO()
+    emit_to(doc, output, reuse)
+    return output.getvalue()
+
+
+def emit_to(doc: Document, sink: TextIO, reuse: bool = False) -> None:
+    """Write canonical OCTAVE for doc to a text sink.
+
+    Produces exactly the text emit() returns, in one pass over the tree,
+    writing lines in batches so only a batch is held in memory besides the
+    sink's own buffer.
 
+    With reuse, the text of top-level blocks and sections and their children
+    is kept on the nodes (see _cached_lines), and subtrees emitted that way
+    before are copied from it rather than rendered again. Copies made by
+    with_values() start without it, so this suits documents that are
+    emitted, updated with with_values() and emitted again. Nodes changed in
+    place keep stale text: call Document.invalidate_caches() before emitting
+    again with reuse.
+
+    Args:
+        doc: Document AST
+        sink: Text stream to write to (file, io.StringIO, socket.makefile("w"), ...)
+        reuse: Reuse and keep emitted subtree text on the nodes
+    """
     # Always emit explicit envelope
-    lines.append(f"==={doc.name}===")
+    header = [f"==={doc.name}==="]
 
     # Emit META if present
     if doc.meta:
-        lines.append(emit_meta(doc.meta))
+        header.append(emit_meta(doc.meta))
 
     # Emit separator if present
     if doc.has_separator:
-        lines.append("---")
-
-    # Emit sections
-    for section in doc.sections:
-        if isinstance(section, Assignment):
-            lines.append(emit_assignment(section, 0))
-        elif isinstance(section, Block):
-            lines.append(emit_block(section, 0))
-        elif isinstance(section, Section):
-            lines.append(emit_section(section, 0))
+        header.append("---")
 
     # Always emit END envelope
-    lines.append("===END===")
+    lines = itertools.chain(header, _iter_lines(doc.sections, 0, reuse), ["===END==="])
 
-    return "\n".join(lines)
+    separator = ""
+    while batch := list(itertools.islice(lines, _WRITE_BATCH)):
+        sink.write(separator + "\n".join(batch))
+        separator = "\n"
@@ -0,0 +1,90 @@
+"""Structure events for streaming OCTAVE consumers.
+
+Produced by parser.iter_events() in document order, as a SAX-style
+alternative to building a Document AST. Containers are bracketed by
+Start*/End* pairs, so consumers track nesting themselves:
+
+    StartDocument
+      Meta                      (only if a META block is present)
+      Assignment
+      StartBlock
+        Assignment
+        StartSection ... EndSection
+      EndBlock
+    EndDocument
+
+Positions match the AST nodes parse() would build for the same input.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class StartDocument:
+    """Start of the document, after its envelope, META block and separator."""
+
+    name: str = "INFERRED"
+    has_separator: bool = False
+
+
+@dataclass(frozen=True)
+class Meta:
+    """META block fields."""
+
+    fields: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class Assignment:
+    """KEY::value assignment."""
+
+    key: str
+    value: Any
+    line: int = 0
+    column: int = 0
+
+
+@dataclass(frozen=True)
+class StartBlock:
+    """KEY: block opening; line and column are those of the key."""
+
+    key: str
+    line: int = 0
+    column: int = 0
+
+
+@dataclass(frozen=True)
+class EndBlock:
+    """End of a block; line and column are those of the corresponding Block node."""
+
+    key: str
+    line: int = 0
+    column: int = 0
+
+
+@dataclass(frozen=True)
+class StartSection:
+    """§NUMBER::NAME section opening."""
+
+    section_id: str
+    key: str
+    annotation: str | None = None
+    line: int = 0
+    column: int = 0
+
+
+@dataclass(frozen=True)
+class EndSection:
+    """End of a § section."""
+
+    section_id: str
+    key: str
+
+
+@dataclass(frozen=True)
+class EndDocument:
+    """End of the document."""
+
+
+Event = StartDocument | Meta | Assignment | StartBlock | EndBlock | StartSection | EndSection | EndDocument
@@ -0,0 +1,505 @@
+"""Streaming export of OCTAVE documents to JSON, YAML and Markdown.
+
+Writers walk a Document, or the events of parser.iter_events(), once and
+write text to a sink as they go, so an export holds little more than its
+output in memory (plus the AST, when exporting one) instead of a nested
+dict copy of the document and the text serialized from it.
+
+Documents map to nested mappings (see to_dict()): assignments to members,
+blocks and § sections to nested mappings, and META to a "META" mapping
+first. Sections are keyed by their header ("§1::OVERVIEW",
+"§2b::NAME[annotation]"). Members are written in document order; a key
+used twice in one container is written twice, which JSON and YAML parsers
+read as the last value.
+"""
+
+import functools
+import json
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from json.encoder import encode_basestring
+from typing import Any, TextIO
+
+import yaml
+
+from octave_mcp.core import events
+from octave_mcp.core.ast_nodes import Assignment, ASTNode, Block, Document, InlineMap, ListValue, Section
+from octave_mcp.core.emitter import emit_value
+
+# Text parts joined into each chunk written to the sink
+_WRITE_BATCH = 1024
+
+# JSON text of scalar values, by exact type
+_VALUE_ENCODERS: dict[type, Callable[[Any], str]] = {
+    str: encode_basestring,
+    int: int.__repr__,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+}
+
+# libyaml's dumper when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Strings YAML reads back unchanged as plain scalars: words of letters, digits
+# and _./- separated by single spaces, except those YAML 1.1 resolves to
+# booleans or null. Anything else, OCTAVE operators included, is quoted.
+_YAML_PLAIN = re.compile(r"[A-Za-z_][A-Za-z0-9_./-]*(?: [A-Za-z0-9_./-]+)*")
+_YAML_RESERVED = frozenset(("y", "n", "yes", "no", "true", "false", "on", "off", "null"))
+
+# Memoized quoted forms of scalars up to this length, at most this many
+_CACHED_SCALAR_LENGTH = 256
+_SCALAR_CACHE_SIZE = 4096
+
+
+def to_dict(source: Document | Iterable[events.Event]) -> dict[str, Any]:
+    """Convert a document to nested dicts and lists.
+
+    Args:
+        source: Document AST, or its events from parser.iter_events()
+
+    Returns:
+        Dict form of the document; a repeated key keeps its first position
+        and its last value
+
+    Raises:
+        LexerError, ParserError: From an event stream, when reached
+    """
+    builder = _DictBuilder()
+    for _ in _members(builder, source):
+        pass
+    return builder.result
+
+
+def to_json(source: Document | Iterable[events.Event], compact: bool = False) -> str:
+    """Export a document as JSON text.
+
+    Args:
+        source: Document AST, or its events from parser.iter_events()
+        compact: Omit all optional whitespace instead of indenting by 2
+
+    Returns:
+        JSON text; json.loads() of it equals to_dict() of the document, and
+        unless a key is repeated it is what json.dumps(..., indent=2) writes
+
+    Raises:
+        LexerError, ParserError: From an event stream, when reached
+    """
+    return "".join(_chunks(_JsonWriter(compact), source))
+
+
+def write_json(source: Document | Iterable[events.Event], sink: TextIO, compact: bool = False) -> None:
+    """Write a document as JSON text to a text sink.
+
+    Args:
+        source: Document AST, or its events from parser.iter_events()
+        sink: Text stream to write to
+        compact: Omit all optional whitespace instead of indenting by 2
+
+    Raises:
+        LexerError, ParserError: From an event stream, when reached
+    """
+    for chunk in _chunks(_JsonWriter(compact), source):
+        sink.write(chunk)
+
+
+def to_yaml(source: Document | Iterable[events.Event]) -> str:
+    """Export a document as block-style YAML.
+
+    Args:
+        source: Document AST, or its events from parser.iter_events()
+
+    Returns:
+        YAML text; yaml.safe_load() of it equals to_dict() of the document
+
+    Raises:
+        LexerError, ParserError: From an event stream, when reached
+    """
+    return "".join(_chunks(_YamlWriter(), source))
+
+
+def write_yaml(source: Document | Iterable[events.Event], sink: TextIO) -> None:
+    """Write a document as block-style YAML to a text sink.
+
+    Args:
+        source: Document AST, or its events from parser.iter_events()
+        sink: Text stream to write to
+
+    Raises:
+        LexerError, ParserError: From an event stream, when reached
+    """
+    for chunk in _chunks(_YamlWriter(), source):
+        sink.write(chunk)
+
+
+def to_markdown(source: Document | Iterable[events.Event]) -> str:
+    """Export a document as Markdown.
+
+    The document name is the title and META a list under a "META" heading.
+    Top-level assignments are bold paragraphs; blocks and sections are
+    headings one level below their container, with their assignments as
+    list items. Strings are written as they are, other values in canonical
+    form.
+
+    Args:
+        source: Document AST, or its events from parser.iter_events()
+
+    Returns:
+        Markdown text
+
+    Raises:
+        LexerError, ParserError: From an event stream, when reached
+    """
+    return "".join(_chunks(_MarkdownWriter(), source))
+
+
+def write_markdown(source: Document | Iterable[events.Event], sink: TextIO) -> None:
+    """Write a document as Markdown (see to_markdown()) to a text sink.
+
+    Args:
+        source: Document AST, or its events from parser.iter_events()
+        sink: Text stream to write to
+
+    Raises:
+        LexerError, ParserError: From an event stream, when reached
+    """
+    for chunk in _chunks(_MarkdownWriter(), source):
+        sink.write(chunk)
+
+
+def section_key(section: Section | events.StartSection) -> str:
+    """Return the name a § section is exported under: its header as emitted."""
+    annotation = f"[{section.annotation}]" if section.annotation else ""
+    return f"§{section.section_id}::{section.key}{annotation}"
+
+
+def _chunks(writer: "_Writer", source: Document | Iterable[events.Event]) -> Iterator[str]:
+    """Yield a document's text from writer in chunks of about _WRITE_BATCH parts."""
+    parts = writer.parts
+    for _ in _members(writer, source):
+        yield "".join(parts)
+        parts.clear()
+    writer.finish()
+    yield "".join(parts)
+
+
+def _members(writer: "_Writer", source: Document | Iterable[events.Event]) -> Iterator[None]:
+    """Add a document's structure to writer, yielding once it holds _WRITE_BATCH parts.
+
+    Yields only after an assignment, when every container opened since the
+    last yield has a member, so the caller may take the pending parts.
+    """
+    if not isinstance(source, Document):
+        yield from _event_members(writer, source)
+        return
+
+    parts = writer.parts
+    member = writer.member
+    writer.start(source.name)
+    writer.meta(source.meta)
+    stack = [iter(source.sections)]
+    while stack:
+        node: ASTNode
+        for node in stack[-1]:
+            if isinstance(node, Assignment):
+                member(node.key, node.value)
+                if len(parts) >= _WRITE_BATCH:
+                    yield
+            elif isinstance(node, Block | Section):
+                writer.open(node.key if isinstance(node, Block) else section_key(node))
+                stack.append(iter(node.children))
+                break
+        else:
+            stack.pop()
+            if stack:
+                writer.close()
+
+
+def _event_members(writer: "_Writer", stream: Iterable[events.Event]) -> Iterator[None]:
+    """Add the structure of a document given as parser events to writer, as _members() does."""
+    parts = writer.parts
+    for event in stream:
+        if isinstance(event, events.Assignment):
+            writer.member(event.key, event.value)
+            if len(parts) >= _WRITE_BATCH:
+                yield
+        elif isinstance(event, events.StartBlock):
+            writer.open(event.key)
+        elif isinstance(event, events.StartSection):
+            writer.open(section_key(event))
+        elif isinstance(event, events.EndBlock | events.EndSection):
+            writer.close()
+        elif isinstance(event, events.StartDocument):
+            writer.start(event.name)
+        elif isinstance(event, events.Meta):
+            writer.meta(event.fields)
+
+
+class _Writer(ABC):
+    """Output format: turns a document's structure into text parts."""
+
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+
+    def start(self, name: str) -> None:  # noqa: B027 - optional hook, only Markdown writes a title
+        """Begin the document."""
+
+    def meta(self, fields: dict[str, Any]) -> None:
+        """Add the META block's fields, before any other member."""
+        if fields:
+            self.member("META", fields)
+
+    @abstractmethod
+    def member(self, key: str, value: Any) -> None:
+        """Add an assignment to the innermost open container."""
+
+    @abstractmethod
+    def open(self, key: str) -> None:
+        """Open a block or section in the innermost open container."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the innermost open block or section."""
+
+    def finish(self) -> None:  # noqa: B027 - optional hook for formats with a closing
+        """End the document, after every block and section was closed."""
+
+
+class _DictBuilder(_Writer):
+    """Builds the dict form of a document instead of text."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.result: dict[str, Any] = {}
+        self.stack = [self.result]
+
+    def member(self, key: str, value: Any) -> None:
+        self.stack[-1][key] = _native(value)
+
+    def open(self, key: str) -> None:
+        block: dict[str, Any] = {}
+        self.stack[-1][key] = block
+        self.stack.append(block)
+
+    def close(self) -> None:
+        self.stack.pop()
+
+
+class _JsonWriter(_Writer):
+    """Writes nested JSON objects member by member, formatted as json.dumps() does."""
+
+    def __init__(self, compact: bool):
+        super().__init__()
+        self.compact = compact
+        self.counts: list[int] = []  # Members added so far to each open object
+        self.colon = ":" if compact else ": "
+        # Text before the first and the later members of an object, and closing it, by depth
+        self.firsts = [""]
+        self.nexts = [","]
+        self.ends = ["}"]
+        self.parts.append("{")
+        self._push()
+
+    def _push(self) -> None:
+        """Start counting the members of a new innermost object."""
+        self.counts.append(0)
+        if len(self.firsts) == len(self.counts):
+            indent = "" if self.compact else "\n" + "  " * len(self.counts)
+            self.firsts.append(indent)
+            self.nexts.append("," + indent)
+            self.ends.append(("" if self.compact else "\n" + "  " * (len(self.counts) - 1)) + "}")
+
+    def _prefix(self) -> str:
+        """Count a member of the innermost open object and return the text before its key."""
+        counts = self.counts
+        count = counts[-1]
+        counts[-1] = count + 1
+        return self.nexts[len(counts)] if count else self.firsts[len(counts)]
+
+    def member(self, key: str, value: Any) -> None:
+        encode = _VALUE_ENCODERS.get(type(value))
+        text = encode(value) if encode is not None else _json_value(value, len(self.counts), self.compact)
+        self.parts.append(f"{self._prefix()}{encode_basestring(key)}{self.colon}{text}")
+
+    def open(self, key: str) -> None:
+        self.parts.append(f"{self._prefix()}{encode_basestring(key)}{self.colon}{{")
+        self._push()
+
+    def close(self) -> None:
+        depth = len(self.counts)
+        self.parts.append(self.ends[depth] if self.counts.pop() else "}")
+
+    def finish(self) -> None:
+        self.close()
+
+
+class _YamlWriter(_Writer):
+    """Writes block-style YAML mappings member by member, laid out as yaml.dump() does."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.counts = [0]  # Members added so far to each open mapping
+        self.indents = [""]
+
+    def _indent(self) -> str:
+        """Count a member of the innermost open mapping and return its indent."""
+        counts = self.counts
+        counts[-1] += 1
+        return self.indents[len(counts) - 1]
+
+    def member(self, key: str, value: Any) -> None:
+        self.parts.append(_yaml_entry(_yaml_scalar(key), value, self._indent()))
+
+    def open(self, key: str) -> None:
+        self.parts.append(f"{self._indent()}{_yaml_scalar(key)}:\n")
+        self.counts.append(0)
+        if len(self.indents) < len(self.counts):
+            self.indents.append(self.indents[-1] + "  ")
+
+    def close(self) -> None:
+        if not self.counts.pop():
+            self.parts[-1] = self.parts[-1][:-1] + " {}\n"  # Still the opening line (see _members)
+
+    def finish(self) -> None:
+        if not self.counts[0]:
+            self.parts.append("{}\n")
+
+
+class _MarkdownWriter(_Writer):
+    """Writes a document as Markdown headings, paragraphs and lists."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.depth = 0  # Open blocks and sections
+        self.headings = ["##"]
+
+    def start(self, name: str) -> None:
+        self.parts.append(f"# {name}\n")
+
+    def meta(self, fields: dict[str, Any]) -> None:
+        if fields:
+            self.parts.append("\n## META\n")
+            self.parts.extend(f"\n- **{key}**: {_markdown_value(value)}" for key, value in fields.items())
+            self.parts.append("\n")
+
+    def member(self, key: str, value: Any) -> None:
+        text = value if type(value) is str else _markdown_value(value)
+        if self.depth:
+            self.parts.append(f"\n- **{key}**: {text}")
+        else:
+            self.parts.append(f"\n**{key}**: {text}\n")
+
+    def open(self, key: str) -> None:
+        self.parts.append(f"\n{self.headings[self.depth]} {key}\n")
+        self.depth += 1
+        if len(self.headings) == self.depth:
+            self.headings.append(self.headings[-1] + "#")
+
+    def close(self) -> None:
+        self.depth -= 1
+
+
+def _native(value: Any) -> Any:
+    """Convert an OCTAVE value to plain lists and dicts."""
+    if isinstance(value, ListValue | list):
+        return [_native(item) for item in (value.items if isinstance(value, ListValue) else value)]
+    if isinstance(value, InlineMap | dict):
+        return {k: _native(v) for k, v in (value.pairs if isinstance(value, InlineMap) else value).items()}
+    return value
+
+
+def _json_value(value: Any, depth: int, compact: bool) -> str:
+    """Return the JSON text of any OCTAVE value nested depth levels deep."""
+    encode = _VALUE_ENCODERS.get(type(value))
+    if encode is not None:
+        return encode(value)
+    if isinstance(value, ListValue | list):
+        items = [
+            _json_value(item, depth + 1, compact) for item in (value.items if isinstance(value, ListValue) else value)
+        ]
+        opening, closing = "[", "]"
+    elif isinstance(value, InlineMap | dict):
+        colon = ":" if compact else ": "
+        pairs = value.pairs if isinstance(value, InlineMap) else value
+        items = [f"{encode_basestring(str(k))}{colon}{_json_value(v, depth + 1, compact)}" for k, v in pairs.items()]
+        opening, closing = "{", "}"
+    else:
+        # Floats (including NaN and Infinity) and subclasses of str and int; other types raise TypeError
+        return json.dumps(value, ensure_ascii=False)
+    if not items:
+        return opening + closing
+    if compact:
+        return f"{opening}{','.join(items)}{closing}"
+    indent = "\n" + "  " * (depth + 1)
+    return f"{opening}{indent}{(',' + indent).join(items)}\n{'  ' * depth}{closing}"
+
+
+def _yaml_entry(key: str, value: Any, indent: str) -> str:
+    """Return the YAML lines of a mapping entry at indent; key is already a YAML scalar."""
+    if isinstance(value, ListValue | list):
+        items = value.items if isinstance(value, ListValue) else value
+        # Sequences in mappings are not indented, as yaml.dump() writes them
+        return f"{indent}{key}:\n{_yaml_sequence(items, indent)}" if items else f"{indent}{key}: []\n"
+    if isinstance(value, InlineMap | dict):
+        pairs = value.pairs if isinstance(value, InlineMap) else value
+        if not pairs:
+            return f"{indent}{key}: {{}}\n"
+        nested = indent + "  "
+        return f"{indent}{key}:\n" + "".join(_yaml_entry(_yaml_scalar(str(k)), v, nested) for k, v in pairs.items())
+    return f"{indent}{key}: {_yaml_scalar(value)}\n"
+
+
+def _yaml_sequence(items: list[Any], indent: str) -> str:
+    """Return the YAML lines of a non-empty sequence's items at indent."""
+    lines = []
+    nested = indent + "  "
+    for item in items:
+        if isinstance(item, ListValue | list):
+            values = item.items if isinstance(item, ListValue) else item
+            if not values:
+                lines.append(f"{indent}- []\n")
+                continue
+            text = _yaml_sequence(values, nested)
+        elif isinstance(item, InlineMap | dict):
+            pairs = item.pairs if isinstance(item, InlineMap) else item
+            if not pairs:
+                lines.append(f"{indent}- {{}}\n")
+                continue
+            text = "".join(_yaml_entry(_yaml_scalar(str(k)), v, nested) for k, v in pairs.items())
+        else:
+            lines.append(f"{indent}- {_yaml_scalar(item)}\n")
+            continue
+        lines.append(f"{indent}- {text[len(nested):]}")  # The item's first line follows the dash
+    return "".join(lines)
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Return the YAML text of a scalar: plain when that reads back unchanged, else quoted."""
+    if type(value) is str:
+        if _YAML_PLAIN.fullmatch(value) and value.lower() not in _YAML_RESERVED:
+            return value
+        if len(value) > _CACHED_SCALAR_LENGTH:
+            return _dump_yaml_scalar(value)
+        return _dump_short_yaml_scalar(value)
+    if value is None:
+        return "null"
+    if value is True or value is False:
+        return "true" if value else "false"
+    if type(value) is int:
+        return int.__repr__(value)
+    return _dump_short_yaml_scalar(value)
+
+
+def _dump_yaml_scalar(value: Any) -> str:
+    """Have the YAML dumper write a scalar: strings double-quoted on one line, other types its own way."""
+    style = '"' if isinstance(value, str) else None
+    # Dumped as a one-item sequence, "- " + scalar + "\n", which needs no document end marker
+    return str(yaml.dump([value], Dumper=_YAML_DUMPER, allow_unicode=True, default_style=style, width=2**30))[2:-1]
+
+
+_dump_short_yaml_scalar = functools.lru_cache(maxsize=_SCALAR_CACHE_SIZE, typed=True)(_dump_yaml_scalar)
+
+
+def _markdown_value(value: Any) -> str:
+    """Return a value as Markdown text: strings as they are, other values in canonical form."""
+    return value if isinstance(value, str) else emit_value(value)
@@ -6,11 +6,18 @@ Token types and normalization logic for OCTAVE syntax.
 Handles ASCII aliases (→/->, ⊕/+, etc.) with deterministic normalization.
 """
 
+import codecs
+import mmap
+import os
 import re
 import unicodedata
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any
+from typing import Any, TextIO, overload
 
 
 class TokenType(Enum):
@@ -54,15 +61,79 @@ class TokenType(Enum):
     EOF = auto()  # end of input
 
 
+_NEWLINE = re.compile("\n")
+
+
+def _offset_array(limit: int) -> "array[int]":
+    """Create an empty unsigned array wide enough to hold offsets up to limit."""
+    return array("I" if limit < 2**32 else "Q")
+
+
+class LineIndex:
+    """Newline-offset index resolving source offsets to line and column.
+
+    Built once per lexed text and shared by every token, repair record and
+    error produced from it, so positions cost nothing while lexing and a
+    bisect when asked for.
+
+    An index may cover a slice of a larger document (as when streaming), in
+    which case start_offset, start_line and start_column give the document
+    position of the first character of text.
+    """
+
+    __slots__ = ("start_offset", "start_line", "start_column", "newlines")
+
+    def __init__(self, text: str, start_offset: int = 0, start_line: int = 1, start_column: int = 1):
+        """Index the newlines of text.
+
+        Args:
+            text: Source text (only newline offsets are kept)
+            start_offset: Document offset of text[0]
+            start_line: Line of text[0] (1-based)
+            start_column: Column of text[0] (1-based)
+        """
+        self.start_offset = start_offset
+        self.start_line = start_line
+        self.start_column = start_column
+        self.newlines = _offset_array(len(text))
+        self.newlines.extend(match.start() for match in _NEWLINE.finditer(text))
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """Resolve a document offset to (line, column), both 1-based."""
+        local = offset - self.start_offset
+        before = bisect_left(self.newlines, local)
+        if before == 0:
+            return self.start_line, self.start_column + local
+        return self.start_line + before, local - self.newlines[before - 1]
+
+
 @dataclass
 class Token:
-    """OCTAVE token with position and normalization info."""
+    """OCTAVE token with source offset and normalization info.
+
+    Line and column are resolved on demand from the LineIndex shared by all
+    tokens of a document.
+    """
 
     type: TokenType
     value: Any
-    line: int
-    column: int
+    offset: int
     normalized_from: str | None = None  # Original ASCII alias if normalized
+    line_index: LineIndex | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def line(self) -> int:
+        """Line of the token's first character (1-based)."""
+        if self.line_index is None:
+            return 1
+        return self.line_index.position(self.offset)[0]
+
+    @property
+    def column(self) -> int:
+        """Column of the token's first character (1-based)."""
+        if self.line_index is None:
+            return self.offset + 1
+        return self.line_index.position(self.offset)[1]
 
 
 class LexerError(Exception):
@@ -75,6 +146,10 @@ class LexerError(Exception):
         self.error_code = error_code
         super().__init__(f"{error_code} at line {line}, column {column}: {message}")
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild from the constructor arguments, e.g. when returned from a worker process
+        return type(self), (self.message, self.line, self.column, self.error_code)
+
 
 # ASCII to Unicode normalization table
 ASCII_ALIASES = {
@@ -137,162 +212,990 @@ TOKEN_PATTERNS = [
 ]
 
 
-def tokenize(content: str) -> tuple[list[Token], list[Any]]:
-    """Tokenize OCTAVE content with ASCII alias normalization.
+# Token types whose pattern matches a single fixed spelling
+_FIXED_TEXT_TYPES = frozenset(
+    {
+        TokenType.ENVELOPE_END,
+        TokenType.SEPARATOR,
+        TokenType.ASSIGN,
+        TokenType.BLOCK,
+        TokenType.FLOW,
+        TokenType.SYNTHESIS,
+        TokenType.CONCAT,
+        TokenType.AT,
+        TokenType.TENSION,
+        TokenType.ALTERNATIVE,
+        TokenType.CONSTRAINT,
+        TokenType.SECTION,
+        TokenType.LIST_START,
+        TokenType.LIST_END,
+        TokenType.COMMA,
+        TokenType.BOOLEAN,
+        TokenType.NULL,
+        TokenType.NEWLINE,
+    }
+)
+
+# Value extraction kinds, looked up by token type code when a token is materialized
+_KIND_FIXED = 0
+_KIND_IDENTIFIER = 1
+_KIND_STRING = 2
+_KIND_NUMBER = 3
+_KIND_COMMENT = 4
+_KIND_ENVELOPE_START = 5
+_KIND_INDENT = 6
+_KIND_EOF = 7
+
+_TOKEN_TYPES: dict[int, TokenType] = {token_type.value: token_type for token_type in TokenType}
+
+_VALUE_KINDS: dict[int, int] = {
+    **{token_type.value: _KIND_FIXED for token_type in _FIXED_TEXT_TYPES},
+    TokenType.IDENTIFIER.value: _KIND_IDENTIFIER,
+    TokenType.STRING.value: _KIND_STRING,
+    TokenType.NUMBER.value: _KIND_NUMBER,
+    TokenType.COMMENT.value: _KIND_COMMENT,
+    TokenType.ENVELOPE_START.value: _KIND_ENVELOPE_START,
+    TokenType.INDENT.value: _KIND_INDENT,
+    TokenType.EOF.value: _KIND_EOF,
+}
+
+# Token types that can be spelled with an ASCII alias (identifiers only as "vs")
+_ALIAS_TYPE_CODES = frozenset(
+    token_type.value
+    for token_type in (
+        TokenType.FLOW,
+        TokenType.SYNTHESIS,
+        TokenType.CONCAT,
+        TokenType.TENSION,
+        TokenType.ALTERNATIVE,
+        TokenType.CONSTRAINT,
+        TokenType.SECTION,
+        TokenType.IDENTIFIER,
+    )
+)
+
+
+def _fixed_token_value(token_type: TokenType, text: str) -> tuple[Any, str | None]:
+    """Compute (value, normalized_from) for a fixed-spelling token."""
+    if text in ASCII_ALIASES:
+        return ASCII_ALIASES[text], text
+    if token_type == TokenType.ENVELOPE_END:
+        return "END", None
+    if token_type == TokenType.BOOLEAN:
+        return text == "true", None
+    if token_type == TokenType.NULL:
+        return None, None
+    return text, None
+
+
+_ESCAPED_CHAR = re.compile(r"\\(.)")
+
+
+def _unescape_char(match: re.Match[str]) -> str:
+    """Resolve a regex escape in a fixed-spelling pattern to its literal character."""
+    return "\n" if match.group(1) == "n" else match.group(1)
+
+
+def _first_chars(items: Any) -> tuple[frozenset[str] | None, bool]:
+    """Compute the characters a parsed regex sequence can start with.
+
+    Returns:
+        Tuple of (first characters or None when any character may start a match,
+        whether the sequence can match the empty string)
+    """
+    first: set[str] = set()
+    for op, av in items:
+        op_name = str(op)
+        nullable = False
+        if op_name == "LITERAL":
+            chars: frozenset[str] | None = frozenset(chr(av))
+        elif op_name == "IN":
+            chars = _charset_first_chars(av)
+        elif op_name in ("AT", "ASSERT", "ASSERT_NOT"):
+            # Zero-width checks only restrict a match, so they add no characters
+            chars, nullable = frozenset(), True
+        elif op_name == "SUBPATTERN":
+            chars, nullable = _first_chars(av[-1])
+        elif op_name in ("MAX_REPEAT", "MIN_REPEAT"):
+            chars, nullable = _first_chars(av[2])
+            nullable = nullable or av[0] == 0
+        elif op_name == "BRANCH":
+            chars, nullable = frozenset(), False
+            for branch in av[1]:
+                branch_chars, branch_nullable = _first_chars(branch)
+                if branch_chars is None:
+                    return None, False
+                chars |= branch_chars
+                nullable = nullable or branch_nullable
+        else:
+            return None, False
+        if chars is None:
+            return None, False
+        first |= chars
+        if not nullable:
+            return frozenset(first), False
+    return frozenset(first), True
+
+
+def _charset_first_chars(items: Any) -> frozenset[str] | None:
+    """Expand a parsed character class; categories and negations match too much to enumerate."""
+    chars: set[str] = set()
+    for op, av in items:
+        op_name = str(op)
+        if op_name == "LITERAL":
+            chars.add(chr(av))
+        elif op_name == "RANGE" and av[1] - av[0] < 256:
+            chars.update(chr(code) for code in range(av[0], av[1] + 1))
+        else:
+            return None
+    return frozenset(chars)
+
+
+def _pattern_first_chars(pattern: str) -> frozenset[str] | None:
+    """Return the characters a token pattern can start with, or None if unrestricted."""
+    try:
+        from re import _parser  # type: ignore[attr-defined]
+
+        chars, nullable = _first_chars(_parser.parse(pattern))
+    except Exception:
+        return None
+    return None if nullable else chars
+
+
+def _compile_alternation(
+    patterns: list[tuple[int, str, TokenType]], as_bytes: bool = False
+) -> tuple[re.Pattern[Any], list[int]]:
+    """Compile (index, pattern, type) entries into one alternation with a named group per pattern.
+
+    Alternatives keep the TOKEN_PATTERNS order, and the regex engine tries them
+    left to right, so the first pattern that matches at a position wins exactly
+    as it did when each pattern was tried in turn.
 
     Args:
-        content: Raw OCTAVE text
+        patterns: Entries to combine
+        as_bytes: Compile a bytes pattern over UTF-8 (non-ASCII literals become byte sequences)
 
     Returns:
-        Tuple of (tokens, repairs)
+        Tuple of (compiled pattern, token type codes indexed by the outer group number of each alternative)
+    """
+    source = "|".join(f"(?P<T{index}>{pattern})" for index, pattern, _ in patterns)
+    compiled: re.Pattern[Any] = re.compile(source.encode("utf-8") if as_bytes else source)
 
-    Raises:
-        LexerError: On invalid syntax (tabs, malformed operators)
+    codes = [0] * (compiled.groups + 1)
+    for index, _, token_type in patterns:
+        codes[compiled.groupindex[f"T{index}"]] = token_type.value
+    return compiled, codes
+
+
+def _fixed_values(patterns: list[tuple[str, TokenType]]) -> dict[str, tuple[Any, str | None]]:
+    """Precompute (value, normalized_from) for every fixed-spelling token, keyed by its text."""
+    values: dict[str, tuple[Any, str | None]] = {"+": ("⊕", "+")}
+    for pattern, token_type in patterns:
+        if token_type in _FIXED_TEXT_TYPES:
+            text = _ESCAPED_CHAR.sub(_unescape_char, pattern.replace(r"\b", ""))
+            if not re.fullmatch(pattern, text):
+                raise ValueError(f"Pattern {pattern!r} for {token_type} must match a single fixed spelling")
+            values[text] = _fixed_token_value(token_type, text)
+    return values
+
+
+_Alternation = tuple[re.Pattern[Any], list[int]]
+
+
+def _build_dispatch_table(
+    patterns: list[tuple[str, TokenType]], as_bytes: bool = False
+) -> tuple[dict[Any, _Alternation], _Alternation | None]:
+    """Build a first-character dispatch table over TOKEN_PATTERNS.
+
+    Each character maps to an alternation of only the patterns that can start
+    with it (plus patterns whose first character cannot be determined), so a
+    position is matched against a handful of candidates instead of all of them.
+
+    Args:
+        patterns: Token patterns in priority order
+        as_bytes: Key the table by the first UTF-8 byte and compile bytes patterns
+
+    Returns:
+        Tuple of (per-character alternations, fallback alternation for other characters)
     """
-    # Apply NFC unicode normalization
-    content = unicodedata.normalize("NFC", content)
+    indexed = [(index, pattern, token_type) for index, (pattern, token_type) in enumerate(patterns)]
+    first_keys: list[frozenset[Any] | None] = [_pattern_first_chars(pattern) for pattern, _ in patterns]
+    if as_bytes:
+        first_keys = [
+            None if chars is None else frozenset(char.encode("utf-8")[0] for char in chars) for chars in first_keys
+        ]
 
-    # ... (existing checks)
+    alternations: dict[tuple[int, ...], _Alternation] = {}
 
-    # Check for tabs
-    if "\t" in content:
-        line = content[: content.index("\t")].count("\n") + 1
-        column = len(content[: content.index("\t")].split("\n")[-1]) + 1
-        raise LexerError("Tabs are not allowed. Use 2 spaces for indentation.", line, column, "E005")
+    def alternation_for(key: Any) -> _Alternation | None:
+        selected = tuple(
+            index for index, keys in enumerate(first_keys) if keys is None or (key is not None and key in keys)
+        )
+        if not selected:
+            return None
+        if selected not in alternations:
+            alternations[selected] = _compile_alternation([indexed[index] for index in selected], as_bytes)
+        return alternations[selected]
 
-    tokens: list[Token] = []
-    repairs: list[Any] = []
-    line = 1
-    column = 1
-    pos = 0
+    table: dict[Any, _Alternation] = {}
+    for key in sorted(set().union(*(keys for keys in first_keys if keys is not None))):
+        entry = alternation_for(key)
+        if entry is not None:
+            table[key] = entry
+    return table, alternation_for(None)
 
-    # Compile all patterns
-    compiled_patterns = [(re.compile(pattern), token_type) for pattern, token_type in TOKEN_PATTERNS]
 
-    while pos < len(content):
-        # ... (whitespace handling)
-        # Track whitespace (spaces only, not newlines)
-        if content[pos] == " ":
-            # Count leading spaces for indentation
-            if column == 1:  # Start of line
-                space_count = 0
-                while pos < len(content) and content[pos] == " ":
-                    space_count += 1
-                    pos += 1
-                if space_count > 0 and pos < len(content) and content[pos] != "\n":
-                    # Only emit INDENT if followed by non-newline
-                    tokens.append(Token(TokenType.INDENT, space_count, line, column))
-                    column += space_count
-                continue
-            else:
-                # Skip inline spaces
-                pos += 1
-                column += 1
-                continue
+# Compiled once at import time and shared by every tokenize() call
+_DISPATCH_TABLE, _DISPATCH_FALLBACK = _build_dispatch_table(TOKEN_PATTERNS)
+_FIXED_VALUES = _fixed_values(TOKEN_PATTERNS)
+_INLINE_SPACES = re.compile(" +")
+
+# Finds any spelling that the lexer normalizes (see ASCII_ALIASES); text without
+# a match is canonical and needs no repair tracking. "vs" is matched without word
+# boundaries because an identifier spelled "vs" (e.g. after a digit in "1vs") is
+# normalized too.
+_ASCII_ALIAS_SCAN = re.compile(r"->|[+~|&#]|vs")
+
+# Bytes twins of the tables above, for lexing UTF-8 input without decoding it
+_BYTE_DISPATCH_TABLE, _BYTE_DISPATCH_FALLBACK = _build_dispatch_table(TOKEN_PATTERNS, as_bytes=True)
+_BYTE_INLINE_SPACES = re.compile(b" +")
+_BYTE_NEWLINE = re.compile(b"\n")
+_BYTE_ASCII_ALIAS_SCAN = re.compile(rb"->|[+~|&#]|vs")
+
+# Characters read per call when iter_tokens() streams from a file object
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+# Number of recently materialized tokens a TokenBuffer keeps for repeated indexing
+_RECENT_TOKENS = 4
+
+
+class _TokenColumns(Sequence[Token], ABC):
+    """Struct-of-arrays token storage shared by TokenBuffer and ByteTokenBuffer.
+
+    Token types are kept in a bytearray and source offsets in unsigned
+    arrays; lines and columns come from the shared LineIndex. Subclasses own
+    the source and materialize Token objects, and their values, from it only
+    when indexed, so a buffer costs a few bytes per token instead of a
+    dataclass instance. Supports the read-only sequence protocol, so it can be
+    handed to Parser in place of a token list.
+    """
+
+    __slots__ = ("types", "starts", "ends", "line_index", "canonical", "_recent", "_names")
+
+    def __init__(self, size: int, canonical: bool, line_index: LineIndex, intern_names: bool = True):
+        self.types = bytearray()
+        self.starts = _offset_array(size)
+        self.ends = _offset_array(size)
+        self.line_index = line_index
+        self.canonical = canonical
+        self._recent: dict[int, Token] = {}
+        # One string per distinct identifier, so repeated keys in an AST share
+        # storage; unlike sys.intern, it is freed with the buffer
+        self._names: dict[str, str] | None = {} if intern_names else None
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    @overload
+    def __getitem__(self, index: int) -> Token: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Token]: ...
 
-        # Try to match token patterns
-        matched = False
-        for pattern, token_type in compiled_patterns:
-            match = pattern.match(content, pos)
-            if match:
-                matched_text = match.group()
-                normalized_from = None
-
-                # ... (value extraction logic)
-                # Handle special tokens
-                if token_type == TokenType.ENVELOPE_START:
-                    value = match.group(1)  # Extract NAME from ===NAME===
-                elif token_type == TokenType.ENVELOPE_END:
-                    value = "END"
-                elif token_type == TokenType.STRING:
-                    # Remove quotes and handle escapes
-                    value = matched_text[1:-1]  # Remove surrounding quotes
-                    # Process escape sequences
-                    value = value.replace(r"\"", '"')
-                    value = value.replace(r"\\", "\\")
-                    value = value.replace(r"\n", "\n")
-                    value = value.replace(r"\t", "\t")
-                elif token_type == TokenType.NUMBER:
-                    # Convert to int or float
-                    if "." in matched_text or "e" in matched_text.lower():
-                        value = float(matched_text)
-                    else:
-                        value = int(matched_text)
-                elif token_type == TokenType.BOOLEAN:
-                    value = matched_text == "true"
-                elif token_type == TokenType.NULL:
-                    value = None
-                elif token_type == TokenType.COMMENT:
-                    value = matched_text[2:].strip()  # Remove // and strip
-                elif token_type == TokenType.NEWLINE:
-                    value = "\n"
-                else:
-                    value = matched_text
-
-                # Check for ASCII alias normalization
-                if matched_text in ASCII_ALIASES:
-                    normalized_from = matched_text
-                    value = ASCII_ALIASES[matched_text]
-
-                # Special handling for operators that need normalization
-                if token_type in (
-                    TokenType.FLOW,
-                    TokenType.SYNTHESIS,
-                    TokenType.CONCAT,
-                    TokenType.TENSION,
-                    TokenType.ALTERNATIVE,
-                    TokenType.CONSTRAINT,
-                    TokenType.SECTION,
-                ):
-                    if matched_text in ASCII_ALIASES:
-                        normalized_from = matched_text
-                        value = ASCII_ALIASES[matched_text]
-
-                token = Token(token_type, value, line, column, normalized_from)
-                tokens.append(token)
-
-                if normalized_from:
+    def __getitem__(self, index: int | slice) -> Token | list[Token]:
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(*index.indices(len(self.types)))]
+        token = self._recent.get(index)
+        if token is not None:
+            return token
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError("token index out of range")
+        token = self._materialize(index)
+        # Parsers look at the same few tokens repeatedly (current, peek, EOF)
+        if len(self._recent) >= _RECENT_TOKENS:
+            self._recent.clear()
+        self._recent[index] = token
+        return token
+
+    def __iter__(self) -> Iterator[Token]:
+        return self._iter_tokens()
+
+    def append(self, token_type: TokenType, start: int, end: int) -> None:
+        """Append a token spanning source[start:end]."""
+        self.types.append(token_type.value)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the token columns and the line index, not counting the source."""
+        newlines = self.line_index.newlines
+        return (
+            len(self.types)
+            + (len(self.starts) + len(self.ends)) * self.starts.itemsize
+            + len(newlines) * newlines.itemsize
+        )
+
+    def type_at(self, index: int) -> TokenType:
+        """Return the type of the token at index without materializing it."""
+        return _TOKEN_TYPES[self.types[index]]
+
+    @abstractmethod
+    def text_at(self, index: int) -> str:
+        """Return the source text of the token at index."""
+
+    def repairs(self) -> list[dict[str, Any]]:
+        """Build normalization repair records for tokens spelled with an ASCII alias."""
+        if self.canonical:
+            return []
+        repairs: list[dict[str, Any]] = []
+        line_index = self.line_index
+        for index, code in enumerate(self.types):
+            if code in _ALIAS_TYPE_CODES:
+                text = self.text_at(index)
+                if text in ASCII_ALIASES:
+                    line, column = line_index.position(line_index.start_offset + self.starts[index])
                     repairs.append(
                         {
                             "type": "normalization",
-                            "original": normalized_from,
-                            "normalized": value,
+                            "original": text,
+                            "normalized": ASCII_ALIASES[text],
                             "line": line,
                             "column": column,
                         }
                     )
+        return repairs
 
-                # Update position
-                if token_type == TokenType.NEWLINE:
-                    line += 1
-                    column = 1
-                else:
-                    column += len(matched_text)
-                pos = match.end()
-                matched = True
-                break
+    def _intern(self, name: str) -> str:
+        """Return the buffer's shared copy of an identifier."""
+        if self._names is None:
+            return name
+        return self._names.setdefault(name, name)
+
+    @abstractmethod
+    def _materialize(self, index: int) -> Token:
+        """Build the Token at index, deriving its value from the source."""
+
+    @abstractmethod
+    def _iter_tokens(self) -> Iterator[Token]:
+        """Materialize all tokens in order (bulk equivalent of _materialize)."""
+
+
+class TokenBuffer(_TokenColumns):
+    """Compact token storage over normalized text, as produced by tokenize_buffer()."""
+
+    __slots__ = ("source",)
+
+    def __init__(
+        self,
+        source: str,
+        canonical: bool = False,
+        line_index: LineIndex | None = None,
+        intern_names: bool = True,
+    ):
+        """Create an empty buffer over source.
+
+        Args:
+            source: Normalized text the token offsets refer to
+            canonical: Source holds no ASCII aliases, so no token needs normalization
+            line_index: Index of source's newlines (built from source when omitted);
+                its start_offset is the document offset of source[0]
+            intern_names: Share one string per distinct identifier among tokens
+        """
+        super().__init__(
+            len(source), canonical, line_index if line_index is not None else LineIndex(source), intern_names
+        )
+        self.source = source
+
+    def text_at(self, index: int) -> str:
+        """Return the source text of the token at index."""
+        return self.source[self.starts[index] : self.ends[index]]
+
+    def _materialize(self, index: int) -> Token:
+        """Build the Token at index, deriving its value from the source text."""
+        code = self.types[index]
+        start = self.starts[index]
+        end = self.ends[index]
+        kind = _VALUE_KINDS[code]
+        normalized_from = None
+        value: Any
+
+        if kind == _KIND_FIXED:
+            value, normalized_from = _FIXED_VALUES[self.source[start:end]]
+        elif kind == _KIND_IDENTIFIER:
+            value = self._intern(self.source[start:end])
+            # Check for ASCII alias normalization
+            if not self.canonical and value in ASCII_ALIASES:
+                normalized_from = value
+                value = ASCII_ALIASES[value]
+        else:
+            value = _decode_value(kind, self.source, start, end)
+
+        return Token(_TOKEN_TYPES[code], value, self.line_index.start_offset + start, normalized_from, self.line_index)
+
+    def _iter_tokens(self) -> Iterator[Token]:
+        """Materialize all tokens in order (bulk equivalent of _materialize)."""
+        source = self.source
+        canonical = self.canonical
+        token_types = _TOKEN_TYPES
+        value_kinds = _VALUE_KINDS
+        fixed_values = _FIXED_VALUES
+        aliases = ASCII_ALIASES
+        line_index = self.line_index
+        base = line_index.start_offset
+        names = self._names
+        for code, start, end in zip(self.types, self.starts, self.ends, strict=True):
+            kind = value_kinds[code]
+            normalized_from = None
+            value: Any
+            if kind == _KIND_FIXED:
+                value, normalized_from = fixed_values[source[start:end]]
+            elif kind == _KIND_IDENTIFIER:
+                value = source[start:end]
+                if names is not None:
+                    value = names.setdefault(value, value)
+                if not canonical and value in aliases:
+                    normalized_from = value
+                    value = aliases[value]
+            else:
+                value = _decode_value(kind, source, start, end)
+            yield Token(token_types[code], value, base + start, normalized_from, line_index)
+
+
+def _decode_utf8(data: bytes | mmap.mmap, start: int, end: int) -> str:
+    """Decode a UTF-8 slice to NFC text."""
+    text = str(data[start:end], "utf-8")
+    if not text.isascii() and not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    return text
+
+
+class _ByteLineIndex(LineIndex):
+    """LineIndex over UTF-8 bytes: offsets are byte positions, columns count characters."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes | mmap.mmap):
+        super().__init__("")
+        self.data = data
+        self.newlines = _offset_array(len(data))
+        self.newlines.extend(match.start() for match in _BYTE_NEWLINE.finditer(data))
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """Resolve a byte offset to (line, column), counting columns in NFC characters."""
+        line, byte_column = super().position(offset)
+        return line, len(_decode_utf8(self.data, offset - byte_column + 1, offset)) + 1
+
+
+class ByteTokenBuffer(_TokenColumns):
+    """Compact token storage over UTF-8 bytes, as produced by tokenize_bytes().
+
+    Offsets are byte positions into source (typically a read-only mmap), and
+    only the slices that become token values are decoded.
+    """
+
+    __slots__ = ("source",)
+
+    def __init__(self, source: bytes | mmap.mmap, canonical: bool = False):
+        """Create an empty buffer over source.
+
+        Args:
+            source: UTF-8 bytes the token offsets refer to
+            canonical: Source holds no ASCII aliases, so no token needs normalization
+        """
+        super().__init__(len(source), canonical, _ByteLineIndex(source))
+        self.source = source
+
+    def text_at(self, index: int) -> str:
+        """Return the decoded source text of the token at index."""
+        return _decode_utf8(self.source, self.starts[index], self.ends[index])
+
+    def _materialize(self, index: int) -> Token:
+        """Build the Token at index, decoding its value from the source bytes."""
+        return self._token(self.types[index], self.starts[index], self.ends[index])
+
+    def _iter_tokens(self) -> Iterator[Token]:
+        """Materialize all tokens in order."""
+        token = self._token
+        for code, start, end in zip(self.types, self.starts, self.ends, strict=True):
+            yield token(code, start, end)
+
+    def _token(self, code: int, start: int, end: int) -> Token:
+        kind = _VALUE_KINDS[code]
+        normalized_from = None
+        value: Any
+        if kind == _KIND_INDENT:
+            value = end - start
+        elif kind == _KIND_EOF:
+            value = None
+        else:
+            text = _decode_utf8(self.source, start, end)
+            if kind == _KIND_FIXED:
+                value, normalized_from = _FIXED_VALUES[text]
+            elif kind == _KIND_IDENTIFIER:
+                value = self._intern(text)
+                if not self.canonical and value in ASCII_ALIASES:
+                    normalized_from = value
+                    value = ASCII_ALIASES[value]
+            else:
+                value = _decode_value(kind, text, 0, len(text))
+        return Token(_TOKEN_TYPES[code], value, start, normalized_from, self.line_index)
+
+
+def _decode_value(kind: int, source: str, start: int, end: int) -> Any:
+    """Derive the value of a variable-spelling token from its source span."""
+    if kind == _KIND_STRING:
+        # Remove quotes and process escape sequences
+        value = source[start + 1 : end - 1]
+        if "\\" in value:
+            value = value.replace(r"\"", '"')
+            value = value.replace(r"\\", "\\")
+            value = value.replace(r"\n", "\n")
+            value = value.replace(r"\t", "\t")
+        return value
+    if kind == _KIND_NUMBER:
+        # Convert to int or float
+        text = source[start:end]
+        if "." in text or "e" in text or "E" in text:
+            return float(text)
+        return int(text)
+    if kind == _KIND_COMMENT:
+        return source[start + 2 : end].strip()  # Remove // and strip
+    if kind == _KIND_ENVELOPE_START:
+        return source[start + 3 : end - 3]  # Extract NAME from ===NAME===
+    if kind == _KIND_INDENT:
+        return end - start
+    return None
+
+
+def _scan_region(buffer: TokenBuffer, pos: int, final: bool, limit: int | None = None) -> int:
+    """Scan buffer.source from pos, appending token spans to buffer.
+
+    Unless final is set, the source must end at a line boundary and scanning
+    stops early at a quoted string whose closing quote has not arrived yet,
+    since strings are the only tokens that may span lines.
+
+    When limit is given, scanning stops at the first token boundary at or
+    after it (tokens may still extend past limit).
+
+    Returns:
+        Stop position to resume from
+    """
+    content = buffer.source
+    length = len(content)
+    stop = length if limit is None else limit
+    dispatch = _DISPATCH_TABLE
+    fallback = _DISPATCH_FALLBACK
+    match_spaces = _INLINE_SPACES.match
+    types_append = buffer.types.append
+    starts_append = buffer.starts.append
+    ends_append = buffer.ends.append
 
-        if not matched:
-            # Handle special case: + operator (need to distinguish from number)
-            if content[pos] == "+":
-                # Look ahead - is this part of a number or an operator?
-                if pos + 1 < len(content) and content[pos + 1].isdigit():
-                    # Part of number - this will be caught by number pattern
-                    # But we're here, so it wasn't matched - treat as synthesis
-                    pass
-                # Treat as synthesis operator
-                tokens.append(Token(TokenType.SYNTHESIS, "⊕", line, column, "+"))
-                repairs.append(
-                    {"type": "normalization", "original": "+", "normalized": "⊕", "line": line, "column": column}
-                )
-                column += 1
+    while pos < stop:
+        char = content[pos]
+
+        # Track whitespace (spaces only, not newlines)
+        if char == " ":
+            end = match_spaces(content, pos).end()  # type: ignore[union-attr]
+            # Only emit INDENT at start of line if followed by non-newline
+            if (pos == 0 or content[pos - 1] == "\n") and end < length and content[end] != "\n":
+                buffer.append(TokenType.INDENT, pos, end)
+            pos = end
+            continue
+
+        entry = dispatch.get(char, fallback)
+        match = entry[0].match(content, pos) if entry is not None else None
+        if match is None:
+            # Handle special case: + operator (not covered by TOKEN_PATTERNS)
+            if char == "+":
+                buffer.append(TokenType.SYNTHESIS, pos, pos + 1)
                 pos += 1
                 continue
 
+            # Unterminated string may be completed by the next chunk
+            if char == '"' and not final:
+                break
+
             # Unrecognized character
-            raise LexerError(f"Unexpected character: '{content[pos]}'", line, column, "E005")
+            line_index = buffer.line_index
+            line, column = line_index.position(line_index.start_offset + pos)
+            raise LexerError(f"Unexpected character: '{char}'", line, column, "E005")
+
+        end = match.end()
+        types_append(entry[1][match.lastindex])  # type: ignore[index]
+        starts_append(pos)
+        ends_append(end)
+        pos = end
+
+    return pos
+
+
+def _normalize_region(region: str) -> str:
+    """Apply NFC unicode normalization to a region of whole lines."""
+    # Newlines are normalization boundaries, so regions normalize independently
+    if not unicodedata.is_normalized("NFC", region):
+        region = unicodedata.normalize("NFC", region)
+    return region
+
+
+def _check_tabs(text: str, start: int, line_index: LineIndex, end: int | None = None) -> None:
+    """Reject tabs in text[start:end].
+
+    Raises:
+        LexerError: At the position of the first tab
+    """
+    tab = text.find("\t", start, end)
+    if tab >= 0:
+        line, column = line_index.position(line_index.start_offset + tab)
+        raise LexerError("Tabs are not allowed. Use 2 spaces for indentation.", line, column, "E005")
+
+
+def _lex_chunks(chunks: Iterable[str], repairs: list[Any] | None) -> Iterator[Token]:
+    """Lex a sequence of text chunks as one document.
+
+    Chunks are split at their last newline and only complete lines are
+    normalized and lexed, so operators, envelopes and positions are unaffected
+    by where the chunk boundaries fall. The unconsumed tail is the only text
+    kept between chunks.
+
+    Regions that are already NFC and contain no ASCII alias take the canonical
+    fast path: no normalization pass and no repair tracking.
+    """
+    line_index = LineIndex("")
+    text = ""  # Normalized text not yet consumed by the lexer
+    pos = 0
+    pending = ""  # Raw text after the last complete line
+
+    iterator = iter(chunks)
+    chunk = next(iterator, None)
+    while chunk is not None:
+        following = next(iterator, None)
+        final = following is None
+        pending += chunk
+        chunk = following
+
+        if final:
+            region, pending = pending, ""
+        else:
+            cut = pending.rfind("\n") + 1
+            if cut == 0:
+                continue
+            region, pending = pending[:cut], pending[cut:]
+
+        region = _normalize_region(region)
+        carried = text[pos:]
+        offset = line_index.start_offset + pos
+        line, column = line_index.position(offset)
+        text = carried + region
+        line_index = LineIndex(text, offset, line, column)
+        _check_tabs(text, len(carried), line_index)
+
+        # Streamed tokens are not kept together, so sharing names would only cost memory
+        buffer = TokenBuffer(text, _ASCII_ALIAS_SCAN.search(text) is None, line_index, intern_names=False)
+        pos = _scan_region(buffer, 0, final)
+        if repairs is not None:
+            repairs.extend(buffer.repairs())
+        yield from buffer
+
+    # Add EOF token
+    yield Token(TokenType.EOF, None, line_index.start_offset + len(text), None, line_index)
+
+
+def iter_tokens(source: str | TextIO | Iterable[str], repairs: list[Any] | None = None) -> Iterator[Token]:
+    """Lazily tokenize OCTAVE content from a string, text file or iterable of chunks.
+
+    Produces the same tokens as tokenize() while holding at most one chunk
+    plus the current line in memory, so arbitrarily large inputs can be
+    linted without reading them whole.
+
+    Args:
+        source: Raw OCTAVE text, a text file object, or an iterable of text chunks
+        repairs: Optional list that receives normalization repair records as tokens are produced
+
+    Yields:
+        Tokens in document order, ending with EOF
+
+    Raises:
+        LexerError: On invalid syntax (tabs, malformed operators), when reached
+    """
+    chunks: Iterable[str]
+    if isinstance(source, str):
+        chunks = (source,)
+    elif hasattr(source, "read"):
+        reader = source.read
+        chunks = iter(lambda: reader(STREAM_CHUNK_SIZE), "")
+    else:
+        chunks = source
+    return _lex_chunks(chunks, repairs)
+
+
+def tokenize_buffer(content: str, start_offset: int = 0, start_line: int = 1) -> TokenBuffer:
+    """Tokenize OCTAVE content into a compact TokenBuffer.
+
+    Args:
+        content: Raw OCTAVE text
+        start_offset: Offset of content in a larger source, for token offsets
+        start_line: Line of content's first character in that source (1-based)
+
+    Returns:
+        TokenBuffer ending with EOF; normalization repairs are available via repairs()
+
+    Raises:
+        LexerError: On invalid syntax (tabs, malformed operators)
+    """
+    content = _normalize_region(content)
+    line_index = LineIndex(content, start_offset, start_line)
+    _check_tabs(content, 0, line_index)
+    buffer = TokenBuffer(content, _ASCII_ALIAS_SCAN.search(content) is None, line_index)
+    _scan_region(buffer, 0, final=True)
+
+    # Add EOF token
+    buffer.append(TokenType.EOF, len(content), len(content))
+    return buffer
+
+
+def _extend_offsets(target: "array[int]", offsets: "array[int]", shift: int = 0) -> None:
+    """Append offsets to target, adding shift to each."""
+    if shift:
+        target.extend(map(shift.__add__, offsets))
+    elif target.typecode == offsets.typecode:
+        target.extend(offsets)
+    else:
+        target.fromlist(offsets.tolist())
+
+
+def relex(buffer: TokenBuffer, start: int, end: int, replacement: str) -> TokenBuffer:
+    """Re-tokenize a buffer after replacing source[start:end] with replacement.
+
+    Only the lines touched by the edit are lexed again. Tokens before them are
+    copied, and tokens after them are copied with shifted offsets as soon as
+    the new scan reaches a token boundary that the previous scan also passed
+    through, so the result equals tokenize_buffer() on the edited text.
+
+    Args:
+        buffer: Buffer from tokenize_buffer() for the current text
+        start: Start offset of the replaced span in buffer.source
+        end: End offset of the replaced span in buffer.source
+        replacement: Raw replacement text
+
+    Returns:
+        New TokenBuffer over the edited text (buffer is left unchanged)
+
+    Raises:
+        ValueError: If the buffer is a streaming region or the span is outside its source
+        LexerError: On invalid syntax in the re-lexed lines
+    """
+    old = buffer.source
+    if buffer.line_index.start_offset:
+        raise ValueError("relex() requires a whole-document buffer from tokenize_buffer()")
+    if not 0 <= start <= end <= len(old):
+        raise ValueError(f"Edit span {start}:{end} is outside the source (length {len(old)})")
+
+    old_starts = buffer.starts
+    old_ends = buffer.ends
+    count = len(buffer.types) - 1  # Tokens before EOF
+
+    # Resume from the start of the edited line, backing up over any token
+    # (a multi-line string) that spans into it
+    line_start = old.rfind("\n", 0, start) + 1
+    first = bisect_left(old_starts, line_start, 0, count)
+    while first > 0 and old_ends[first - 1] > line_start:
+        line_start = old.rfind("\n", 0, old_starts[first - 1]) + 1
+        first = bisect_left(old_starts, line_start, 0, count)
+
+    # Newlines are normalization boundaries, so whole edited lines normalize alone
+    line_end = old.find("\n", end) + 1 or len(old)
+    window = _normalize_region(old[line_start:start] + replacement + old[end:line_end])
+    source = old[:line_start] + window + old[line_end:]
+    window_end = line_start + len(window)
+    delta = window_end - line_end
+
+    old_newlines = buffer.line_index.newlines
+    first_newline = bisect_left(old_newlines, line_start)
+    last_newline = bisect_left(old_newlines, line_end)
+    line_index = LineIndex("")
+    line_index.newlines = _offset_array(len(source))
+    _extend_offsets(line_index.newlines, old_newlines[:first_newline])
+    _extend_offsets(line_index.newlines, LineIndex(window).newlines, line_start)
+    _extend_offsets(line_index.newlines, old_newlines[last_newline:], delta)
+    _check_tabs(source, line_start, line_index, window_end)
+
+    canonical = buffer.canonical and _ASCII_ALIAS_SCAN.search(window) is None
+    result = TokenBuffer(source, canonical, line_index)
+    result.types.extend(buffer.types[:first])
+    _extend_offsets(result.starts, old_starts[:first])
+    _extend_offsets(result.ends, old_ends[:first])
+
+    # Lexing from a position depends only on the text from the character before
+    # it onwards, so once the scan is past the window at a position where an old
+    # token starts, the old tokens from there on are valid
+    pos = line_start
+    limit = window_end
+    tail = count
+    while True:
+        pos = _scan_region(result, pos, final=True, limit=limit)
+        if pos >= len(source):
+            break
+        resume = bisect_left(old_starts, pos - delta, first, count)
+        if resume < count and old_starts[resume] == pos - delta:
+            tail = resume
+            break
+        limit = source.find("\n", pos) + 1 or len(source)
+
+    result.types.extend(buffer.types[tail:count])
+    _extend_offsets(result.starts, old_starts[tail:count], delta)
+    _extend_offsets(result.ends, old_ends[tail:count], delta)
+
+    # Add EOF token
+    result.append(TokenType.EOF, len(source), len(source))
+    return result
+
+
+def _scan_bytes(buffer: ByteTokenBuffer) -> bool:
+    """Scan buffer.source (UTF-8 bytes), appending token spans with byte offsets.
+
+    The bytes twin of _scan_region. Byte patterns treat non-ASCII bytes as
+    non-word characters and cannot see NFC or Unicode digits, so anything
+    they fail to match is left to the text lexer rather than reported here.
+
+    Returns:
+        True if the whole source was scanned, False at the first byte no pattern matches
+    """
+    content = buffer.source
+    length = len(content)
+    dispatch = _BYTE_DISPATCH_TABLE
+    fallback = _BYTE_DISPATCH_FALLBACK
+    match_spaces = _BYTE_INLINE_SPACES.match
+    types_append = buffer.types.append
+    starts_append = buffer.starts.append
+    ends_append = buffer.ends.append
+    space, newline, plus = b" \n+"
+    pos = 0
+
+    while pos < length:
+        byte = content[pos]
+
+        if byte == space:
+            end = match_spaces(content, pos).end()  # type: ignore[union-attr]
+            if (pos == 0 or content[pos - 1] == newline) and end < length and content[end] != newline:
+                buffer.append(TokenType.INDENT, pos, end)
+            pos = end
+            continue
+
+        entry = dispatch.get(byte, fallback)
+        match = entry[0].match(content, pos) if entry is not None else None
+        if match is None:
+            if byte == plus:
+                buffer.append(TokenType.SYNTHESIS, pos, pos + 1)
+                pos += 1
+                continue
+            return False
+
+        end = match.end()
+        types_append(entry[1][match.lastindex])  # type: ignore[index]
+        starts_append(pos)
+        ends_append(end)
+        pos = end
+
+    return True
+
+
+def _check_utf8(data: bytes | mmap.mmap) -> None:
+    """Validate UTF-8 in fixed-size pieces so no decoded copy of the whole input is held.
+
+    Raises:
+        UnicodeDecodeError: If data is not valid UTF-8
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    view = memoryview(data)
+    try:
+        for start in range(0, len(view), STREAM_CHUNK_SIZE):
+            decoder.decode(view[start : start + STREAM_CHUNK_SIZE])
+        decoder.decode(b"", final=True)
+    finally:
+        view.release()
+
+
+def tokenize_bytes(data: bytes | mmap.mmap) -> TokenBuffer | ByteTokenBuffer:
+    """Tokenize UTF-8 encoded OCTAVE content without decoding it as a whole.
+
+    The token patterns run directly over the bytes and token offsets are byte
+    positions; only the slices that become token values are decoded (and NFC
+    normalized). Lines and columns are still reported in characters.
+
+    Input the byte patterns cannot decide on their own (a lexer error, Unicode
+    digits, or characters that only become valid after NFC normalization) is
+    decoded and lexed as text instead, so tokens and errors always match
+    tokenize_buffer() on the decoded text. In that case the result is a
+    TokenBuffer with character offsets.
+
+    Args:
+        data: UTF-8 bytes, e.g. a read-only mmap of an .oct.md file
+
+    Returns:
+        ByteTokenBuffer ending with EOF (or TokenBuffer on fallback)
+
+    Raises:
+        UnicodeDecodeError: If data is not valid UTF-8
+        LexerError: On invalid syntax (tabs, malformed operators)
+    """
+    _check_utf8(data)
+    buffer = ByteTokenBuffer(data, _BYTE_ASCII_ALIAS_SCAN.search(data) is None)
+
+    # Check for tabs
+    tab = data.find(b"\t")
+    if tab >= 0:
+        line, column = buffer.line_index.position(tab)
+        raise LexerError("Tabs are not allowed. Use 2 spaces for indentation.", line, column, "E005")
+
+    if not _scan_bytes(buffer):
+        return tokenize_buffer(str(data, "utf-8"))
 
     # Add EOF token
-    tokens.append(Token(TokenType.EOF, None, line, column))
+    buffer.append(TokenType.EOF, len(data), len(data))
+    return buffer
+
+
+def tokenize_file(path: str | os.PathLike[str]) -> TokenBuffer | ByteTokenBuffer:
+    """Tokenize a UTF-8 OCTAVE file through a read-only memory map.
+
+    The file is never read into a decoded string, so very large files cost
+    little more resident memory than their token arrays. See tokenize_bytes().
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Token buffer ending with EOF; it keeps the mapping open while referenced
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+        UnicodeDecodeError: If the file is not valid UTF-8
+        LexerError: On invalid syntax (tabs, malformed operators)
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return tokenize_buffer("")
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return tokenize_bytes(data)
+
+
+def tokenize(content: str, track_repairs: bool = True) -> tuple[list[Token], list[Any]]:
+    """Tokenize OCTAVE content with ASCII alias normalization.
 
-    return tokens, repairs
+    Args:
+        content: Raw OCTAVE text
+        track_repairs: Build normalization repair records (tokens still carry normalized_from)
+
+    Returns:
+        Tuple of (tokens, repairs); repairs is empty when track_repairs is False
+
+    Raises:
+        LexerError: On invalid syntax (tabs, malformed operators)
+    """
+    buffer = tokenize_buffer(content)
+    return list(buffer), buffer.repairs() if track_repairs else []
@@ -9,10 +9,38 @@ Parses lexer tokens into AST with:
 - META block extraction
 """
 
-from typing import Any
-
+import io
+import re
+import unicodedata
+from collections import deque
+from collections.abc import Collection, Generator, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TextIO, TypeVar
+
+from octave_mcp.core import events
 from octave_mcp.core.ast_nodes import Assignment, ASTNode, Block, Document, InlineMap, ListValue, Section
-from octave_mcp.core.lexer import Token, TokenType, tokenize
+from octave_mcp.core.lexer import Token, TokenType, iter_tokens, tokenize, tokenize_buffer
+
+# Version of the ASTs this parser builds; bump whenever the Document produced
+# for some input, or the fields of its nodes, change, so cached
+# parse results are not reused across it
+PARSER_VERSION = "3"
+
+# Top-level line scan for selective parsing. Strings and comments are matched
+# whole so their contents are ignored, brackets track lists spanning lines,
+# a lone quote is an unterminated string, and a newline followed by a
+# non-space character other than a comment starts a line at column 0.
+_TOP_LEVEL_SCAN = re.compile(r'"(?:[^"\\]|\\.)*"|//[^\n]*|[\[\]]|"|\n(?=[^\s/])')
+# KEY::, KEY:, KEY-> or KEY→ at the start of a top-level line
+_TOP_LEVEL_KEY = re.compile(r"([A-Za-z_][A-Za-z0-9_.-]*(?<!-)) *(?::|->|→)")
+_KEYWORDS = frozenset({"true", "false", "null", "vs"})
+_SECTION_MARKER = re.compile(r"[§#]")
+# Envelope lines ===NAME=== / ===END===, and lines with nothing to parse,
+# for splitting multi-document streams
+_ENVELOPE_LINE = re.compile(r" *===([A-Z_][A-Z0-9_]*)=== *(?://.*)?$")
+_BLANK_LINE = re.compile(r" *(?://.*)?$")
+# Block header followed only by blank and comment lines at the end of an item
+_OPEN_HEADER = re.compile(r"[A-Za-z0-9_.-] *:[ \t]*(?:\s|//[^\n]*)*$")
 
 
 class ParserError(Exception):
@@ -27,15 +55,19 @@ class ParserError(Exception):
         else:
             super().__init__(f"{error_code}: {message}")
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild from the constructor arguments, e.g. when returned from a worker process
+        return type(self), (self.message, self.token, self.error_code)
+
 
 class Parser:
     """OCTAVE parser with lenient input support."""
 
-    def __init__(self, tokens: list[Token]):
-        """Initialize parser with token stream."""
+    def __init__(self, tokens: Sequence[Token]):
+        """Initialize parser with token stream (a token list or a TokenBuffer)."""
         self.tokens = tokens
         self.pos = 0
-        self.current_indent = 0
+        self.current_indent = 0  # Indentation of the current line (0 until an INDENT token)
 
     def current(self) -> Token:
         """Get current token."""
@@ -67,7 +99,8 @@ class Parser:
     def skip_whitespace(self) -> None:
         """Skip newlines and comments."""
         while self.current().type in (TokenType.NEWLINE, TokenType.COMMENT):
-            self.advance()
+            if self.advance().type == TokenType.NEWLINE:
+                self.current_indent = 0
 
     def parse_document(self) -> Document:
         """Parse a complete OCTAVE document."""
@@ -196,6 +229,72 @@ class Parser:
             §CONTEXT::LOCAL
               VAR::"local_value"
         """
+        section_token, section_id, section_name, annotation = self._parse_section_header()
+
+        # Parse section children (similar to block parsing)
+        children: list[ASTNode] = []
+
+        # Expect indentation for children
+        if self.current().type == TokenType.INDENT:
+            child_indent = self.current().value
+            self.advance()
+
+            # Track current line's indentation to determine if SECTION is child or sibling
+            self.current_indent = child_indent
+
+            while True:
+                # End conditions
+                if self.current().type in (TokenType.EOF, TokenType.ENVELOPE_END):
+                    break
+
+                # Check indentation first to track current line's indent level
+                if self.current().type == TokenType.INDENT:
+                    self.current_indent = self.current().value
+                    if self.current_indent < child_indent:
+                        break  # Dedent, end of section
+                    # Same or deeper level - consume and continue to parse
+                    self.advance()
+                    continue
+
+                # Check for section marker - only break if at shallower indent than children
+                # Nested child sections are at same or deeper indent as other children
+                if self.current().type == TokenType.SECTION:
+                    # If section is at shallower indent than current section's children, it's a sibling
+                    if self.current_indent < child_indent:
+                        break  # Sibling or parent section, end current section
+                    # Otherwise (current_indent >= child_indent), it's a nested child section
+                    # Let parse_section handle it by falling through to the parse_section call
+
+                # Skip newlines
+                if self.current().type == TokenType.NEWLINE:
+                    self.advance()
+                    # Reset indent tracking after newline
+                    self.current_indent = 0
+                    continue
+
+                # Parse child
+                child = self.parse_section(child_indent)
+                if child:
+                    children.append(child)
+                else:
+                    # No valid child parsed, might be end of section
+                    break
+
+        return Section(
+            section_id=section_id,
+            key=section_name,
+            annotation=annotation,
+            children=children,
+            line=section_token.line,
+            column=section_token.column,
+        )
+
+    def _parse_section_header(self) -> tuple[Token, str, str, str | None]:
+        """Parse a § section marker up to its children.
+
+        Returns:
+            Tuple of (§ token, section id, section name, bracket annotation or None)
+        """
         section_token = self.current()
         self.expect(TokenType.SECTION)  # Consume §
 
@@ -281,64 +380,7 @@ class Parser:
                 annotation = "".join(annotation_tokens)
 
         self.skip_whitespace()
-
-        # Parse section children (similar to block parsing)
-        children: list[ASTNode] = []
-
-        # Expect indentation for children
-        if self.current().type == TokenType.INDENT:
-            child_indent = self.current().value
-            self.advance()
-
-            # Track current line's indentation to determine if SECTION is child or sibling
-            current_line_indent = child_indent
-
-            while True:
-                # End conditions
-                if self.current().type in (TokenType.EOF, TokenType.ENVELOPE_END):
-                    break
-
-                # Check indentation first to track current line's indent level
-                if self.current().type == TokenType.INDENT:
-                    current_line_indent = self.current().value
-                    if current_line_indent < child_indent:
-                        break  # Dedent, end of section
-                    # Same or deeper level - consume and continue to parse
-                    self.advance()
-                    continue
-
-                # Check for section marker - only break if at shallower indent than children
-                # Nested child sections are at same or deeper indent as other children
-                if self.current().type == TokenType.SECTION:
-                    # If section is at shallower indent than current section's children, it's a sibling
-                    if current_line_indent < child_indent:
-                        break  # Sibling or parent section, end current section
-                    # Otherwise (current_line_indent >= child_indent), it's a nested child section
-                    # Let parse_section handle it by falling through to the parse_section call
-
-                # Skip newlines
-                if self.current().type == TokenType.NEWLINE:
-                    self.advance()
-                    # Reset indent tracking after newline
-                    current_line_indent = 0
-                    continue
-
-                # Parse child
-                child = self.parse_section(child_indent)
-                if child:
-                    children.append(child)
-                else:
-                    # No valid child parsed, might be end of section
-                    break
-
-        return Section(
-            section_id=section_id,
-            key=section_name,
-            annotation=annotation,
-            children=children,
-            line=section_token.line,
-            column=section_token.column,
-        )
+        return section_token, section_id, section_name, annotation
 
     def parse_section(self, base_indent: int) -> Assignment | Block | Section | None:
         """Parse a top-level section (assignment, block, or § section)."""
@@ -360,22 +402,7 @@ class Parser:
             return Assignment(key=key, value=value, line=self.current().line, column=self.current().column)
 
         elif self.current().type == TokenType.BLOCK:
-            block_token = self.current()
-            self.advance()
-
-            # E001: Check if there's a value on the same line as the block operator
-            # This catches "KEY: value" which should be "KEY::value"
-            next_token = self.current()
-            if next_token.type == TokenType.IDENTIFIER and next_token.line == block_token.line:
-                raise ParserError(
-                    f"Single colon assignment detected: '{key}: {next_token.value}'. "
-                    f"OCTAVE REQUIREMENT: Use '{key}::{next_token.value}' (double colon) for assignments. "
-                    "Single colon ':' is reserved for block definitions only.",
-                    block_token,
-                    "E001",
-                )
-
-            self.skip_whitespace()
+            self._parse_block_operator(key)
 
             # Parse block children
             children: list[ASTNode] = []
@@ -384,6 +411,7 @@ class Parser:
             if self.current().type == TokenType.INDENT:
                 child_indent = self.current().value
                 self.advance()
+                self.current_indent = child_indent
 
                 while True:
                     # End conditions
@@ -392,7 +420,8 @@ class Parser:
 
                     # Check indentation
                     if self.current().type == TokenType.INDENT:
-                        if self.current().value < child_indent:
+                        self.current_indent = self.current().value
+                        if self.current_indent < child_indent:
                             break  # Dedent, end of block
                         # Same or deeper level - consume and continue to parse
                         self.advance()
@@ -401,8 +430,13 @@ class Parser:
                     # Skip newlines
                     if self.current().type == TokenType.NEWLINE:
                         self.advance()
+                        self.current_indent = 0
                         continue
 
+                    # A line with no INDENT token starts at column 0: dedent, end of block
+                    if self.current_indent < child_indent:
+                        break
+
                     # Parse child
                     child = self.parse_section(child_indent)
                     if child:
@@ -415,6 +449,29 @@ class Parser:
 
         return None
 
+    def _parse_block_operator(self, key: str) -> None:
+        """Consume the ':' after a block KEY and the whitespace before its children.
+
+        Raises:
+            ParserError: E001 if a value follows on the same line (KEY: value)
+        """
+        block_token = self.current()
+        self.advance()
+
+        # E001: Check if there's a value on the same line as the block operator
+        # This catches "KEY: value" which should be "KEY::value"
+        next_token = self.current()
+        if next_token.type == TokenType.IDENTIFIER and next_token.line == block_token.line:
+            raise ParserError(
+                f"Single colon assignment detected: '{key}: {next_token.value}'. "
+                f"OCTAVE REQUIREMENT: Use '{key}::{next_token.value}' (double colon) for assignments. "
+                "Single colon ':' is reserved for block definitions only.",
+                block_token,
+                "E001",
+            )
+
+        self.skip_whitespace()
+
     def parse_value(self) -> Any:
         """Parse a value (string, number, boolean, null, list)."""
         token = self.current()
@@ -485,8 +542,8 @@ class Parser:
             while self.current().type in (TokenType.NEWLINE, TokenType.INDENT):
                 self.advance()
 
-            # Check for end of list
-            if self.current().type == TokenType.LIST_END:
+            # Check for end of list (an unterminated list fails at expect() below)
+            if self.current().type in (TokenType.LIST_END, TokenType.EOF):
                 break
 
             # Parse item value
@@ -556,11 +613,375 @@ class Parser:
         return "".join(str(p) for p in parts)
 
 
-def parse(content: str | list[Token]) -> Document:
+NodeT = TypeVar("NodeT", bound=Block | Section | events.StartBlock | events.StartSection)
+
+
+@dataclass
+class _OpenContainer(Generic[NodeT]):  # noqa: UP046 - mypy still targets Python 3.11
+    """A block or § section on IterativeParser's stack, still collecting children."""
+
+    node: NodeT
+    child_indent: int
+
+
+class IterativeParser(Parser):
+    """OCTAVE parser that builds nested blocks and § sections with an explicit stack.
+
+    Produces the same AST as Parser, but nesting depth is limited by memory
+    rather than the interpreter recursion limit, and each nested level costs
+    a list push instead of a chain of Python calls. Intended for deeply
+    nested, machine-generated documents.
+    """
+
+    def parse_section(self, base_indent: int) -> Assignment | Block | Section | None:
+        """Parse a top-level section (assignment, block, or § section) without recursion."""
+        stack: list[_OpenContainer[Block | Section]] = []
+        item = self._begin_section()
+
+        while True:
+            if isinstance(item, _OpenContainer):
+                stack.append(item)
+            elif not stack:
+                return item
+            elif item is not None:
+                stack[-1].node.children.append(item)
+            else:
+                # No valid child parsed, end of the enclosing block or section
+                item = self._close(stack.pop())
+                continue
+
+            top = stack[-1]
+            item = self._begin_section() if self._at_child(top) else self._close(stack.pop())
+
+    def _begin_section(self) -> Assignment | Block | Section | _OpenContainer[Block | Section] | None:
+        """Parse the head of a section; blocks and § sections with children are returned open."""
+        if self.current().type == TokenType.SECTION:
+            section_token, section_id, section_name, annotation = self._parse_section_header()
+            section = Section(
+                section_id=section_id,
+                key=section_name,
+                annotation=annotation,
+                children=[],
+                line=section_token.line,
+                column=section_token.column,
+            )
+            return self._open(section)
+
+        if self.current().type != TokenType.IDENTIFIER:
+            return None
+
+        key = self.current().value
+        self.advance()
+
+        # Lenient: allow FLOW (->) as assignment
+        if self.current().type in (TokenType.ASSIGN, TokenType.FLOW):
+            self.advance()
+            value = self.parse_value()
+            return Assignment(key=key, value=value, line=self.current().line, column=self.current().column)
+
+        if self.current().type == TokenType.BLOCK:
+            self._parse_block_operator(key)
+            return self._open(Block(key=key, children=[]))
+
+        return None
+
+    def _open(self, node: Block | Section) -> Block | Section | _OpenContainer[Block | Section]:
+        """Push node if indented children follow, otherwise finish it empty."""
+        if self.current().type != TokenType.INDENT:
+            return self._close(_OpenContainer(node, 0))
+
+        child_indent = self.current().value
+        self.advance()
+        self.current_indent = child_indent
+        return _OpenContainer(node, child_indent)
+
+    def _close(self, container: _OpenContainer[Block | Section]) -> Block | Section:
+        """Finish a container; blocks take the position where their children end, as in Parser."""
+        node = container.node
+        if isinstance(node, Block):
+            node.line = self.current().line
+            node.column = self.current().column
+        return node
+
+    def _at_child(self, container: _OpenContainer[Any]) -> bool:
+        """Skip indentation and newlines inside container; return False at its end."""
+        while True:
+            token = self.current()
+
+            # End conditions
+            if token.type in (TokenType.EOF, TokenType.ENVELOPE_END):
+                return False
+
+            if token.type == TokenType.INDENT:
+                self.current_indent = token.value
+                if token.value < container.child_indent:
+                    return False  # Dedent, end of block or section
+                self.advance()
+                continue
+
+            if token.type == TokenType.NEWLINE:
+                self.advance()
+                self.current_indent = 0
+                continue
+
+            # A line at shallower indent (column 0 has no INDENT token) ends a block;
+            # § sections keep column-0 children and only end at a sibling § marker
+            if self.current_indent < container.child_indent:
+                if token.type == TokenType.SECTION or isinstance(container.node, Block | events.StartBlock):
+                    return False
+
+            return True
+
+
+class _EventParser(IterativeParser):
+    """IterativeParser that reports structure events instead of building nodes.
+
+    Tokens are pulled from an iterator through a small lookahead window, so
+    memory use does not grow with the document.
+    """
+
+    def __init__(self, tokens: Iterable[Token]):
+        """Initialize parser with a token iterable ending in EOF."""
+        super().__init__(())
+        self._stream = iter(tokens)
+        self._window: deque[Token] = deque()
+
+    def current(self) -> Token:
+        """Get current token."""
+        return self.peek(0)
+
+    def peek(self, offset: int = 1) -> Token:
+        """Peek ahead at token."""
+        window = self._window
+        while len(window) <= offset:
+            token = next(self._stream, None)
+            if token is None:
+                return window[-1]  # Return EOF
+            window.append(token)
+        return window[offset]
+
+    def advance(self) -> Token:
+        """Consume and return current token."""
+        token = self.current()
+        if token.type != TokenType.EOF:
+            self._window.popleft()
+        return token
+
+    def parse_events(self) -> Iterator[events.Event]:
+        """Yield the events of a complete document, mirroring parse_document()."""
+        self.skip_whitespace()
+
+        name = "INFERRED"
+        if self.current().type == TokenType.ENVELOPE_START:
+            name = self.advance().value
+            self.skip_whitespace()
+
+        meta = None
+        if self.current().type == TokenType.IDENTIFIER and self.current().value == "META":
+            meta = self.parse_meta_block()
+            self.skip_whitespace()
+
+        has_separator = False
+        if self.current().type == TokenType.SEPARATOR:
+            has_separator = True
+            self.advance()
+            self.skip_whitespace()
+
+        yield events.StartDocument(name=name, has_separator=has_separator)
+        if meta is not None:
+            yield events.Meta(fields=meta)
+
+        while self.current().type != TokenType.ENVELOPE_END and self.current().type != TokenType.EOF:
+            if self.current().type == TokenType.INDENT:
+                self.advance()
+                continue
+
+            produced = yield from self._section_events()
+            if not produced and self.current().type not in (TokenType.ENVELOPE_END, TokenType.EOF):
+                # Consume unexpected token to prevent infinite loop
+                self.advance()
+
+            self.skip_whitespace()
+
+        if self.current().type == TokenType.ENVELOPE_END:
+            self.advance()
+
+        yield events.EndDocument()
+
+    def _section_events(self) -> Generator[events.Event, None, bool]:
+        """Yield the events of one top-level section; return False if there was none."""
+        stack: list[_OpenContainer[events.StartBlock | events.StartSection]] = []
+
+        while True:
+            event = self._begin_event()
+            if event is None:
+                if not stack:
+                    return False
+                # No valid child parsed, end of the enclosing block or section
+                yield self._end_event(stack.pop())
+            else:
+                yield event
+                if not isinstance(event, events.Assignment):
+                    if self.current().type == TokenType.INDENT:
+                        child_indent = self.current().value
+                        self.advance()
+                        self.current_indent = child_indent
+                        stack.append(_OpenContainer(event, child_indent))
+                    else:
+                        yield self._end_event(_OpenContainer(event, 0))
+
+            while stack and not self._at_child(stack[-1]):
+                yield self._end_event(stack.pop())
+            if not stack:
+                return True
+
+    def _begin_event(self) -> events.Assignment | events.StartBlock | events.StartSection | None:
+        """Parse the head of a section into its event, as IterativeParser._begin_section does."""
+        if self.current().type == TokenType.SECTION:
+            section_token, section_id, section_name, annotation = self._parse_section_header()
+            return events.StartSection(
+                section_id=section_id,
+                key=section_name,
+                annotation=annotation,
+                line=section_token.line,
+                column=section_token.column,
+            )
+
+        if self.current().type != TokenType.IDENTIFIER:
+            return None
+
+        key_token = self.advance()
+
+        # Lenient: allow FLOW (->) as assignment
+        if self.current().type in (TokenType.ASSIGN, TokenType.FLOW):
+            self.advance()
+            value = self.parse_value()
+            return events.Assignment(
+                key=key_token.value, value=value, line=self.current().line, column=self.current().column
+            )
+
+        if self.current().type == TokenType.BLOCK:
+            self._parse_block_operator(key_token.value)
+            return events.StartBlock(key=key_token.value, line=key_token.line, column=key_token.column)
+
+        return None
+
+    def _end_event(
+        self, container: _OpenContainer[events.StartBlock | events.StartSection]
+    ) -> events.EndBlock | events.EndSection:
+        """Close a container; blocks end where their children end, as in Parser."""
+        start = container.node
+        if isinstance(start, events.StartSection):
+            return events.EndSection(section_id=start.section_id, key=start.key)
+        return events.EndBlock(key=start.key, line=self.current().line, column=self.current().column)
+
+
+def select_top_level(content: str, only_keys: Collection[str]) -> str:
+    """Blank out top-level blocks and assignments that cannot match only_keys.
+
+    Top-level items are found by scanning for lines that start at column 0,
+    outside strings, brackets and comments, without tokenizing anything. An item is
+    dropped when its key is not in only_keys and none of the keys appears
+    anywhere in its body; items that mention a key are kept whole, so nested
+    matches can still be filtered by the caller. The envelope, META, the
+    separator and everything from the first § section on (whose children may
+    sit at column 0) are always kept.
+
+    Dropped items are replaced by an empty comment and their newlines, so
+    every kept token keeps its line and column, and the parser sees the same
+    structure boundaries.
+
+    Args:
+        content: Raw OCTAVE text
+        only_keys: Top-level keys to keep
+
+    Returns:
+        Text to parse in place of content; content itself if it cannot be
+        split safely (unterminated string, unbalanced brackets, non-NFC text)
+    """
+    if not unicodedata.is_normalized("NFC", content):
+        return content  # Keys may only match after the lexer normalizes them
+
+    starts = [0]
+    depth = 0
+    for match in _TOP_LEVEL_SCAN.finditer(content):
+        char = content[match.start()]
+        if char == "\n":
+            if depth == 0:
+                starts.append(match.end())
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth < 0:
+                return content
+        elif char == '"' and match.end() - match.start() == 1:
+            return content
+    if depth:
+        return content
+    starts.append(len(content))
+
+    # Header items must stay: a comment in their place would be skipped over
+    # while looking for META and the separator
+    first = 0
+    for index, start in enumerate(starts[:-1]):
+        key = _TOP_LEVEL_KEY.match(content, start)
+        if content.startswith("---", start) or (key is not None and key.group(1) == "META"):
+            first = index + 1
+
+    mentions = None
+    if only_keys:
+        alternatives = "|".join(re.escape(key) for key in sorted(only_keys))
+        mentions = re.compile(rf"(?<![A-Za-z0-9_.-])(?:{alternatives})(?![A-Za-z0-9_.-])")
+
+    # § sections extend over the following column-0 lines, wherever they open
+    section = _SECTION_MARKER.search(content)
+    section_at = len(content) if section is None else section.start()
+
+    def ends_open(index: int) -> bool:
+        # A block without children ends at the next token that is not a
+        # comment, so the item after it decides its position
+        return index > 0 and _OPEN_HEADER.search(content, starts[index - 1], starts[index]) is not None
+
+    pieces: list[str] = []
+    kept_from = 0
+    open_header = ends_open(first)
+    for index in range(first, len(starts) - 1):
+        start, end = starts[index], starts[index + 1]
+        if end > section_at:
+            break
+        key = _TOP_LEVEL_KEY.match(content, start)
+        if (
+            open_header
+            or key is None
+            or key.group(1) in only_keys
+            or key.group(1) in _KEYWORDS
+            or (mentions is not None and mentions.search(content, key.end(), end))
+        ):
+            open_header = ends_open(index + 1)
+            continue
+        pieces.append(content[kept_from:start])
+        pieces.append("//" + "\n" * content.count("\n", start, end))
+        kept_from = end
+
+    if not pieces:
+        return content
+    pieces.append(content[kept_from:])
+    return "".join(pieces)
+
+
+def parse(
+    content: str | Sequence[Token], iterative: bool = False, only_keys: Collection[str] | None = None
+) -> Document:
     """Parse OCTAVE content into AST.
 
     Args:
-        content: Raw OCTAVE text (lenient or canonical) or list of tokens
+        content: Raw OCTAVE text (lenient or canonical), list of tokens or TokenBuffer
+        iterative: Use IterativeParser, which builds nesting with an explicit
+            stack instead of recursion (for deeply nested documents)
+        only_keys: For text content, skip top-level blocks and assignments
+            that cannot contain these keys without tokenizing them (see
+            select_top_level); syntax errors inside skipped items go unreported
 
     Returns:
         Document AST
@@ -568,10 +989,124 @@ def parse(content: str | list[Token]) -> Document:
     Raises:
         ParserError: On syntax errors
     """
+    tokens: Sequence[Token]
     if isinstance(content, str):
-        tokens, _ = tokenize(content)
+        if only_keys is not None:
+            content = select_top_level(content, only_keys)
+        tokens, _ = tokenize(content, track_repairs=False)
     else:
         tokens = content
 
-    parser = Parser(tokens)
+    parser = IterativeParser(tokens) if iterative else Parser(tokens)
     return parser.parse_document()
+
+
+def iter_events(content: str | TextIO | Iterable[Token]) -> Iterator[events.Event]:
+    """Parse OCTAVE content into a stream of structure events without building an AST.
+
+    Text is lexed lazily with iter_tokens() and tokens are consumed as they
+    are parsed, so memory stays constant for documents of any size. Nesting
+    is tracked with an explicit stack, as in IterativeParser.
+
+    Args:
+        content: Raw OCTAVE text, a text file object, or tokens (a list,
+            TokenBuffer or iterator ending in EOF)
+
+    Yields:
+        StartDocument, Meta, Assignment, StartBlock/EndBlock,
+        StartSection/EndSection and EndDocument events in document order
+
+    Raises:
+        LexerError: On invalid syntax, when reached
+        ParserError: On syntax errors, when reached
+    """
+    tokens: Iterable[Token]
+    if isinstance(content, str) or hasattr(content, "read"):
+        tokens = iter_tokens(content)  # type: ignore[arg-type]
+    else:
+        tokens = content
+    return _EventParser(tokens).parse_events()
+
+
+@dataclass(frozen=True)
+class DocumentText:
+    """Text of one document in a multi-document stream, with its position there."""
+
+    text: str
+    offset: int = 0  # Offset of text[0] in the stream
+    line: int = 1  # Line of text[0] in the stream (1-based)
+
+    def parse(self) -> Document:
+        """Parse the text, with positions referring to the stream."""
+        return parse(tokenize_buffer(self.text, self.offset, self.line))
+
+
+def split_documents(source: str | TextIO) -> Iterator[DocumentText]:
+    """Split a stream of concatenated ===NAME=== ... ===END=== envelopes.
+
+    Document boundaries are found by a line scan, without lexing: a document
+    ends after an ===END=== line, or before an envelope start line when the
+    current document has no ===END===. Text without any envelope is one
+    document, and trailing blank or comment-only lines are dropped. A
+    multi-line string containing an envelope line on its own would be split
+    there.
+
+    Args:
+        source: Raw OCTAVE text or a text file object
+
+    Yields:
+        The text of each document as soon as its last line has been read
+    """
+    lines = io.StringIO(source) if isinstance(source, str) else source
+    chunk: list[str] = []
+    blank = True  # Chunk holds only blank and comment lines
+    opened = False  # Chunk holds an envelope start line
+    offset = line = 0  # Position of the next line
+    start_offset = start_line = 0  # Position of the chunk
+
+    for text in lines:
+        envelope = _ENVELOPE_LINE.match(text)
+        if envelope is not None and envelope.group(1) != "END" and opened:
+            yield DocumentText("".join(chunk), start_offset, start_line + 1)
+            chunk = []
+            blank, opened = True, False
+            start_offset, start_line = offset, line
+
+        chunk.append(text)
+        offset += len(text)
+        line += 1
+        if envelope is not None:
+            blank = False
+            opened = True
+            if envelope.group(1) == "END":
+                yield DocumentText("".join(chunk), start_offset, start_line + 1)
+                chunk = []
+                blank, opened = True, False
+                start_offset, start_line = offset, line
+        elif blank and _BLANK_LINE.match(text) is None:
+            blank = False
+
+    if not blank:
+        yield DocumentText("".join(chunk), start_offset, start_line + 1)
+
+
+def iter_documents(source: str | TextIO) -> Iterator[Document]:
+    """Parse a stream of concatenated ===NAME=== ... ===END=== envelopes.
+
+    Documents are split with split_documents() and each is parsed on its own
+    as soon as it is complete, so memory is bounded by the largest document
+    rather than the whole stream. Line numbers and offsets refer to the
+    whole stream.
+
+    Args:
+        source: Raw OCTAVE text or a text file object
+
+    Yields:
+        One Document per envelope, in stream order
+
+    Raises:
+        LexerError: On invalid syntax in the document being parsed
+        ParserError: On syntax errors in the document being parsed
+    """
+    for document in split_documents(source):
+        yield document.parse()
@@ -0,0 +1,227 @@
+"""Single-pass OCTAVE processing pipeline.
+
+Lexes content once and derives everything the MCP tools and the CLI need
+from that pass: the token stream, ASCII normalization repairs, the AST and
+the canonical text. Results can be kept in a PipelineCache, so content sent
+again is not lexed and parsed again.
+"""
+
+import hashlib
+import sys
+from collections import OrderedDict
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from octave_mcp.core import binary
+from octave_mcp.core.ast_nodes import Document
+from octave_mcp.core.emitter import emit, export_text_cache, restore_text_cache
+from octave_mcp.core.lexer import TokenBuffer, tokenize_buffer
+from octave_mcp.core.parser import PARSER_VERSION, parse, select_top_level
+
+
+class PipelineError(Exception):
+    """Parse failure after lexing, carrying what the lexing pass produced.
+
+    The message is that of the underlying error, which is also chained as
+    __cause__, so callers can report it unchanged while still returning the
+    normalization repairs found before parsing failed.
+    """
+
+    def __init__(self, error: Exception, tokens: TokenBuffer, repairs: list[dict[str, Any]]):
+        self.error = error
+        self.tokens = tokens
+        self.repairs = repairs
+        super().__init__(str(error))
+
+
+@dataclass
+class _CacheEntry:
+    """Processed content kept by a PipelineCache.
+
+    Tokens are kept in their compact TokenBuffer and the AST encoded (see
+    binary), so every reader gets its own copy. The AST is emitted once,
+    with reuse, before it is encoded; the text that left on its nodes is
+    kept with the canonical text and restored on readers' copies, so
+    emitting them after a few changes is incremental.
+    """
+
+    tokens: TokenBuffer
+    repairs: list[dict[str, Any]]
+    snapshot: bytes
+    canonical: str
+    texts: list[tuple[int, str] | None]
+    size: int = 0  # footprint(), as weighed by the cache
+
+    def footprint(self) -> int:
+        """Approximate memory held by the entry: snapshot, tokens, repairs, canonical and cached text."""
+        size = len(self.snapshot) + len(self.tokens.source) + self.tokens.nbytes
+        size += sum(sys.getsizeof(repair) for repair in self.repairs)
+        size += len(self.canonical)
+        size += sum(len(text[1]) for text in self.texts if text is not None)
+        return size
+
+    def decode(self) -> Document:
+        """Return a new copy of the cached AST, with its emitted text restored."""
+        doc = binary.loads(self.snapshot)
+        restore_text_cache(doc, self.texts)
+        return doc
+
+
+@dataclass
+class PipelineResult:
+    """Result of processing OCTAVE content.
+
+    canonical is emitted from the freshly parsed AST while the content is
+    processed, so it is the canonical form of the content whatever callers
+    later do to doc, and the same whether or not the result came from a
+    cache. That emission keeps text on the AST's blocks and sections, so
+    emitting with_values() copies of doc with reuse renders only the
+    changed subtrees. Results served from a PipelineCache decode their own
+    AST on first access, so callers may modify doc; their tokens are shared
+    with the cache.
+    """
+
+    tokens: TokenBuffer
+    repairs: list[dict[str, Any]]  # Normalization repairs: {type, original, normalized, line, column}
+    canonical: str  # Canonical OCTAVE text of the content
+    _doc: Document | None = field(default=None, repr=False)
+    _entry: _CacheEntry | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def doc(self) -> Document:
+        """AST of the content."""
+        if self._doc is None:
+            # Only results served from a cache start without an AST
+            self._doc = cast(_CacheEntry, self._entry).decode()
+        return self._doc
+
+
+class PipelineCache:
+    """Bounded LRU cache of processing results, keyed by content hash.
+
+    Keys are the SHA-256 of the content, the only_keys selection and
+    PARSER_VERSION. Entries are weighed by what they hold: the encoded AST,
+    the token buffer and its source text, the repairs, the canonical text
+    and the text kept for incremental emission (characters counted as
+    bytes). The least recently used are evicted once max_bytes is exceeded.
+    Parse failures are not cached.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        """Create an empty cache.
+
+        Args:
+            max_bytes: Total size of the entries to keep, in bytes
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current occupancy."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self.size}
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.size = self.hits = self.misses = 0
+
+    def process(self, content: str, only_keys: Collection[str] | None = None) -> PipelineResult:
+        """Return the cached result for content, processing it on a miss.
+
+        Args:
+            content: Raw OCTAVE text (lenient or canonical)
+            only_keys: As for process()
+
+        Returns:
+            PipelineResult, with an AST of its own and its canonical text
+
+        Raises:
+            LexerError: On invalid syntax while tokenizing
+            PipelineError: If parsing fails
+        """
+        data = content.encode("utf-8")
+        key = self._key(data, only_keys)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            repairs = [dict(repair) for repair in entry.repairs]
+            return PipelineResult(entry.tokens, repairs, entry.canonical, _entry=entry)
+
+        self.misses += 1
+        result = _process(content, only_keys)
+        # Snapshot before the caller can modify the AST, with the text its emission left on it
+        doc = result.doc
+        repairs = [dict(repair) for repair in result.repairs]
+        entry = _CacheEntry(result.tokens, repairs, binary.dumps(doc), result.canonical, export_text_cache(doc))
+        entry.size = entry.footprint()
+        if entry.size <= self.max_bytes:
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+        return result
+
+    @staticmethod
+    def _key(data: bytes, only_keys: Collection[str] | None) -> str:
+        """Hash content, key selection and parser version into a cache key."""
+        digest = hashlib.sha256(PARSER_VERSION.encode("utf-8"))
+        if only_keys is not None:
+            digest.update("\0".join(["", *sorted(only_keys), ""]).encode("utf-8"))
+        digest.update(b"\1")
+        digest.update(data)
+        return digest.hexdigest()
+
+
+# Shared by the MCP tools, so content sent to several tools is parsed once
+PIPELINE_CACHE = PipelineCache()
+
+
+def process(
+    content: str, only_keys: Collection[str] | None = None, cache: PipelineCache | None = None
+) -> PipelineResult:
+    """Tokenize, parse and normalize OCTAVE content in one lexing pass.
+
+    Args:
+        content: Raw OCTAVE text (lenient or canonical)
+        only_keys: Skip top-level items that cannot contain these keys before
+            lexing (see parser.select_top_level); tokens and repairs then
+            cover only the kept text
+        cache: Reuse and keep results in this cache
+
+    Returns:
+        PipelineResult with tokens, repairs, AST and canonical text
+
+    Raises:
+        LexerError: On invalid syntax while tokenizing
+        PipelineError: If parsing fails; wraps the parser's error
+    """
+    if cache is not None:
+        return cache.process(content, only_keys)
+    return _process(content, only_keys)
+
+
+def _process(content: str, only_keys: Collection[str] | None) -> PipelineResult:
+    """Run the pipeline without a cache."""
+    if only_keys is not None:
+        content = select_top_level(content, only_keys)
+    buffer = tokenize_buffer(content)
+    repairs = buffer.repairs()
+
+    try:
+        # The parser indexes tokens repeatedly: materialize them once for it
+        doc = parse(list(buffer))
+    except Exception as e:
+        raise PipelineError(e, buffer, repairs) from e
+
+    # Emit before anyone can modify the AST; with reuse, so its subtree text stays on it
+    canonical = emit(doc, reuse=True)
+    return PipelineResult(tokens=buffer, repairs=repairs, canonical=canonical, _doc=doc)
@@ -12,6 +12,12 @@ from dataclasses import dataclass, replace
 from octave_mcp.core.ast_nodes import Assignment, Block, Document
 from octave_mcp.core.emitter import emit
 
+# Top-level fields kept by each lossy projection mode
+PROJECTION_KEEP: dict[str, list[str]] = {
+    "executive": ["STATUS", "RISKS", "DECISIONS"],
+    "developer": ["TESTS", "CI", "DEPS"],
+}
+
 
 @dataclass
 class ProjectionResult:
@@ -39,12 +45,14 @@ def _filter_fields(doc: Document, keep: list[str]) -> Document:
     """
     keep_set = set(keep)
 
-    def filter_recursively(nodes: list, apply_filter: bool = True) -> list:
-        """Recursively process nodes.
+    def filter_recursively(nodes: list) -> list:
+        """Recursively filter nodes against keep_set.
+
+        Kept nodes are shared with doc, not copied; only the Blocks on the
+        way to a kept node nested under a non-kept one are copied.
 
         Args:
             nodes: List of nodes to process
-            apply_filter: If True, filter against keep_set; if False, keep all
 
         Returns:
             Filtered list of nodes
@@ -52,37 +60,22 @@ def _filter_fields(doc: Document, keep: list[str]) -> Document:
         filtered: list = []
         for node in nodes:
             if isinstance(node, Assignment | Block):
-                if apply_filter:
-                    # Top-level filtering: check if this node's key is in keep set
-                    if node.key in keep_set:
-                        # Keep this node with ALL descendants (no filtering on children)
-                        if isinstance(node, Block):
-                            # Preserve all children without filtering
-                            preserved_children = filter_recursively(node.children, apply_filter=False)
-                            filtered.append(replace(node, children=preserved_children))
-                        else:
-                            filtered.append(node)
-                    else:
-                        # Node key not in keep set - check children recursively
-                        # (handles case where kept field is nested under non-kept field)
-                        if isinstance(node, Block):
-                            filtered_children = filter_recursively(node.children, apply_filter=True)
-                            # Only include this node if it has children that were kept
-                            if filtered_children:
-                                filtered.append(replace(node, children=filtered_children))
-                else:
-                    # No filtering - preserve everything
-                    if isinstance(node, Block):
-                        preserved_children = filter_recursively(node.children, apply_filter=False)
-                        filtered.append(replace(node, children=preserved_children))
-                    else:
-                        filtered.append(node)
+                if node.key in keep_set:
+                    # Keep this node with ALL descendants (no filtering on children)
+                    filtered.append(node)
+                elif isinstance(node, Block):
+                    # Node key not in keep set - check children recursively
+                    # (handles case where kept field is nested under non-kept field)
+                    filtered_children = filter_recursively(node.children)
+                    # Only include this node if it has children that were kept
+                    if filtered_children:
+                        filtered.append(replace(node, children=filtered_children))
             else:
                 # Keep other node types (comments, etc.)
                 filtered.append(node)
         return filtered
 
-    filtered_sections = filter_recursively(doc.sections, apply_filter=True)
+    filtered_sections = filter_recursively(doc.sections)
     return replace(doc, sections=filtered_sections)
 
 
@@ -108,7 +101,7 @@ def project(doc: Document, mode: str = "canonical") -> ProjectionResult:
 
     elif mode == "executive":
         # Executive view: STATUS, RISKS, DECISIONS only
-        filtered_doc = _filter_fields(doc, keep=["STATUS", "RISKS", "DECISIONS"])
+        filtered_doc = _filter_fields(doc, keep=PROJECTION_KEEP["executive"])
         output = emit(filtered_doc)
         return ProjectionResult(
             output=output, lossy=True, fields_omitted=["TESTS", "CI", "DEPS"], filtered_doc=filtered_doc
@@ -116,7 +109,7 @@ def project(doc: Document, mode: str = "canonical") -> ProjectionResult:
 
     elif mode == "developer":
         # Developer view: TESTS, CI, DEPS only
-        filtered_doc = _filter_fields(doc, keep=["TESTS", "CI", "DEPS"])
+        filtered_doc = _filter_fields(doc, keep=PROJECTION_KEEP["developer"])
         output = emit(filtered_doc)
         return ProjectionResult(
             output=output, lossy=True, fields_omitted=["STATUS", "RISKS", "DECISIONS"], filtered_doc=filtered_doc
@@ -9,11 +9,13 @@ Validates AST against schema definitions with:
 - Constraint chain evaluation
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 from octave_mcp.core.ast_nodes import ASTNode, Document
 from octave_mcp.core.constraints import EnumConstraint
+from octave_mcp.core.events import Event, Meta
 
 
 @dataclass
@@ -56,6 +58,28 @@ class Validator:
 
         return self.errors
 
+    def validate_events(self, events: Iterable[Event], strict: bool = False) -> list[ValidationError]:
+        """Validate a document from its parser.iter_events() stream.
+
+        Gives the same errors as validate() on the parsed Document without
+        building it, so arbitrarily large documents validate in constant memory.
+        The whole stream is consumed, so syntax errors anywhere still surface.
+
+        Args:
+            events: Structure events of one document
+            strict: If True, reject unknown fields
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        self.errors = []
+
+        for event in events:
+            if isinstance(event, Meta) and "META" in self.schema and event.fields:
+                self._validate_meta(event.fields, strict)
+
+        return self.errors
+
     def _validate_meta(self, meta: dict[str, Any], strict: bool) -> None:
         """Validate META block."""
         schema_meta = self.schema.get("META", {})
@@ -187,3 +211,20 @@ def validate(doc: Document, schema: dict[str, Any] | None = None, strict: bool =
     """
     validator = Validator(schema)
     return validator.validate(doc, strict)
+
+
+def validate_events(
+    events: Iterable[Event], schema: dict[str, Any] | None = None, strict: bool = False
+) -> list[ValidationError]:
+    """Validate a document streamed as parser events against schema.
+
+    Args:
+        events: Structure events from parser.iter_events()
+        schema: Schema definition (optional)
+        strict: Reject unknown fields if True
+
+    Returns:
+        List of validation errors
+    """
+    validator = Validator(schema)
+    return validator.validate_events(events, strict)
@@ -9,13 +9,13 @@ Implements octave_amend tool for updating existing OCTAVE files with:
 """
 
 import hashlib
+from dataclasses import replace
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
-from octave_mcp.core.ast_nodes import Assignment
+from octave_mcp.core.ast_nodes import Assignment, Document
 from octave_mcp.core.emitter import emit
-from octave_mcp.core.lexer import tokenize
-from octave_mcp.core.parser import parse
+from octave_mcp.core.pipeline import PIPELINE_CACHE, process
 from octave_mcp.mcp.base_tool import BaseTool, SchemaBuilder
 
 
@@ -47,7 +47,7 @@ class AmendTool(BaseTool):
             "changes",
             "object",
             required=True,
-            description="Field updates to apply (e.g., {KEY: 'new_value', TIMEOUT: 60})",
+            description="Field updates to apply by dotted path (e.g., {KEY: 'new_value', CONFIG.TIMEOUT: 60})",
         )
 
         schema.add_parameter(
@@ -143,29 +143,70 @@ class AmendTool(BaseTool):
 
         return corrections
 
-    def _apply_changes(self, doc: Any, changes: dict[str, Any]) -> Any:
+    def _check_changes(self, doc: Document, changes: dict[str, Any]) -> list[dict[str, Any]]:
+        """Check that every change names exactly one field of the document.
+
+        Args:
+            doc: Parsed AST document
+            changes: Dictionary of field updates, keyed by dotted path
+
+        Returns:
+            One E_APPLY error per path that names no node, a block or
+            section, or nodes under keys split differently (a key containing
+            "." and a nested path); empty if all changes can be applied
+        """
+        errors = []
+        index = doc.index  # Built once, then O(1) per change
+        for path in changes:
+            node = index.get(path)
+            # I3 FIX: Use isinstance to avoid matching Block nodes
+            # Block nodes also have a path but shouldn't be updated as assignments
+            if node is None:
+                message = f"No field at path '{path}'"
+            elif not isinstance(node, Assignment):
+                message = f"Path '{path}' names a {type(node).__name__}, not a field"
+            elif index.ambiguous(path):
+                message = f"Path '{path}' is ambiguous: it matches both a key containing '.' and a nested path"
+            else:
+                continue
+            errors.append({"code": "E_APPLY", "message": message})
+        return errors
+
+    def _changed_fields(self, doc: Document, changes: dict[str, Any]) -> list[str]:
+        """Return the paths of changes that alter their field's canonical form.
+
+        A field is unchanged when its digest is the same with the new value,
+        e.g. when a change restates the current value.
+
+        Args:
+            doc: Parsed AST document
+            changes: Dictionary of field updates, each naming a field (see _check_changes())
+
+        Returns:
+            Paths of the changes to apply, in the order given
+        """
+        index = doc.index
+        changed = []
+        for path, value in changes.items():
+            assignment = cast(Assignment, index[path])
+            if replace(assignment, value=value).digest != assignment.digest:
+                changed.append(path)
+        return changed
+
+    def _apply_changes(self, doc: Document, changes: dict[str, Any]) -> Document:
         """Apply changes to AST document.
 
         Args:
             doc: Parsed AST document
-            changes: Dictionary of field updates
+            changes: Dictionary of field updates, keyed by dotted path
+                (e.g. "KEY" or "BLOCK.CHILD.KEY", see Document.index),
+                each naming a field (see _check_changes())
 
         Returns:
-            Modified document
+            Updated copy of the document; only the changed assignments and
+            their ancestors are copied, the rest is shared with doc
         """
-        # Simple implementation: update top-level sections
-        # For each change, find matching section and update value
-        for key, new_value in changes.items():
-            # Find section with matching key
-            for section in doc.sections:
-                # I3 FIX: Use isinstance instead of hasattr to avoid matching Block nodes
-                # Block nodes also have 'key' attribute but shouldn't be updated as assignments
-                if isinstance(section, Assignment) and section.key == key:
-                    # Update the value
-                    section.value = new_value
-                    break
-
-        return doc
+        return doc.with_values(changes)
 
     def _generate_diff(self, original: str, canonical: str) -> str:
         """Generate compact diff between original and canonical.
@@ -254,11 +295,10 @@ class AmendTool(BaseTool):
                     ],
                 }
 
-        # STEP 5: Parse existing content
-        tokenize_repairs: list[dict[str, Any]] = []  # Initialize to preserve on error path
+        # STEP 5: Parse existing content (single lexing pass)
         try:
-            # Parse to AST
-            doc = parse(original_content)
+            processed = process(original_content, cache=PIPELINE_CACHE)
+            doc = processed.doc
 
         except Exception as e:
             return {
@@ -266,30 +306,31 @@ class AmendTool(BaseTool):
                 "errors": [{"code": "E_PARSE", "message": f"Parse error: {str(e)}"}],
             }
 
-        # STEP 6: Apply changes to AST
+        # STEP 6: Apply changes to AST (unknown, block and ambiguous paths fail the whole amend)
         try:
-            doc = self._apply_changes(doc, changes)
+            apply_errors = self._check_changes(doc, changes)
+            if apply_errors:
+                return {"status": "error", "errors": apply_errors}
+            changed = self._changed_fields(doc, changes)
+            doc = self._apply_changes(doc, {path: changes[path] for path in changed})
         except Exception as e:
             return {
                 "status": "error",
                 "errors": [{"code": "E_APPLY", "message": f"Apply changes error: {str(e)}"}],
             }
 
-        # STEP 7: Emit canonical form
+        # STEP 7: Emit canonical form (the pipeline's text is current unless a field changed);
+        # with_values() copied only the changed spine, so the rest reuses its emitted text
         try:
-            canonical_content = emit(doc)
+            canonical_content = emit(doc, reuse=True) if changed else processed.canonical
         except Exception as e:
             return {
                 "status": "error",
                 "errors": [{"code": "E_EMIT", "message": f"Emit error: {str(e)}"}],
             }
 
-        # STEP 8: Tokenize canonical for repair tracking
-        try:
-            _, tokenize_repairs = tokenize(canonical_content)
-        except Exception:
-            # Non-fatal - just skip repair tracking
-            pass
+        # STEP 8: Normalization repairs for correction tracking (from the same lexing pass)
+        tokenize_repairs = processed.repairs
 
         # STEP 9: Track corrections
         corrections = self._track_corrections(original_content, canonical_content, tokenize_repairs)
@@ -13,9 +13,7 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-from octave_mcp.core.emitter import emit
-from octave_mcp.core.lexer import tokenize
-from octave_mcp.core.parser import parse
+from octave_mcp.core.pipeline import PIPELINE_CACHE, PipelineError, process
 from octave_mcp.mcp.base_tool import BaseTool, SchemaBuilder
 
 
@@ -229,16 +227,16 @@ class CreateTool(BaseTool):
         # STEP 2: Parse and normalize content
         tokenize_repairs: list[dict[str, Any]] = []  # Initialize to preserve on error path
         try:
-            # Tokenize with repairs
-            tokens, tokenize_repairs = tokenize(content)
-
-            # Parse to AST
-            doc = parse(content)
+            # Tokenize with repairs and parse to AST in one lexing pass
+            processed = process(content, cache=PIPELINE_CACHE)
+            tokenize_repairs = processed.repairs
 
             # Emit canonical form
-            canonical_content = emit(doc)
+            canonical_content = processed.canonical
 
         except Exception as e:
+            if isinstance(e, PipelineError):
+                tokenize_repairs = e.repairs
             # Track corrections even on parse error (learning feedback)
             corrections = self._track_corrections(content, content, tokenize_repairs)
             return {
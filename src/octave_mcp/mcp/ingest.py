@@ -7,8 +7,7 @@ PREPARSE→PARSE→NORMALIZE→VALIDATE→REPAIR(if fix)→VALIDATE
 from typing import Any
 
 from octave_mcp.core.emitter import emit
-from octave_mcp.core.lexer import tokenize
-from octave_mcp.core.parser import parse
+from octave_mcp.core.pipeline import PIPELINE_CACHE, PipelineError, process
 from octave_mcp.core.repair import repair
 from octave_mcp.core.validator import Validator
 from octave_mcp.mcp.base_tool import BaseTool, SchemaBuilder
@@ -102,25 +101,19 @@ class IngestTool(BaseTool):
         # Track pipeline stages if verbose
         stages: dict[str, Any] = {}
 
-        # STAGE 1: PREPARSE (tokenization with ASCII normalization)
+        # STAGES 1-2: PREPARSE + PARSE in a single lexing pass
         if verbose:
             stages["PREPARSE"] = "Tokenizing with ASCII normalization"
 
-        tokens, tokenize_repairs = tokenize(content)
-
-        if verbose:
-            stages["TOKENIZE_COMPLETE"] = f"{len(tokens)} tokens produced"
-
-        # Track normalization repairs from tokenization
-        result["repairs"].extend(tokenize_repairs)
-
-        # STAGE 2: PARSE (build AST with envelope inference)
-        if verbose:
-            stages["PARSE"] = "Building AST with envelope inference"
-
         try:
-            doc = parse(content)  # Uses tokenize internally
-        except Exception as e:
+            processed = process(content, cache=PIPELINE_CACHE)
+        except PipelineError as e:
+            # Track normalization repairs from tokenization
+            result["repairs"].extend(e.repairs)
+            if verbose:
+                stages["TOKENIZE_COMPLETE"] = f"{len(e.tokens)} tokens produced"
+                stages["PARSE"] = "Building AST with envelope inference"
+
             # If parsing fails, return error in warnings
             result["warnings"].append({"code": "E001", "message": f"Parse error: {str(e)}"})
             # Return minimal canonical form
@@ -129,7 +122,13 @@ class IngestTool(BaseTool):
                 result["stages"] = stages
             return result
 
+        # Track normalization repairs from tokenization
+        result["repairs"].extend(processed.repairs)
+        doc = processed.doc
+
         if verbose:
+            stages["TOKENIZE_COMPLETE"] = f"{len(processed.tokens)} tokens produced"
+            stages["PARSE"] = "Building AST with envelope inference"
             stages["PARSE_COMPLETE"] = "AST built successfully"
 
         # STAGE 3: NORMALIZE (whitespace, quotes - already done in parser)
@@ -161,12 +160,14 @@ class IngestTool(BaseTool):
             stages["VALIDATE_COMPLETE"] = f"{len(validation_errors)} validation errors"
 
         # STAGE 5: REPAIR (if fix=true)
+        repaired = False
         if fix:
             if verbose:
                 stages["REPAIR"] = "Applying TIER_REPAIR fixes"
 
             doc, repair_log = repair(doc, validation_errors, fix=True)
             result["repairs"].extend(repair_log.repairs)
+            repaired = bool(repair_log.repairs) or doc is not processed.doc
 
             if verbose:
                 stages["REPAIR_COMPLETE"] = f"{len(repair_log.repairs)} repairs applied"
@@ -196,7 +197,8 @@ class IngestTool(BaseTool):
         if verbose:
             stages["EMIT"] = "Emitting canonical OCTAVE"
 
-        canonical_output = emit(doc)
+        # Reuse the pipeline's canonical text unless repairs changed the AST
+        canonical_output = emit(doc) if repaired else processed.canonical
         result["canonical"] = canonical_output
 
         if verbose:
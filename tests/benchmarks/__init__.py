@@ -0,0 +1 @@
+"""Benchmarks for the OCTAVE core pipeline."""
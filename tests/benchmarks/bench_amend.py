@@ -0,0 +1,67 @@
+"""Amend lookup benchmark.
+
+Applies 500 changes to nested fields of a synthetic document, resolving
+each dotted path with the Document path index (as AmendTool does) and, for
+comparison, with a full tree walk per change. The index is built once per
+document, so its cost is reported separately.
+
+Usage:
+    python -m tests.benchmarks.bench_amend [--repeat N] [--sections N] [--changes N]
+"""
+
+import argparse
+import time
+from typing import Any
+
+from octave_mcp.core.ast_nodes import Assignment, ASTNode, Block, Document, PathIndex, Section
+from octave_mcp.core.parser import parse
+from octave_mcp.mcp.amend import AmendTool
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document
+
+
+def walk_lookup(doc: Document, path: str) -> ASTNode | None:
+    """Find the node at path by walking the whole tree (the per-change scan the index replaces)."""
+    stack: list[tuple[str, ASTNode]] = [("", node) for node in reversed(doc.sections)]
+    while stack:
+        prefix, node = stack.pop()
+        if not isinstance(node, Assignment | Block | Section):
+            continue
+        node_path = prefix + node.key
+        if node_path == path:
+            return node
+        if isinstance(node, Block | Section):
+            stack.extend((node_path + ".", child) for child in reversed(node.children))
+    return None
+
+
+def main() -> None:
+    """Run the amend benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best of N)")
+    parser.add_argument("--sections", type=int, default=500, help="Top-level blocks in the document")
+    parser.add_argument("--changes", type=int, default=500, help="Nested fields to change")
+    args = parser.parse_args()
+
+    # Five fields per block: the sixth kind carries a trailing comment, which ends a block
+    doc = parse(generate_document(sections=args.sections, fields=5))
+    paths = [f"BLOCK_{index}.BLOCK_{index}_CHILD.COUNT_1" for index in range(args.changes)]
+    changes: dict[str, Any] = dict.fromkeys(paths, 0)
+    assert all(walk_lookup(doc, path) is doc.index[path] for path in paths[:10])
+
+    tool = AmendTool()
+    build = measure(lambda _: PathIndex(doc), [""], args.repeat)
+    indexed = measure(lambda _: tool._apply_changes(doc, changes), [""], args.repeat)
+    start = time.perf_counter()
+    for path in paths:
+        walk_lookup(doc, path)
+    walked = time.perf_counter() - start
+
+    print(f"{args.changes} changes, {len(doc.index)} indexed nodes:")
+    print(f"  index build:     {build * 1000:9.2f} ms")
+    print(f"  indexed apply:   {indexed * 1000:9.2f} ms")
+    print(f"  tree walk:       {walked * 1000:9.2f} ms  ({walked / (build + indexed):.0f}x index build + apply)")
+
+
+if __name__ == "__main__":
+    main()
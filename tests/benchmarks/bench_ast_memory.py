@@ -0,0 +1,60 @@
+"""AST memory footprint benchmark.
+
+Measures with tracemalloc the memory held by the Document that parse()
+returns for the largest fixtures and for synthetic documents, against the
+same tree rebuilt from the original dict-backed dataclass nodes with
+unshared key strings (tests/benchmarks/legacy_ast.py).
+
+Usage:
+    python -m tests.benchmarks.bench_ast_memory [--sections N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from octave_mcp.core.parser import parse
+from tests.benchmarks.corpus import generate_document, load_fixture_corpus
+from tests.benchmarks.legacy_ast import to_legacy
+
+
+def retained(build: Callable[[], Any]) -> int:
+    """Return the bytes still allocated by build() once it has returned."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def report(label: str, content: str) -> None:
+    """Print the footprint of the slotted and the legacy AST of content."""
+    parse(content)  # Warm up compiled patterns and caches outside tracing
+    slotted = retained(lambda: parse(content))
+    legacy = retained(lambda: to_legacy(parse(content)))
+    print(f"  {label:<28} {legacy / 1024:10.1f} KiB  {slotted / 1024:10.1f} KiB  ({legacy / slotted:.2f}x)")
+
+
+def main() -> None:
+    """Run the AST memory benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sections", type=int, default=2000, help="Top-level blocks in the synthetic document")
+    args = parser.parse_args()
+
+    print(f"  {'document':<28} {'dataclass':>14}  {'slotted':>14}")
+    fixtures = sorted(load_fixture_corpus().items(), key=lambda item: len(item[1]), reverse=True)
+    for name, content in fixtures[:3]:
+        report(name, content)
+    report(f"synthetic ({args.sections} blocks)", generate_document(sections=args.sections))
+    report("synthetic (wide, depth 0)", generate_document(sections=args.sections * 5, fields=2, depth=0))
+
+
+if __name__ == "__main__":
+    main()
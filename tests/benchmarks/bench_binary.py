@@ -0,0 +1,75 @@
+"""Binary AST encoding benchmark.
+
+Compares loading a document from its binary encoding (from bytes and from
+an mmap of an encoded file) with parsing its text again and with
+unpickling it, and reports encoded sizes, for the fixture corpus and a
+large synthetic document.
+
+Usage:
+    python -m tests.benchmarks.bench_binary [--repeat N] [--sections N]
+"""
+
+import argparse
+import mmap
+import pickle
+import tempfile
+from pathlib import Path
+
+from octave_mcp.core import binary
+from octave_mcp.core.parser import parse
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document, load_fixture_corpus
+
+
+def main() -> None:
+    """Run the binary encoding benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best of N)")
+    parser.add_argument("--sections", type=int, default=2000, help="Top-level blocks in the synthetic document")
+    args = parser.parse_args()
+
+    corpus = load_fixture_corpus()
+    texts = list(corpus.values())
+    docs = [parse(text) for text in texts]
+    encoded = [binary.dumps(doc) for doc in docs]
+    pickled = [pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL) for doc in docs]
+    if [binary.loads(data) for data in encoded] != docs:
+        raise SystemExit("binary round trip differs from the parsed documents")
+
+    parsed = measure(parse, texts, args.repeat)
+    loaded = measure(binary.loads, encoded, args.repeat)
+    unpickled = measure(pickle.loads, pickled, args.repeat)
+    print(f"fixtures ({len(texts)} files):")
+    print(f"  parse:        {parsed * 1000:9.3f} ms")
+    print(f"  binary.loads: {loaded * 1000:9.3f} ms  ({parsed / loaded:.1f}x)")
+    print(f"  pickle.loads: {unpickled * 1000:9.3f} ms")
+
+    text = generate_document(sections=args.sections)
+    doc = parse(text)
+    data = binary.dumps(doc)
+    pickled_doc = pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL)
+    parsed = measure(parse, [text], 1)
+    loaded = measure(binary.loads, [data], args.repeat)
+    unpickled = measure(pickle.loads, [pickled_doc], args.repeat)
+    dumped = measure(binary.dumps, [doc], args.repeat)
+    pickling = measure(lambda d: pickle.dumps(d, protocol=pickle.HIGHEST_PROTOCOL), [doc], args.repeat)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "doc.octb"
+        path.write_bytes(data)
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            mapped_load = measure(binary.loads, [mapped], args.repeat)
+
+    print(f"synthetic ({args.sections} blocks):")
+    print(
+        f"  sizes:        text {len(text.encode()) / 1e6:.2f} MB, binary {len(data) / 1e6:.2f} MB, pickle {len(pickled_doc) / 1e6:.2f} MB"
+    )
+    print(f"  parse:        {parsed * 1000:9.2f} ms")
+    print(f"  binary.loads: {loaded * 1000:9.2f} ms  ({parsed / loaded:.1f}x)")
+    print(f"  mmap loads:   {mapped_load * 1000:9.2f} ms  ({parsed / mapped_load:.1f}x)")
+    print(f"  pickle.loads: {unpickled * 1000:9.2f} ms")
+    print(f"  binary.dumps: {dumped * 1000:9.2f} ms")
+    print(f"  pickle.dumps: {pickling * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Change detection benchmark for node digests.
+
+Hashes a large synthetic document, updates one nested field with
+Document.with_value, and checks whether the two versions differ: by
+finding the changed paths (hashing only the subtrees the update copied),
+by checking the updated field's digest (as AmendTool does), and, for
+comparison, by emitting and comparing both documents' canonical text.
+
+Usage:
+    python -m tests.benchmarks.bench_digests [--repeat N] [--sections N]
+"""
+
+import argparse
+from dataclasses import replace
+
+from octave_mcp.core.emitter import emit
+from octave_mcp.core.parser import parse
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document
+
+
+def main() -> None:
+    """Run the digest benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best of N)")
+    parser.add_argument("--sections", type=int, default=5000, help="Top-level blocks in the document")
+    args = parser.parse_args()
+
+    # Five fields per block: the sixth kind carries a trailing comment, which ends a block
+    doc = parse(generate_document(sections=args.sections, fields=5))
+    path = f"BLOCK_{args.sections // 2}.BLOCK_{args.sections // 2}_CHILD.COUNT_1"
+
+    full = measure(lambda _: doc.digest, [""], args.repeat)
+    updated = doc.with_value(path, -1)
+    paths = measure(lambda _: doc.changed_paths(updated), [""], args.repeat)
+    if doc.changed_paths(updated) != [path]:
+        raise SystemExit("changed_paths did not find the update")
+    field = doc.index[path]
+    checked = measure(lambda _: replace(field, value=-1).digest != field.digest, [""], args.repeat)
+    emitted = measure(lambda _: emit(doc) != emit(updated), [""], args.repeat)
+
+    print(f"synthetic ({args.sections} blocks) with one field changed:")
+    print(f"  full digest:     {full * 1000:9.3f} ms")
+    print(f"  changed_paths:   {paths * 1000:9.3f} ms")
+    print(f"  field digest:    {checked * 1000:9.3f} ms")
+    print(f"  emit + compare:  {emitted * 1000:9.3f} ms  ({emitted / paths:.0f}x changed_paths)")
+
+
+if __name__ == "__main__":
+    main()
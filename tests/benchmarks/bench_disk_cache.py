@@ -0,0 +1,55 @@
+"""On-disk parse cache benchmark.
+
+Validates a directory of generated OCTAVE files the way the CLI does: without
+a cache, then with an empty DiskCache (parsing and writing every entry), then
+with a new DiskCache over the filled directory, as after a restart.
+
+Usage:
+    python -m tests.benchmarks.bench_disk_cache [--files N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from octave_mcp.core.disk_cache import DiskCache
+from octave_mcp.core.lexer import tokenize_file
+from octave_mcp.core.parser import iter_events
+from octave_mcp.core.validator import validate, validate_events
+from tests.benchmarks.corpus import generate_document
+
+
+def main() -> None:
+    """Run the disk cache benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000, help="Number of files")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index in range(args.files):
+            path = Path(directory) / "specs" / f"doc_{index}.oct.md"
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(generate_document(sections=3, fields=8, depth=1, name=f"DOC_{index}"), encoding="utf-8")
+            paths.append(path)
+        cache_dir = Path(directory) / "cache"
+
+        def run(label: str, check) -> None:
+            start = time.perf_counter()
+            for path in paths:
+                check(path)
+            print(f"  {label:<22} {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+        size = sum(path.stat().st_size for path in paths) / 1e6
+        print(f"{args.files} files, {size:.1f} MB:")
+        run("no cache", lambda path: validate_events(iter_events(tokenize_file(path))))
+        cold = DiskCache(cache_dir)
+        run("empty cache", lambda path: validate(cold.parse_file(path)))
+        warm = DiskCache(cache_dir)
+        run("warm cache (restart)", lambda path: validate(warm.parse_file(path)))
+        print(f"  warm hits: {warm.hits}, misses: {warm.misses}")
+
+
+if __name__ == "__main__":
+    main()
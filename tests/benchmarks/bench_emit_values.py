@@ -0,0 +1,74 @@
+"""Value emission benchmark.
+
+Emits a value-heavy synthetic document, where a few enum-like values,
+quoted strings and lists repeat across many assignments, with emit_value()
+and emit(), against the original emitter (tests/benchmarks/legacy_emitter.py).
+
+Usage:
+    python -m tests.benchmarks.bench_emit_values [--repeat N] [--fields N]
+"""
+
+import argparse
+from typing import Any
+
+from octave_mcp.core.ast_nodes import Assignment, Block, Document, InlineMap, ListValue
+from octave_mcp.core.emitter import emit, emit_value
+from tests.benchmarks import legacy_emitter
+from tests.benchmarks.bench_lexer import measure
+
+STATUSES = ["ACTIVE", "PENDING", "DONE", "BLOCKED", "true", "needs review", 'say "hi"', "path\\to\\file"]
+
+
+def value_heavy_document(fields: int) -> Document:
+    """Build a document of blocks whose assignments repeat a small set of values."""
+    values: list[Any] = []
+    for index in range(fields):
+        kind = index % 6
+        if kind < 3:
+            values.append(STATUSES[index % len(STATUSES)])
+        elif kind == 3:
+            values.append(ListValue(items=STATUSES[: 2 + index % 4]))
+        elif kind == 4:
+            values.append(InlineMap(pairs={"owner": "TEAM_A", "state": STATUSES[index % len(STATUSES)]}))
+        else:
+            values.append(index * 0.5 if index % 2 else index)
+    blocks = [
+        Block(
+            key=f"BLOCK_{start}",
+            children=[Assignment(key=f"FIELD_{i}", value=v) for i, v in enumerate(values[start : start + 50])],
+        )
+        for start in range(0, fields, 50)
+    ]
+    return Document(name="VALUES", sections=list(blocks))
+
+
+def all_values(doc: Document) -> list[Any]:
+    """Return the values of every assignment in the document."""
+    return [child.value for block in doc.sections for child in block.children]
+
+
+def main() -> None:
+    """Run the value emission benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best of N)")
+    parser.add_argument("--fields", type=int, default=100_000, help="Assignments in the document")
+    args = parser.parse_args()
+
+    doc = value_heavy_document(args.fields)
+    if emit(doc) != legacy_emitter.emit(doc):
+        raise SystemExit("emitted text differs from the original emitter")
+    values = all_values(doc)
+
+    legacy_values = measure(lambda vs: [legacy_emitter.emit_value(v) for v in vs], [values], args.repeat)
+    new_values = measure(lambda vs: [emit_value(v) for v in vs], [values], args.repeat)
+    legacy_doc = measure(legacy_emitter.emit, [doc], args.repeat)
+    new_doc = measure(emit, [doc], args.repeat)
+    print(f"value-heavy document ({args.fields} assignments):")
+    print(f"  emit_value, original: {legacy_values * 1000:9.2f} ms")
+    print(f"  emit_value:           {new_values * 1000:9.2f} ms  ({legacy_values / new_values:.2f}x)")
+    print(f"  emit, original:       {legacy_doc * 1000:9.2f} ms")
+    print(f"  emit:                 {new_doc * 1000:9.2f} ms  ({legacy_doc / new_doc:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Canonical emitter benchmark.
+
+Emits nested documents of growing depth and a large flat one with the
+streaming emitter (emit() and emit_to() into a file) and with the original
+recursive emitter (tests/benchmarks/legacy_emitter.py), reporting time and
+the peak memory traced while emitting.
+
+Usage:
+    python -m tests.benchmarks.bench_emitter [--repeat N] [--sections N]
+"""
+
+import argparse
+import os
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from octave_mcp.core.emitter import emit, emit_to
+from octave_mcp.core.parser import parse
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document, generate_nested_document
+from tests.benchmarks.legacy_emitter import emit as legacy_emit
+
+
+def peak(run: Callable[[], Any]) -> int:
+    """Return the peak bytes traced while run() executes."""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Run the emitter benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best of N)")
+    parser.add_argument("--sections", type=int, default=5000, help="Top-level blocks in the flat document")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.oct.md")
+
+        def to_file(doc: Any) -> None:
+            with open(path, "w", encoding="utf-8") as f:
+                emit_to(doc, f)
+
+        print(f"  {'document':<26} {'legacy':>10} {'emit':>10} {'emit_to':>10}   peak MB legacy / emit / emit_to")
+        documents = [
+            (f"nested, depth {depth}", generate_nested_document(depth, fields=20)) for depth in (100, 200, 400, 800)
+        ]
+        documents.append((f"flat, {args.sections} blocks", generate_document(sections=args.sections)))
+        for label, content in documents:
+            doc = parse(content, iterative=True)
+            if legacy_emit(doc) != emit(doc):
+                raise SystemExit(f"{label}: streaming emitter output differs")
+            times = [measure(run, [doc], args.repeat) for run in (legacy_emit, emit, to_file)]
+            peaks = [peak(lambda run=run, doc=doc: run(doc)) / 1e6 for run in (legacy_emit, emit, to_file)]
+            print(
+                f"  {label:<26} "
+                + " ".join(f"{t * 1000:8.1f}ms" for t in times)
+                + "   "
+                + " / ".join(f"{p:.1f}" for p in peaks)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Export benchmark.
+
+Exports a large synthetic document the way eject used to and with the
+streaming writers, reporting time and the peak memory traced while
+exporting:
+
+- JSON: nested dict then json.dumps, against to_json(), from a parsed AST
+  and from the parser's event stream (both ways)
+- YAML: nested dict then yaml.dump with PyYAML's pure-Python dumper and
+  with libyaml's (when built), against to_yaml()
+- Markdown: the list-of-lines converter against to_markdown(); the old
+  converter wrote lists and maps with repr(), to_markdown() in canonical
+  OCTAVE form, which costs more
+
+Time and memory of the event stream runs include parsing, which the AST
+runs do not.
+
+Usage:
+    python -m tests.benchmarks.bench_export [--repeat N] [--sections N]
+"""
+
+import argparse
+import json
+from typing import Any
+
+import yaml
+
+from octave_mcp.core.export import to_dict, to_json, to_markdown, to_yaml
+from octave_mcp.core.parser import iter_events, parse
+from tests.benchmarks.bench_emitter import peak
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document
+from tests.benchmarks.legacy_export import ast_to_dict, ast_to_markdown, events_to_dict
+
+
+def report(title: str, runs: list[tuple[str, Any]], repeat: int) -> None:
+    """Print time and peak memory of each run."""
+    size = len(runs[-1][1]())
+    print(f"{title} ({size / 1e6:.1f} MB):")
+    for label, run in runs:
+        elapsed = measure(lambda _, run=run: run(), [""], repeat)
+        print(f"  {label:<30} {elapsed * 1000:9.1f} ms  peak {peak(run) / 1e6:6.1f} MB")
+
+
+def main() -> None:
+    """Run the export benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best of N)")
+    parser.add_argument("--sections", type=int, default=2000, help="Top-level blocks in the document")
+    args = parser.parse_args()
+
+    # Five fields per block: the sixth kind carries a trailing comment, which ends a block
+    content = generate_document(sections=args.sections, fields=5)
+    doc = parse(content)
+    print(f"synthetic ({args.sections} blocks)")
+
+    json_runs: list[tuple[str, Any]] = [
+        ("dict + json.dumps", lambda: json.dumps(ast_to_dict(doc), indent=2, ensure_ascii=False)),
+        ("to_json(doc, compact)", lambda: to_json(doc, compact=True)),
+        (
+            "events, dict + dumps",
+            lambda: json.dumps(events_to_dict(iter_events(content)), indent=2, ensure_ascii=False),
+        ),
+        ("to_json(events)", lambda: to_json(iter_events(content))),
+        ("to_json(doc)", lambda: to_json(doc)),
+    ]
+    if json_runs[0][1]() != json_runs[-1][1]():
+        raise SystemExit("streaming JSON output differs from json.dumps")
+    report("JSON", json_runs, args.repeat)
+
+    yaml_options = {"allow_unicode": True, "sort_keys": False, "default_flow_style": False}
+    yaml_runs: list[tuple[str, Any]] = [
+        ("dict + yaml.dump", lambda: yaml.dump(ast_to_dict(doc), **yaml_options)),
+    ]
+    if hasattr(yaml, "CSafeDumper"):
+        yaml_runs.append(
+            (
+                "dict + yaml.dump(CSafeDumper)",
+                lambda: yaml.dump(ast_to_dict(doc), Dumper=yaml.CSafeDumper, **yaml_options),
+            )
+        )
+    yaml_runs.append(("to_yaml(events)", lambda: to_yaml(iter_events(content))))
+    yaml_runs.append(("to_yaml(doc)", lambda: to_yaml(doc)))
+    if yaml.load(yaml_runs[-1][1](), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) != to_dict(doc):
+        raise SystemExit("streaming YAML output does not read back as the document")
+    report("YAML", yaml_runs, args.repeat)
+
+    markdown_runs: list[tuple[str, Any]] = [
+        ("list of lines", lambda: ast_to_markdown(doc)),
+        ("to_markdown(events)", lambda: to_markdown(iter_events(content))),
+        ("to_markdown(doc)", lambda: to_markdown(doc)),
+    ]
+    report("Markdown", markdown_runs, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Incremental re-emission benchmark.
+
+Emits a synthetic living document of about 20k lines once, updates one
+nested field with Document.with_value (as AmendTool does) and times
+emitting the updated document again with reuse, which splices the text cached on
+unchanged blocks, against emitting it from scratch with no cached text.
+
+Usage:
+    python -m tests.benchmarks.bench_incremental_emit [--repeat N] [--sections N]
+"""
+
+import argparse
+
+from octave_mcp.core import binary
+from octave_mcp.core.emitter import emit
+from octave_mcp.core.parser import parse
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document
+
+
+def main() -> None:
+    """Run the incremental re-emission benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best of N)")
+    parser.add_argument("--sections", type=int, default=1100, help="Top-level blocks in the document")
+    args = parser.parse_args()
+
+    # Five fields per block: the sixth kind carries a trailing comment, which ends a block
+    doc = parse(generate_document(sections=args.sections, fields=5))
+    path = f"BLOCK_{args.sections // 2}.BLOCK_{args.sections // 2}_CHILD.COUNT_1"
+    canonical = emit(doc, reuse=True)
+    encoded = binary.dumps(doc.with_value(path, 0))
+
+    def incremental(_: str) -> str:
+        return emit(doc.with_value(path, 0), reuse=True)
+
+    def full(_: str) -> str:
+        return emit(binary.loads(encoded))
+
+    decode = measure(lambda _: binary.loads(encoded), [""], args.repeat)
+    spliced = measure(incremental, [""], args.repeat)
+    rendered = measure(full, [""], args.repeat) - decode
+    assert incremental("") == full("")
+
+    print(f"synthetic ({args.sections} blocks, {canonical.count(chr(10)) + 1} lines), one field changed:")
+    print(f"  full emit:        {rendered * 1000:9.3f} ms")
+    print(f"  incremental emit: {spliced * 1000:9.3f} ms  ({rendered / spliced:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
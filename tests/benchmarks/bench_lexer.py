@@ -0,0 +1,124 @@
+"""Lexer throughput benchmark.
+
+Compares the compiled single-regex lexer engine against the original
+pattern-by-pattern lexer on the specs corpus and a large synthetic document,
+then measures the canonical fast path and track_repairs=False separately on
+canonical and lenient input, incremental re-lexing of a one-line edit, and
+bytes-mode lexing of a memory-mapped file against reading and decoding it.
+
+Usage:
+    python -m tests.benchmarks.bench_lexer [--repeat N]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from octave_mcp.core.emitter import emit
+from octave_mcp.core.lexer import relex, tokenize, tokenize_buffer, tokenize_file
+from octave_mcp.core.parser import parse
+from tests.benchmarks import legacy_lexer
+from tests.benchmarks.corpus import generate_document, load_spec_corpus
+
+
+def measure(func: Callable[[str], Any], documents: list[str], repeat: int) -> float:
+    """Return the best wall-clock time in seconds to process all documents once."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            func(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, documents: list[str], repeat: int) -> None:
+    """Print throughput of the legacy and compiled engines for one corpus."""
+    size_mb = sum(len(document.encode("utf-8")) for document in documents) / 1_000_000
+    legacy = measure(legacy_lexer.tokenize, documents, repeat)
+    compiled = measure(tokenize, documents, repeat)
+    print(f"{label}: {size_mb:.3f} MB")
+    print(f"  legacy:   {legacy * 1000:9.2f} ms  {size_mb / legacy:7.2f} MB/s")
+    print(f"  compiled: {compiled * 1000:9.2f} ms  {size_mb / compiled:7.2f} MB/s")
+    print(f"  speedup:  {legacy / compiled:9.2f}x")
+
+
+def report_repair_tracking(label: str, document: str, repeat: int) -> None:
+    """Print tokenize() timings with and without repair tracking for one document."""
+    size_mb = len(document.encode("utf-8")) / 1_000_000
+    repairs = len(tokenize(document)[1])
+    tracked = measure(tokenize, [document], repeat)
+    untracked = measure(lambda content: tokenize(content, track_repairs=False), [document], repeat)
+    print(f"{label}: {size_mb:.3f} MB, {repairs} repairs")
+    print(f"  track_repairs=True:  {tracked * 1000:9.2f} ms")
+    print(f"  track_repairs=False: {untracked * 1000:9.2f} ms")
+
+
+def report_relex(label: str, document: str, repeat: int) -> None:
+    """Print timings of a one-line edit re-lexed incrementally and from scratch."""
+    buffer = tokenize_buffer(document)
+    start = document.index("COUNT_", len(document) // 2)
+    end = document.index("\n", start)
+    replacement = "COUNT_EDITED::12345"
+    edited = document[:start] + replacement + document[end:]
+    full = measure(tokenize_buffer, [edited], repeat)
+    incremental = measure(lambda _: relex(buffer, start, end, replacement), [edited], repeat)
+    print(f"{label}: {len(buffer)} tokens")
+    print(f"  full re-lex:        {full * 1000:9.2f} ms")
+    print(f"  incremental relex:  {incremental * 1000:9.2f} ms")
+
+
+def traced_peak(func: Callable[[], Any]) -> int:
+    """Return the peak traced memory in bytes while running func."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def report_bytes_mode(label: str, document: str, repeat: int) -> None:
+    """Print time and peak memory of mmap bytes-mode lexing versus read-and-decode lexing."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bench.oct.md"
+        path.write_text(document, encoding="utf-8")
+        size_mb = path.stat().st_size / 1_000_000
+
+        def read_and_tokenize(_: Any = None) -> Any:
+            return tokenize_buffer(path.read_text(encoding="utf-8"))
+
+        def map_and_tokenize(_: Any = None) -> Any:
+            return tokenize_file(path)
+
+        text_time = measure(read_and_tokenize, [document], repeat)
+        bytes_time = measure(map_and_tokenize, [document], repeat)
+        text_peak = traced_peak(read_and_tokenize)
+        bytes_peak = traced_peak(map_and_tokenize)
+    print(f"{label}: {size_mb:.3f} MB")
+    print(f"  read + tokenize_buffer: {text_time * 1000:9.2f} ms  peak {text_peak / 1_000_000:7.2f} MB")
+    print(f"  tokenize_file (mmap):   {bytes_time * 1000:9.2f} ms  peak {bytes_peak / 1_000_000:7.2f} MB")
+
+
+def main() -> None:
+    """Run the lexer benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best of N)")
+    args = parser.parse_args()
+
+    report("specs/*.oct.md", list(load_spec_corpus().values()), args.repeat)
+    lenient = generate_document(sections=500)
+    report("synthetic (500 blocks)", [lenient], args.repeat)
+    report_repair_tracking("lenient input", lenient, args.repeat)
+    report_repair_tracking("canonical input (fast path)", emit(parse(lenient)), args.repeat)
+    report_relex("one-line edit", lenient, args.repeat)
+    report_bytes_mode("file lexing", lenient, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
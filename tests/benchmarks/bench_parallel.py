@@ -0,0 +1,57 @@
+"""Parallel parsing scaling benchmark.
+
+Parses a generated stream of concatenated documents with parse_many(),
+split at envelope boundaries, and a directory of the same documents as one
+file each, with an increasing number of worker processes. Speedups are
+relative to parsing in the calling process (1 worker) and are bounded by
+the number of CPU cores available.
+
+Usage:
+    python -m tests.benchmarks.bench_parallel [--repeat N] [--documents N] [--workers 1,2,4,8]
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+
+from octave_mcp.core.batch import parse_many
+from octave_mcp.core.parser import split_documents
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document_stream
+
+
+def report(label: str, paths: list[Path], texts: list[str], workers: list[int], repeat: int) -> None:
+    """Print parse_many() times and speedups for each worker count."""
+    print(f"{label}:")
+    baseline = None
+    for count in workers:
+        seconds = measure(lambda _, count=count: parse_many(paths, texts, workers=count), [""], repeat)
+        baseline = baseline or seconds
+        print(f"  {count:>2} workers: {seconds * 1000:9.2f} ms  ({baseline / seconds:.2f}x)")
+
+
+def main() -> None:
+    """Run the parallel parsing benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best of N)")
+    parser.add_argument("--documents", type=int, default=10000, help="Documents in the corpus")
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma-separated worker counts")
+    args = parser.parse_args()
+    workers = [int(count) for count in args.workers.split(",")]
+
+    stream = generate_document_stream(args.documents)
+    print(f"{os.cpu_count()} CPUs, {args.documents} documents, {len(stream.encode()) / 1e6:.1f} MB")
+    report("one stream, split at envelopes", [], [stream], workers, args.repeat)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index, document in enumerate(split_documents(stream)):
+            path = Path(directory) / f"doc_{index}.oct.md"
+            path.write_text(document.text, encoding="utf-8")
+            paths.append(path)
+        report("one file per document", paths, [], workers, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
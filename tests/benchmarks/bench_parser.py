@@ -0,0 +1,60 @@
+"""Parser nesting-depth benchmark.
+
+Compares the recursive Parser against the explicit-stack IterativeParser on
+synthetic documents made of a single chain of nested blocks or § sections,
+from 10 to 1000 levels deep. Token streams are lexed once up front so only
+parsing is timed. The recursive parser is reported as failing where it
+exceeds the interpreter recursion limit.
+
+Usage:
+    python -m tests.benchmarks.bench_parser [--repeat N] [--depths 10,100,...]
+"""
+
+import argparse
+import sys
+
+from octave_mcp.core.lexer import Token, tokenize
+from octave_mcp.core.parser import parse
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document, generate_nested_document
+
+
+def time_parse(tokens: list[Token], iterative: bool, repeat: int) -> str:
+    """Return the best parse time of tokens formatted for the report, or the failure."""
+    try:
+        seconds = measure(lambda _: parse(tokens, iterative=iterative), [""], repeat)
+    except RecursionError:
+        return "  RecursionError"
+    return f"{seconds * 1000:9.2f} ms"
+
+
+def report(label: str, sections: bool, depths: list[int], repeat: int) -> None:
+    """Print parse times of both parsers for nested chains of increasing depth."""
+    print(f"{label} (recursion limit {sys.getrecursionlimit()}):")
+    print(f"  {'depth':>6}  {'recursive':>16}  {'iterative':>16}")
+    for depth in depths:
+        tokens, _ = tokenize(generate_nested_document(depth, sections=sections), track_repairs=False)
+        recursive = time_parse(tokens, False, repeat)
+        iterative = time_parse(tokens, True, repeat)
+        print(f"  {depth:>6}  {recursive:>16}  {iterative:>16}")
+
+
+def main() -> None:
+    """Run the parser benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best of N)")
+    parser.add_argument("--depths", default="10,50,100,250,500,1000", help="Comma-separated nesting depths")
+    args = parser.parse_args()
+    depths = [int(depth) for depth in args.depths.split(",")]
+
+    report("nested blocks", False, depths, args.repeat)
+    report("nested § sections", True, depths, args.repeat)
+
+    tokens, _ = tokenize(generate_document(sections=500), track_repairs=False)
+    print("synthetic (500 blocks, depth 2):")
+    print(f"  recursive: {time_parse(tokens, False, args.repeat)}")
+    print(f"  iterative: {time_parse(tokens, True, args.repeat)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Ingest pipeline latency benchmark.
+
+Compares the former ingest path, which tokenized content once for repairs and
+again inside parse(), against the single-pass process() pipeline, both as bare
+core calls and through IngestTool.execute, and times repeat calls served from
+a warm PipelineCache.
+
+Usage:
+    python -m tests.benchmarks.bench_pipeline [--repeat N]
+"""
+
+import argparse
+import asyncio
+from typing import Any
+
+from octave_mcp.core.emitter import emit
+from octave_mcp.core.lexer import tokenize
+from octave_mcp.core.parser import parse
+from octave_mcp.core.pipeline import PIPELINE_CACHE, PipelineCache, process
+from octave_mcp.mcp.ingest import IngestTool
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document, load_fixture_corpus
+
+
+def two_pass_ingest(content: str) -> tuple[list[Any], str]:
+    """Reproduce the former ingest stages: tokenize for repairs, then parse (which tokenizes again)."""
+    _, repairs = tokenize(content)
+    return repairs, emit(parse(content))
+
+
+def single_pass_ingest(content: str) -> tuple[list[Any], str]:
+    """Run the same stages through process()."""
+    result = process(content)
+    return result.repairs, result.canonical
+
+
+def report(label: str, documents: list[str], repeat: int) -> None:
+    """Print ingest latency of both paths for one corpus."""
+    tool = IngestTool()
+
+    def run_tool(content: str) -> None:
+        asyncio.run(tool.execute(content=content, schema="META"))
+
+    def cached_ingest(content: str) -> tuple[list[Any], str]:
+        result = process(content, cache=cache)
+        return result.repairs, result.canonical
+
+    two_pass = measure(two_pass_ingest, documents, repeat)
+    single_pass = measure(single_pass_ingest, documents, repeat)
+    PIPELINE_CACHE.clear()
+    tool_time = measure(run_tool, documents, 1)
+    cached_tool_time = measure(run_tool, documents, repeat)
+    cache = PipelineCache()
+    measure(cached_ingest, documents, 1)
+    cached = measure(cached_ingest, documents, repeat)
+    print(f"{label}: {len(documents)} documents")
+    print(f"  two-pass core:   {two_pass * 1000:9.2f} ms")
+    print(f"  process():       {single_pass * 1000:9.2f} ms  ({two_pass / single_pass:.2f}x)")
+    print(f"  cached hits:     {cached * 1000:9.2f} ms  ({cached * 1e6 / len(documents):.1f} us per document)")
+    print(f"  IngestTool:      {tool_time * 1000:9.2f} ms")
+    print(f"  IngestTool hits: {cached_tool_time * 1000:9.2f} ms")
+
+
+def main() -> None:
+    """Run the pipeline benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best of N)")
+    args = parser.parse_args()
+
+    report("tests/fixtures/*.oct.md", list(load_fixture_corpus().values()), args.repeat)
+    report("synthetic (500 blocks)", [generate_document(sections=500)], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
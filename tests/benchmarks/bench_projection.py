@@ -0,0 +1,51 @@
+"""Selective parsing benchmark for projections.
+
+Projects a large synthetic document to three top-level keys, parsing it in
+full and then with only_keys so the other top-level blocks are skipped
+before lexing, both as bare core calls and through EjectTool.execute.
+
+Usage:
+    python -m tests.benchmarks.bench_projection [--repeat N] [--sections N]
+"""
+
+import argparse
+import asyncio
+
+from octave_mcp.core.parser import parse
+from octave_mcp.core.projector import _filter_fields
+from octave_mcp.mcp.eject import EjectTool
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document
+
+KEYS = ["BLOCK_10", "BLOCK_500", "BLOCK_4000"]
+
+
+def main() -> None:
+    """Run the projection benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best of N)")
+    parser.add_argument("--sections", type=int, default=5000, help="Top-level blocks in the document")
+    args = parser.parse_args()
+
+    content = generate_document(sections=args.sections)
+    if _filter_fields(parse(content), KEYS) != _filter_fields(parse(content, only_keys=KEYS), KEYS):
+        raise SystemExit("selective parse differs from the full parse")
+
+    full = measure(lambda text: _filter_fields(parse(text), KEYS), [content], args.repeat)
+    selective = measure(lambda text: _filter_fields(parse(text, only_keys=KEYS), KEYS), [content], args.repeat)
+    print(f"synthetic ({args.sections} blocks, {len(content.encode()) / 1e6:.1f} MB) projected to {len(KEYS)} keys:")
+    print(f"  full parse:      {full * 1000:9.2f} ms")
+    print(f"  only_keys parse: {selective * 1000:9.2f} ms  ({full / selective:.2f}x)")
+
+    tool = EjectTool()
+    executive = content.replace("BLOCK_10:", "STATUS:").replace("BLOCK_500:", "RISKS:")
+    tool_time = measure(
+        lambda text: asyncio.run(tool.execute(content=text, schema="BENCHMARK", mode="executive")),
+        [executive],
+        args.repeat,
+    )
+    print(f"  EjectTool:       {tool_time * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Structural sharing benchmark for amends and projections.
+
+Updates one nested field of a synthetic document with Document.with_value
+and, for comparison, by deep-copying the document and changing the copy
+(what a non-destructive update costs without sharing), then projects the
+document to three top-level keys. Reports time and the number of nodes
+each result allocates rather than shares with the source.
+
+Usage:
+    python -m tests.benchmarks.bench_sharing [--repeat N] [--sections N]
+"""
+
+import argparse
+import copy
+
+from octave_mcp.core.ast_nodes import ASTNode, Block, Document, Section
+from octave_mcp.core.parser import parse
+from octave_mcp.core.projector import _filter_fields
+from tests.benchmarks.bench_lexer import measure
+from tests.benchmarks.corpus import generate_document
+
+KEYS = ["BLOCK_10", "BLOCK_500", "BLOCK_4000"]
+
+
+def node_ids(doc: Document) -> set[int]:
+    """Return the ids of every node in the document."""
+    ids: set[int] = set()
+    stack: list[ASTNode] = list(doc.sections)
+    while stack:
+        node = stack.pop()
+        ids.add(id(node))
+        if isinstance(node, Block | Section):
+            stack.extend(node.children)
+    return ids
+
+
+def deep_copy_update(doc: Document, path: str, value: object) -> Document:
+    """Update a copy of the document without sharing any nodes."""
+    updated = copy.deepcopy(doc)
+    updated.index[path].value = value
+    return updated
+
+
+def main() -> None:
+    """Run the structural sharing benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best of N)")
+    parser.add_argument("--sections", type=int, default=5000, help="Top-level blocks in the document")
+    args = parser.parse_args()
+
+    # Five fields per block: the sixth kind carries a trailing comment, which ends a block
+    doc = parse(generate_document(sections=args.sections, fields=5))
+    path = f"BLOCK_{args.sections // 2}.BLOCK_{args.sections // 2}_CHILD.COUNT_1"
+    source_ids = node_ids(doc)
+    assert path in doc.index  # Index built once per document, as in AmendTool
+
+    shared = measure(lambda _: doc.with_value(path, 0), [""], args.repeat)
+    copied = measure(lambda _: deep_copy_update(doc, path, 0), [""], 1)
+    projected = measure(lambda _: _filter_fields(doc, KEYS), [""], args.repeat)
+
+    def allocated(result: Document) -> int:
+        return len(node_ids(result) - source_ids)
+
+    print(f"synthetic ({args.sections} blocks, {len(source_ids)} nodes):")
+    print(f"  with_value:      {shared * 1000:9.3f} ms  {allocated(doc.with_value(path, 0)):7d} new nodes")
+    print(f"  deepcopy update: {copied * 1000:9.3f} ms  {allocated(deep_copy_update(doc, path, 0)):7d} new nodes")
+    print(f"  projection:      {projected * 1000:9.3f} ms  {allocated(_filter_fields(doc, KEYS)):7d} new nodes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmark corpora for the OCTAVE core pipeline.
+
+Three sources are provided:
+- The lexable content of the ``specs/*.oct.md`` documents shipped with the repo
+- The parseable ``tests/fixtures/*.oct.md`` documents
+- Deterministic synthetic documents of configurable size and nesting depth,
+  including single deep chains of blocks or § sections and streams of many
+  concatenated documents
+"""
+
+from pathlib import Path
+
+from octave_mcp.core.lexer import LexerError, tokenize
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SPECS_DIR = REPO_ROOT / "specs"
+FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures"
+
+
+def load_spec_corpus() -> dict[str, str]:
+    """Load the specs corpus, keeping only lines the lexer accepts.
+
+    Several spec documents embed prose characters (``/``, ``(``, backticks)
+    that the strict lexer rejects, which would end tokenization at the first
+    offending line. Dropping those lines keeps the realistic token mix of
+    each document while making the whole file lexable.
+
+    Returns:
+        Mapping of spec file name to lexable content
+    """
+    corpus: dict[str, str] = {}
+    for path in sorted(SPECS_DIR.glob("*.oct.md")):
+        kept: list[str] = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                tokenize(line)
+            except LexerError:
+                continue
+            kept.append(line)
+        corpus[path.name] = "\n".join(kept) + "\n"
+    return corpus
+
+
+def load_fixture_corpus() -> dict[str, str]:
+    """Load the test fixtures that parse, for benchmarks of the full pipeline.
+
+    The spec documents are not used there: once their prose lines are dropped
+    they no longer form valid documents for the parser.
+
+    Returns:
+        Mapping of fixture file name to content
+    """
+    from octave_mcp.core.parser import parse
+
+    corpus: dict[str, str] = {}
+    for path in sorted(FIXTURES_DIR.glob("*.oct.md")):
+        content = path.read_text(encoding="utf-8")
+        try:
+            parse(content)
+        except Exception:
+            continue
+        corpus[path.name] = content
+    return corpus
+
+
+def generate_document(sections: int = 100, fields: int = 10, depth: int = 2, name: str = "BENCHMARK") -> str:
+    """Generate a deterministic synthetic OCTAVE document.
+
+    Args:
+        sections: Number of top-level blocks
+        fields: Number of assignments per block level
+        depth: Nesting depth of blocks below each top-level block
+        name: Envelope name
+
+    Returns:
+        OCTAVE document text
+    """
+    lines = [f"==={name}===", "META:", '  TYPE::"BENCHMARK"', '  VERSION::"1.0"', "---"]
+    for section in range(sections):
+        _append_block(lines, f"BLOCK_{section}", fields, depth, 0)
+    lines.append("===END===")
+    return "\n".join(lines) + "\n"
+
+
+def generate_document_stream(documents: int, sections: int = 5, fields: int = 10, depth: int = 1) -> str:
+    """Generate a stream of concatenated synthetic documents, as in bulk exports.
+
+    Args:
+        documents: Number of envelopes
+        sections: Number of top-level blocks per document
+        fields: Number of assignments per block level
+        depth: Nesting depth of blocks below each top-level block
+
+    Returns:
+        OCTAVE text with one ===DOC_N=== ... ===END=== envelope per document
+    """
+    return "".join(
+        generate_document(sections=sections, fields=fields, depth=depth, name=f"DOC_{index}")
+        for index in range(documents)
+    )
+
+
+def _append_block(lines: list[str], key: str, fields: int, depth: int, indent: int) -> None:
+    """Append a block with a mix of value kinds and nested child blocks."""
+    pad = "  " * indent
+    lines.append(f"{pad}{key}:")
+    child_pad = "  " * (indent + 1)
+    for field in range(fields):
+        kind = field % 6
+        if kind == 0:
+            lines.append(f'{child_pad}NAME_{field}::"value {field} with spaces"')
+        elif kind == 1:
+            lines.append(f"{child_pad}COUNT_{field}::{field * 7}")
+        elif kind == 2:
+            lines.append(f"{child_pad}FLOW_{field}::START->MIDDLE->END_{field}")
+        elif kind == 3:
+            lines.append(f"{child_pad}TAGS_{field}::[alpha, beta, gamma_{field}]")
+        elif kind == 4:
+            lines.append(f"{child_pad}ENABLED_{field}::true")
+        else:
+            lines.append(f"{child_pad}STATUS_{field}::ACTIVE // trailing comment")
+    if depth > 0:
+        _append_block(lines, f"{key}_CHILD", fields, depth - 1, indent + 1)
+
+
+def generate_nested_document(depth: int, fields: int = 2, sections: bool = False, name: str = "BENCHMARK") -> str:
+    """Generate a deterministic document with a single chain of nested containers.
+
+    Built iteratively, so depth is not limited by the recursion limit.
+
+    Args:
+        depth: Number of nested levels
+        fields: Number of assignments at each level
+        sections: Nest § sections instead of blocks
+        name: Envelope name
+
+    Returns:
+        OCTAVE document text
+    """
+    lines = [f"==={name}===", "META:", '  TYPE::"BENCHMARK"', "---"]
+    for level in range(depth):
+        pad = "  " * level
+        lines.append(f"{pad}§{level}::LEVEL_{level}" if sections else f"{pad}LEVEL_{level}:")
+        for field in range(fields):
+            lines.append(f"{pad}  FIELD_{field}::{level * fields + field}")
+    lines.append("===END===")
+    return "\n".join(lines) + "\n"
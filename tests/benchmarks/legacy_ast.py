@@ -0,0 +1,112 @@
+"""Frozen copy of the original dataclass AST nodes.
+
+Kept as the memory baseline in the AST benchmark. The original nodes had a
+__dict__ per instance and every key and identifier was its own string, so
+to_legacy() copies strings instead of sharing them. Do not optimize this
+module.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from octave_mcp.core import ast_nodes
+
+
+@dataclass
+class ASTNode:
+    """Base class for all AST nodes."""
+
+    line: int = 0
+    column: int = 0
+
+
+@dataclass
+class Assignment(ASTNode):
+    """KEY::value assignment."""
+
+    key: str = ""
+    value: Any = None
+
+
+@dataclass
+class Block(ASTNode):
+    """KEY: with nested children."""
+
+    key: str = ""
+    children: list[ASTNode] = field(default_factory=list)
+
+
+@dataclass
+class Section(ASTNode):
+    """§NUMBER::NAME section with nested children."""
+
+    section_id: str = "0"
+    key: str = ""
+    annotation: str | None = None
+    children: list[ASTNode] = field(default_factory=list)
+
+
+@dataclass
+class Document(ASTNode):
+    """Top-level OCTAVE document with envelope."""
+
+    name: str = "INFERRED"
+    meta: dict[str, Any] = field(default_factory=dict)
+    sections: list[ASTNode] = field(default_factory=list)
+    has_separator: bool = False
+
+
+@dataclass
+class ListValue:
+    """List value [a, b, c]."""
+
+    items: list[Any] = field(default_factory=list)
+
+
+@dataclass
+class InlineMap:
+    """Inline map [k::v, k2::v2] (data mode only)."""
+
+    pairs: dict[str, Any] = field(default_factory=dict)
+
+
+def _copy(text: str) -> str:
+    """Return a string equal to text that is not shared with it."""
+    return text[:1] + text[1:] if len(text) > 1 else text
+
+
+def to_legacy(value: Any) -> Any:
+    """Rebuild an AST (or value) with the original node classes and unshared strings."""
+    if isinstance(value, str):
+        return _copy(value)
+    if isinstance(value, list):
+        return [to_legacy(item) for item in value]
+    if isinstance(value, dict):
+        return {_copy(key): to_legacy(item) for key, item in value.items()}
+    if isinstance(value, ast_nodes.ListValue):
+        return ListValue(to_legacy(value.items))
+    if isinstance(value, ast_nodes.InlineMap):
+        return InlineMap(to_legacy(value.pairs))
+    if isinstance(value, ast_nodes.Assignment):
+        return Assignment(value.line, value.column, _copy(value.key), to_legacy(value.value))
+    if isinstance(value, ast_nodes.Block):
+        return Block(value.line, value.column, _copy(value.key), to_legacy(value.children))
+    if isinstance(value, ast_nodes.Section):
+        return Section(
+            value.line,
+            value.column,
+            _copy(value.section_id),
+            _copy(value.key),
+            value.annotation,
+            to_legacy(value.children),
+        )
+    if isinstance(value, ast_nodes.Document):
+        return Document(
+            value.line,
+            value.column,
+            _copy(value.name),
+            to_legacy(value.meta),
+            to_legacy(value.sections),
+            value.has_separator,
+        )
+    return value
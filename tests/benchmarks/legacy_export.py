@@ -0,0 +1,160 @@
+"""Frozen copy of the original eject converters.
+
+Kept as the baseline in the export benchmarks and tests. JSON and YAML
+were serialized from a nested dict copy of the document, YAML by PyYAML's
+pure-Python dumper, and Markdown was built as a list of lines joined at the
+end, with values formatted by str(). Do not optimize this module.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from octave_mcp.core import events
+from octave_mcp.core.ast_nodes import Assignment, Block, Document, InlineMap, ListValue, Section
+from octave_mcp.core.export import section_key
+
+
+def ast_to_dict(doc: Document) -> dict[str, Any]:
+    """Convert AST Document to dictionary for JSON/YAML export.
+
+    Args:
+        doc: Document AST
+
+    Returns:
+        Dictionary representation of document
+    """
+    result: dict[str, Any] = {}
+
+    # Add META if present
+    if doc.meta:
+        result["META"] = doc.meta
+
+    # Convert sections
+    for section in doc.sections:
+        if isinstance(section, Assignment):
+            result[section.key] = convert_value(section.value)
+        elif isinstance(section, Block):
+            result[section.key] = convert_block(section)
+        elif isinstance(section, Section):
+            result[section_key(section)] = convert_block(section)
+
+    return result
+
+
+def events_to_dict(stream: Iterable[events.Event]) -> dict[str, Any]:
+    """Convert a parser event stream to the dictionary ast_to_dict builds.
+
+    Args:
+        stream: Structure events from parser.iter_events()
+
+    Returns:
+        Dictionary representation of document
+    """
+    result: dict[str, Any] = {}
+    stack = [result]
+
+    for event in stream:
+        if isinstance(event, events.Assignment):
+            stack[-1][event.key] = convert_value(event.value)
+        elif isinstance(event, events.StartBlock | events.StartSection):
+            block: dict[str, Any] = {}
+            stack[-1][event.key if isinstance(event, events.StartBlock) else section_key(event)] = block
+            stack.append(block)
+        elif isinstance(event, events.EndBlock | events.EndSection):
+            stack.pop()
+        elif isinstance(event, events.Meta) and event.fields:
+            result["META"] = event.fields
+
+    return result
+
+
+def convert_value(value: Any) -> Any:
+    """Convert AST value to native Python type.
+
+    Args:
+        value: AST value node
+
+    Returns:
+        Native Python value
+    """
+    if isinstance(value, ListValue):
+        return [convert_value(item) for item in value.items]
+    elif isinstance(value, InlineMap):
+        return {k: convert_value(v) for k, v in value.pairs.items()}
+    else:
+        return value
+
+
+def convert_block(block: Block | Section) -> dict[str, Any]:
+    """Convert Block or Section AST node to dictionary.
+
+    Args:
+        block: Block or Section node
+
+    Returns:
+        Dictionary representation
+    """
+    result: dict[str, Any] = {}
+
+    for child in block.children:
+        if isinstance(child, Assignment):
+            result[child.key] = convert_value(child.value)
+        elif isinstance(child, Block):
+            result[child.key] = convert_block(child)
+        elif isinstance(child, Section):
+            result[section_key(child)] = convert_block(child)
+
+    return result
+
+
+def ast_to_markdown(doc: Document) -> str:
+    """Convert AST Document to Markdown format.
+
+    Args:
+        doc: Document AST
+
+    Returns:
+        Markdown representation
+    """
+    lines: list[str] = []
+
+    # Add title
+    lines.append(f"# {doc.name}")
+    lines.append("")
+
+    # Add META section
+    if doc.meta:
+        lines.append("## META")
+        lines.append("")
+        for key, value in doc.meta.items():
+            lines.append(f"- **{key}**: {value}")
+        lines.append("")
+
+    # Add sections
+    for section in doc.sections:
+        if isinstance(section, Assignment):
+            lines.append(f"**{section.key}**: {section.value}")
+            lines.append("")
+        elif isinstance(section, Block):
+            lines.append(f"## {section.key}")
+            lines.append("")
+            block_to_markdown(section, lines, level=3)
+
+    return "\n".join(lines)
+
+
+def block_to_markdown(block: Block, lines: list[str], level: int = 3) -> None:
+    """Convert Block to Markdown recursively.
+
+    Args:
+        block: Block node
+        lines: Output lines list (mutated)
+        level: Heading level
+    """
+    for child in block.children:
+        if isinstance(child, Assignment):
+            lines.append(f"- **{child.key}**: {child.value}")
+        elif isinstance(child, Block):
+            lines.append(f"{'#' * level} {child.key}")
+            lines.append("")
+            block_to_markdown(child, lines, level + 1)
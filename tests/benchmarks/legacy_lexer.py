@@ -0,0 +1,225 @@
+"""Frozen copy of the original pattern-by-pattern OCTAVE lexer.
+
+Kept as the reference implementation for differential tests and as the
+baseline in the lexer benchmarks. Do not optimize this module.
+
+Tokens keep the original eagerly computed line/column fields. Note that the
+original lexer did not advance the line inside multi-line strings and
+reported column 1 for the newline ending a whitespace-only line; compare
+positions against it only for input free of both.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Any
+
+from octave_mcp.core.lexer import ASCII_ALIASES, TOKEN_PATTERNS, LexerError, TokenType
+
+
+@dataclass
+class Token:
+    """OCTAVE token with position and normalization info."""
+
+    type: TokenType
+    value: Any
+    line: int
+    column: int
+    normalized_from: str | None = None  # Original ASCII alias if normalized
+
+
+def tokenize(content: str) -> tuple[list[Token], list[Any]]:
+    """Tokenize OCTAVE content with ASCII alias normalization.
+
+    Args:
+        content: Raw OCTAVE text
+
+    Returns:
+        Tuple of (tokens, repairs)
+
+    Raises:
+        LexerError: On invalid syntax (tabs, malformed operators)
+    """
+    # Apply NFC unicode normalization
+    content = unicodedata.normalize("NFC", content)
+
+    # ... (existing checks)
+
+    # Check for tabs
+    if "\t" in content:
+        line = content[: content.index("\t")].count("\n") + 1
+        column = len(content[: content.index("\t")].split("\n")[-1]) + 1
+        raise LexerError("Tabs are not allowed. Use 2 spaces for indentation.", line, column, "E005")
+
+    tokens: list[Token] = []
+    repairs: list[Any] = []
+    line = 1
+    column = 1
+    pos = 0
+
+    # Compile all patterns
+    compiled_patterns = [(re.compile(pattern), token_type) for pattern, token_type in TOKEN_PATTERNS]
+
+    while pos < len(content):
+        # ... (whitespace handling)
+        # Track whitespace (spaces only, not newlines)
+        if content[pos] == " ":
+            # Count leading spaces for indentation
+            if column == 1:  # Start of line
+                space_count = 0
+                while pos < len(content) and content[pos] == " ":
+                    space_count += 1
+                    pos += 1
+                if space_count > 0 and pos < len(content) and content[pos] != "\n":
+                    # Only emit INDENT if followed by non-newline
+                    tokens.append(Token(TokenType.INDENT, space_count, line, column))
+                    column += space_count
+                continue
+            else:
+                # Skip inline spaces
+                pos += 1
+                column += 1
+                continue
+
+        # Try to match token patterns
+        matched = False
+        for pattern, token_type in compiled_patterns:
+            match = pattern.match(content, pos)
+            if match:
+                matched_text = match.group()
+                normalized_from = None
+
+                # ... (value extraction logic)
+                # Handle special tokens
+                if token_type == TokenType.ENVELOPE_START:
+                    value = match.group(1)  # Extract NAME from ===NAME===
+                elif token_type == TokenType.ENVELOPE_END:
+                    value = "END"
+                elif token_type == TokenType.STRING:
+                    # Remove quotes and handle escapes
+                    value = matched_text[1:-1]  # Remove surrounding quotes
+                    # Process escape sequences
+                    value = value.replace(r"\"", '"')
+                    value = value.replace(r"\\", "\\")
+                    value = value.replace(r"\n", "\n")
+                    value = value.replace(r"\t", "\t")
+                elif token_type == TokenType.NUMBER:
+                    # Convert to int or float
+                    if "." in matched_text or "e" in matched_text.lower():
+                        value = float(matched_text)
+                    else:
+                        value = int(matched_text)
+                elif token_type == TokenType.BOOLEAN:
+                    value = matched_text == "true"
+                elif token_type == TokenType.NULL:
+                    value = None
+                elif token_type == TokenType.COMMENT:
+                    value = matched_text[2:].strip()  # Remove // and strip
+                elif token_type == TokenType.NEWLINE:
+                    value = "\n"
+                else:
+                    value = matched_text
+
+                # Check for ASCII alias normalization
+                if matched_text in ASCII_ALIASES:
+                    normalized_from = matched_text
+                    value = ASCII_ALIASES[matched_text]
+
+                # Special handling for operators that need normalization
+                if token_type in (
+                    TokenType.FLOW,
+                    TokenType.SYNTHESIS,
+                    TokenType.CONCAT,
+                    TokenType.TENSION,
+                    TokenType.ALTERNATIVE,
+                    TokenType.CONSTRAINT,
+                    TokenType.SECTION,
+                ):
+                    if matched_text in ASCII_ALIASES:
+                        normalized_from = matched_text
+                        value = ASCII_ALIASES[matched_text]
+
+                token = Token(token_type, value, line, column, normalized_from)
+                tokens.append(token)
+
+                if normalized_from:
+                    repairs.append(
+                        {
+                            "type": "normalization",
+                            "original": normalized_from,
+                            "normalized": value,
+                            "line": line,
+                            "column": column,
+                        }
+                    )
+
+                # Update position
+                if token_type == TokenType.NEWLINE:
+                    line += 1
+                    column = 1
+                else:
+                    column += len(matched_text)
+                pos = match.end()
+                matched = True
+                break
+
+        if not matched:
+            # Handle special case: + operator (need to distinguish from number)
+            if content[pos] == "+":
+                # Look ahead - is this part of a number or an operator?
+                if pos + 1 < len(content) and content[pos + 1].isdigit():
+                    # Part of number - this will be caught by number pattern
+                    # But we're here, so it wasn't matched - treat as synthesis
+                    pass
+                # Treat as synthesis operator
+                tokens.append(Token(TokenType.SYNTHESIS, "⊕", line, column, "+"))
+                repairs.append(
+                    {"type": "normalization", "original": "+", "normalized": "⊕", "line": line, "column": column}
+                )
+                column += 1
+                pos += 1
+                continue
+
+            # Unrecognized character
+            raise LexerError(f"Unexpected character: '{content[pos]}'", line, column, "E005")
+
+    # Add EOF token
+    tokens.append(Token(TokenType.EOF, None, line, column))
+
+    return tokens, repairs
+
+
+def has_position_quirks(content: str) -> bool:
+    """Return True if content may hit one of the original lexer's position quirks.
+
+    Conservative: any input with both a quote and a newline may hold a
+    multi-line string, and any line of only spaces reports a wrong column.
+    """
+    return ('"' in content and "\n" in content) or re.search(r"(?m)^ +$", content) is not None
+
+
+def signature(tokens: list[Any], repairs: list[Any]) -> tuple[list[Any], list[Any]]:
+    """Project a tokenize() result onto its position-independent fields."""
+    return (
+        [(token.type, token.value, token.normalized_from) for token in tokens],
+        [(repair["original"], repair["normalized"]) for repair in repairs],
+    )
+
+
+def positions(content: str) -> list[tuple[int, int]]:
+    """Compute the 1-based (line, column) of every offset in NFC-normalized content.
+
+    The result has one entry per character plus one for the end of input.
+    """
+    result: list[tuple[int, int]] = []
+    line = 1
+    column = 1
+    for char in unicodedata.normalize("NFC", content):
+        result.append((line, column))
+        if char == "\n":
+            line += 1
+            column = 1
+        else:
+            column += 1
+    result.append((line, column))
+    return result
@@ -0,0 +1,29 @@
+"""Property-based round-trip tests for the binary AST encoding.
+
+Any document the parser builds must decode to an equal document that
+emits the same canonical text.
+"""
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from octave_mcp.core import binary
+from octave_mcp.core.emitter import emit
+from octave_mcp.core.parser import parse
+from tests.properties.test_parser_equivalence import bodies
+
+
+@given(bodies, st.booleans())
+def test_round_trip_matches_canonical_emitter(body, envelope):
+    """loads(dumps(doc)) equals doc and emits the same canonical text."""
+    content = "\n".join(body) + "\n"
+    if envelope:
+        content = "===TEST===\nMETA:\n  TYPE::X\n---\n" + content + "===END===\n"
+    try:
+        doc = parse(content)
+    except Exception:
+        return
+
+    decoded = binary.loads(binary.dumps(doc))
+    assert decoded == doc
+    assert emit(decoded) == emit(doc)
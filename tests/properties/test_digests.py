@@ -0,0 +1,54 @@
+"""Property-based tests for node digests.
+
+A node's digest is a Merkle hash of its canonical form, so two documents
+must have equal digests exactly when they emit the same canonical text,
+and changed_paths() must find a difference exactly when the digests differ.
+"""
+
+import copy
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from octave_mcp.core.emitter import emit
+from octave_mcp.core.parser import parse
+from tests.properties.test_parser_equivalence import bodies
+
+
+def _parse(body):
+    """Parse a generated body, or None if it is not a valid document."""
+    try:
+        return parse("\n".join(body) + "\n")
+    except Exception:
+        return None
+
+
+@given(bodies, bodies)
+def test_digest_equality_matches_canonical_equality(first, second):
+    """Documents have equal digests exactly when they emit the same text."""
+    a, b = _parse(first), _parse(second)
+    if a is None or b is None:
+        return
+
+    assert (a.digest == b.digest) == (emit(a) == emit(b))
+    if a.name == b.name and a.meta == b.meta and a.has_separator == b.has_separator:
+        assert bool(a.changed_paths(b)) == (a.digest != b.digest)
+
+
+@given(bodies, st.data())
+def test_with_value_digests_match_an_in_place_change(body, data):
+    """Digests of a copy-on-write update match those of the same change made in place."""
+    doc = _parse(body)
+    if doc is None:
+        return
+    index = doc.index
+    paths = [path for path in index if type(index[path]).__name__ == "Assignment"]
+    if not paths:
+        return
+    path = data.draw(st.sampled_from(paths))
+
+    updated = doc.with_value(path, "changed")
+    changed_in_place = copy.deepcopy(doc)
+    changed_in_place.index[path].value = "changed"
+    assert updated.digest == changed_in_place.digest
+    assert doc.changed_paths(updated) == ([] if doc.index[path].value == "changed" else [path])
@@ -0,0 +1,57 @@
+"""Property-based differential tests for value emission.
+
+emit_value() memoizes strings, escapes with a translate table and
+dispatches on type; on any value it must produce exactly what the original
+emitter (tests/benchmarks/legacy_emitter.py) did, on first and on repeated
+(cached) use.
+"""
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from octave_mcp.core.ast_nodes import Assignment, Document, InlineMap, ListValue
+from octave_mcp.core.emitter import emit, emit_value
+from tests.benchmarks import legacy_emitter
+
+# Strings biased towards the cases emit_value distinguishes
+strings = st.one_of(
+    st.text(),
+    st.sampled_from(["", "true", "false", "null", "vs", "ACTIVE", "a.b_c", "1abc", "x\n", 'say "hi"', "a\\tb\t"]),
+    st.text(alphabet='AZaz09_.-\\"\n\t :', max_size=12),
+    st.text(min_size=250, max_size=300),
+)
+scalars = st.one_of(st.none(), st.booleans(), st.integers(), st.floats(), strings)
+values = st.recursive(
+    scalars,
+    lambda children: st.one_of(
+        st.lists(children, max_size=4).map(lambda items: ListValue(items=items)),
+        st.dictionaries(st.text(max_size=5), children, max_size=3).map(lambda pairs: InlineMap(pairs=pairs)),
+    ),
+    max_leaves=12,
+)
+
+
+class TaggedStr(str):
+    """A str subclass, emitted through the isinstance fallback."""
+
+
+@given(values)
+def test_emit_value_matches_original(value):
+    """emit_value() output is unchanged, also when served from the cache."""
+    expected = legacy_emitter.emit_value(value)
+    assert emit_value(value) == expected
+    assert emit_value(value) == expected
+
+
+@given(strings, st.integers())
+def test_subclasses_match_original(text, number):
+    """Values of subclasses of the value types are emitted as before."""
+    assert emit_value(TaggedStr(text)) == legacy_emitter.emit_value(TaggedStr(text))
+    assert emit_value(number > 0) == legacy_emitter.emit_value(number > 0)
+
+
+@given(st.lists(st.tuples(st.from_regex(r"[A-Z][A-Z_]{0,5}", fullmatch=True), values), max_size=10))
+def test_documents_match_original(fields):
+    """Whole documents emit as before."""
+    doc = Document(name="TEST", sections=[Assignment(key=key, value=value) for key, value in fields])
+    assert emit(doc) == legacy_emitter.emit(doc)
@@ -0,0 +1,58 @@
+"""Property-based tests for streaming export.
+
+to_json() and to_yaml() write text straight from a Document or its parser
+events; on any document it must read back as the nested dict form, and
+both sources must give the same text. to_markdown() must likewise agree
+between the two sources.
+"""
+
+import json
+
+import yaml
+from hypothesis import given
+
+from octave_mcp.core.export import to_dict, to_json, to_markdown, to_yaml
+from octave_mcp.core.parser import iter_events, parse
+from tests.benchmarks.legacy_export import ast_to_dict
+from tests.properties.test_parser_equivalence import bodies
+
+
+@given(bodies)
+def test_json_matches_dict_form(body):
+    """JSON written from the AST or from events reads back as the dict form."""
+    content = "\n".join(body) + "\n"
+    try:
+        doc = parse(content)
+    except Exception:
+        return
+
+    output = to_json(doc)
+    assert json.loads(output) == json.loads(json.dumps(ast_to_dict(doc)))
+    assert to_json(iter_events(content)) == output
+    assert json.loads(to_json(doc, compact=True)) == json.loads(output)
+
+
+@given(bodies)
+def test_yaml_round_trips(body):
+    """YAML written from the AST or from events reads back as the dict form."""
+    content = "\n".join(body) + "\n"
+    try:
+        doc = parse(content)
+    except Exception:
+        return
+
+    output = to_yaml(doc)
+    assert yaml.safe_load(output) == to_dict(doc) == json.loads(to_json(doc))
+    assert to_yaml(iter_events(content)) == output
+
+
+@given(bodies)
+def test_markdown_from_events_matches_ast(body):
+    """Markdown written from events equals Markdown written from the AST."""
+    content = "\n".join(body) + "\n"
+    try:
+        doc = parse(content)
+    except Exception:
+        return
+
+    assert to_markdown(iter_events(content)) == to_markdown(doc)
@@ -0,0 +1,35 @@
+"""Property-based tests for incremental re-emission.
+
+Blocks and sections cache their emitted text when emitted with reuse, so a
+document emitted, then updated with with_values(), must emit exactly what
+the same document emits when built from scratch with no cached text.
+"""
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from octave_mcp.core import binary
+from octave_mcp.core.emitter import emit
+from octave_mcp.core.parser import parse
+from tests.properties.test_parser_equivalence import bodies
+
+values = st.one_of(st.none(), st.booleans(), st.integers(), st.text(max_size=10))
+
+
+@given(bodies, st.data())
+def test_incremental_emission_matches_a_full_emission(body, data):
+    """Re-emitting after updates reuses cached text without changing the output."""
+    try:
+        doc = parse("\n".join(body) + "\n")
+    except Exception:
+        return
+    index = doc.index
+    paths = [path for path in index if type(index[path]).__name__ == "Assignment"]
+    if not paths:
+        return
+    emit(doc, reuse=True)
+
+    changes = data.draw(st.dictionaries(st.sampled_from(paths), values, max_size=3))
+    updated = doc.with_values(changes)
+    assert emit(updated, reuse=True) == emit(binary.loads(binary.dumps(updated)))
+    assert emit(doc, reuse=True) == emit(binary.loads(binary.dumps(doc)))
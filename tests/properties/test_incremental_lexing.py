@@ -0,0 +1,70 @@
+"""Property-based tests for incremental re-lexing.
+
+relex() splices freshly lexed lines into a previous TokenBuffer. It must be
+indistinguishable from lexing the edited text from scratch: same tokens,
+same positions, same repairs, and the same errors.
+"""
+
+from hypothesis import assume, given
+from hypothesis import strategies as st
+
+from octave_mcp.core.lexer import LexerError, relex, tokenize_buffer
+from tests.properties.test_lexer_equivalence import FRAGMENTS
+
+documents = st.lists(st.sampled_from(FRAGMENTS), max_size=40).map("".join)
+replacements = st.lists(st.sampled_from(FRAGMENTS + ['"', "x\ny", "é"]), max_size=6).map("".join)
+
+
+def _snapshot(buffer):
+    """Everything observable about a buffer's tokens."""
+    return (
+        list(buffer),
+        [(token.line, token.column) for token in buffer],
+        buffer.repairs(),
+    )
+
+
+@given(documents, st.integers(min_value=0), st.integers(min_value=0), replacements)
+def test_relex_matches_full_relex(document, a, b, replacement):
+    """Splicing re-lexed lines gives the same result as lexing the edited text."""
+    try:
+        buffer = tokenize_buffer(document)
+    except LexerError:
+        assume(False)
+    source = buffer.source
+    start, end = sorted((a % (len(source) + 1), b % (len(source) + 1)))
+    edited = source[:start] + replacement + source[end:]
+
+    try:
+        expected = tokenize_buffer(edited)
+    except LexerError as exc:
+        try:
+            relex(buffer, start, end, replacement)
+        except LexerError as incremental:
+            assert str(incremental) == str(exc)
+        else:
+            raise AssertionError("relex() accepted text rejected by tokenize_buffer()")
+        return
+
+    result = relex(buffer, start, end, replacement)
+    assert result.source == expected.source
+    assert _snapshot(result) == _snapshot(expected)
+
+
+@given(documents, st.lists(st.tuples(st.integers(min_value=0), st.integers(min_value=0), replacements), max_size=5))
+def test_successive_edits_match_full_relex(document, edits):
+    """A chain of relex() calls stays equal to lexing the final text."""
+    try:
+        buffer = tokenize_buffer(document)
+    except LexerError:
+        assume(False)
+
+    for a, b, replacement in edits:
+        source = buffer.source
+        start, end = sorted((a % (len(source) + 1), b % (len(source) + 1)))
+        try:
+            buffer = relex(buffer, start, end, replacement)
+        except LexerError:
+            return
+
+    assert _snapshot(buffer) == _snapshot(tokenize_buffer(buffer.source))
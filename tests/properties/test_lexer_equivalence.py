@@ -0,0 +1,161 @@
+"""Property-based differential tests for the compiled lexer engine.
+
+The compiled first-character dispatch engine must be observationally identical
+to the original pattern-by-pattern lexer: same tokens, same repairs, and the
+same errors. Positions must match wherever the original lexer got them right,
+and always match a brute-force line/column computation from the token offset.
+"""
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from octave_mcp.core.lexer import LexerError, iter_tokens, tokenize, tokenize_buffer, tokenize_bytes
+from tests.benchmarks import legacy_lexer
+
+# Fragments that exercise every token pattern and the tricky boundaries between them
+FRAGMENTS = [
+    "KEY",
+    "value",
+    "my-tool",
+    "pkg.name",
+    "vs",
+    "true",
+    "false",
+    "null",
+    "::",
+    ":",
+    "->",
+    "→",
+    "+",
+    "⊕",
+    "~",
+    "⧺",
+    "@",
+    "⇌",
+    "|",
+    "∨",
+    "&",
+    "∧",
+    "#",
+    "§",
+    "[",
+    "]",
+    ",",
+    "-",
+    "42",
+    "-3.5",
+    "1e10",
+    '"quoted text"',
+    '"esc\\"aped"',
+    "// comment",
+    "===DOC===",
+    "===END===",
+    "---",
+    " ",
+    "  ",
+    "\n",
+    "\n  ",
+]
+
+
+def _outcome(tokenizer, content):
+    """Tokenize content, capturing a lexer error as a comparable value."""
+    try:
+        tokens, repairs = tokenizer(content)
+    except LexerError as exc:
+        position = None if legacy_lexer.has_position_quirks(content) else (exc.line, exc.column)
+        return None, (exc.error_code, exc.message, position)
+    signature = legacy_lexer.signature(tokens, repairs)
+    if legacy_lexer.has_position_quirks(content):
+        return signature, None
+    return signature, [(token.line, token.column) for token in tokens]
+
+
+def _assert_matches_legacy(content):
+    """Compiled engine agrees with the legacy lexer and resolves true positions."""
+    assert _outcome(tokenize, content) == _outcome(legacy_lexer.tokenize, content)
+    try:
+        tokens, _ = tokenize(content)
+    except LexerError:
+        return
+    offsets = legacy_lexer.positions(content)
+    assert [(token.line, token.column) for token in tokens] == [offsets[token.offset] for token in tokens]
+
+
+@given(st.lists(st.sampled_from(FRAGMENTS), max_size=40))
+def test_compiled_engine_matches_legacy_on_fragment_soup(fragments):
+    """Any concatenation of token fragments lexes identically."""
+    _assert_matches_legacy("".join(fragments))
+
+
+@given(st.text(max_size=60))
+def test_compiled_engine_matches_legacy_on_arbitrary_text(content):
+    """Arbitrary text lexes identically, including error positions."""
+    _assert_matches_legacy(content)
+
+
+@given(st.lists(st.sampled_from(FRAGMENTS), max_size=40), st.lists(st.integers(min_value=0, max_value=400)))
+def test_chunked_streaming_matches_tokenize(fragments, cuts):
+    """iter_tokens over any chunking yields the tokens and repairs of tokenize()."""
+    content = "".join(fragments)
+    bounds = sorted({min(cut, len(content)) for cut in cuts} | {0, len(content)})
+    chunks = [content[start:end] for start, end in zip(bounds, bounds[1:], strict=False)]
+
+    try:
+        expected = tokenize(content)
+    except LexerError as exc:
+        expected_error = str(exc)
+        try:
+            list(iter_tokens(chunks))
+        except LexerError as streamed:
+            assert str(streamed) == expected_error
+        else:
+            raise AssertionError("streaming lexer accepted input rejected by tokenize()")
+        return
+
+    repairs: list = []
+    streamed = list(iter_tokens(chunks, repairs))
+    assert (streamed, repairs) == expected
+    assert [(t.line, t.column) for t in streamed] == [(t.line, t.column) for t in expected[0]]
+
+
+def _text_view(tokenizer, content):
+    """Tokenize with the given entry point and project away offset units."""
+    try:
+        buffer = tokenizer(content)
+    except LexerError as exc:
+        return None, str(exc)
+    return (
+        [(token.type, token.value, token.normalized_from, token.line, token.column) for token in buffer],
+        buffer.repairs(),
+    )
+
+
+# Non-ASCII text the byte lexer must hand over or decode exactly like the text lexer
+UNICODE_FRAGMENTS = [
+    '"café"',
+    '"cafe\u0301"',  # Decomposed: values and columns must come out NFC
+    "// nai\u0308ve",
+    "\u0663",  # ARABIC-INDIC DIGIT THREE: a NUMBER only to the text lexer
+    "\u212aEY",  # KELVIN SIGN: NFC turns it into an identifier
+    "vs\u0663",
+    "\u0301",
+    '"\\é"',
+]
+
+
+@given(st.lists(st.sampled_from(FRAGMENTS + UNICODE_FRAGMENTS), max_size=40))
+def test_byte_lexer_matches_text_lexer(fragments):
+    """tokenize_bytes() on the UTF-8 encoding yields the tokens, positions and errors of tokenize_buffer()."""
+    content = "".join(fragments)
+    assert _text_view(lambda text: tokenize_bytes(text.encode("utf-8")), content) == _text_view(
+        tokenize_buffer, content
+    )
+
+
+@given(st.text(max_size=60))
+def test_byte_lexer_matches_text_lexer_on_arbitrary_text(content):
+    """Arbitrary text lexes identically in bytes mode, including error positions."""
+    assert _text_view(lambda text: tokenize_bytes(text.encode("utf-8")), content) == _text_view(
+        tokenize_buffer, content
+    )
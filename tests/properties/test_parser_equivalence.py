@@ -0,0 +1,137 @@
+"""Property-based differential tests for the alternative parser paths.
+
+IterativeParser replaces recursion over nested blocks and § sections with an
+explicit stack, and iter_events() reports the same structure as a stream of
+events. On any token stream both must agree with the recursive Parser: the
+same AST (rebuilt from the events), or the same error. Selective parsing
+with only_keys must give the same projection as a full parse.
+"""
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from octave_mcp.core import events
+from octave_mcp.core.ast_nodes import Assignment, Block, Document, Section
+from octave_mcp.core.lexer import LexerError, tokenize
+from octave_mcp.core.parser import iter_events, parse
+from octave_mcp.core.projector import _filter_fields
+
+LINES = [
+    "KEY::value",
+    "COUNT::42",
+    "TAGS::[a, b, c]",
+    "FLOW::A->B",
+    "BLOCK:",
+    "OTHER:",
+    "KEY: value",
+    "§1::FIRST",
+    "§2b::SECOND",
+    "§CONTEXT::",
+    "§3::ANNOTATED[a,b]",
+    "// comment",
+    "---",
+    "",
+    "ORPHAN",
+    "==INNER==",
+]
+
+lines = st.tuples(st.integers(min_value=0, max_value=5), st.sampled_from(LINES)).map(
+    lambda line: " " * line[0] * 2 + line[1] if line[1] else ""
+)
+bodies = st.lists(lines, max_size=40)
+
+
+def build_document(stream):
+    """Rebuild the Document AST that parse() returns from an event stream."""
+    doc = None
+    stack = []
+    for event in stream:
+        if isinstance(event, events.StartDocument):
+            doc = Document(name=event.name, has_separator=event.has_separator)
+            stack.append(doc.sections)
+        elif isinstance(event, events.Meta):
+            doc.meta = event.fields
+        elif isinstance(event, events.Assignment):
+            stack[-1].append(Assignment(key=event.key, value=event.value, line=event.line, column=event.column))
+        elif isinstance(event, events.StartBlock):
+            node = Block(key=event.key)
+            stack[-1].append(node)
+            stack.append(node.children)
+        elif isinstance(event, events.StartSection):
+            node = Section(
+                section_id=event.section_id,
+                key=event.key,
+                annotation=event.annotation,
+                line=event.line,
+                column=event.column,
+            )
+            stack[-1].append(node)
+            stack.append(node.children)
+        elif isinstance(event, events.EndBlock):
+            stack.pop()
+            stack[-1][-1].line = event.line
+            stack[-1][-1].column = event.column
+        elif isinstance(event, (events.EndSection, events.EndDocument)):
+            stack.pop()
+    assert not stack
+    return doc
+
+
+def _outcome(tokens, iterative):
+    """The AST, or the type and message of the error, for one parser mode."""
+    try:
+        return parse(tokens, iterative=iterative)
+    except Exception as exc:
+        return type(exc), str(exc)
+
+
+@given(bodies, st.booleans())
+def test_iterative_parser_matches_recursive(body, envelope):
+    """Both parser modes agree on every document."""
+    content = "\n".join(body) + "\n"
+    if envelope:
+        content = "===TEST===\n" + content + "===END===\n"
+    try:
+        tokens, _ = tokenize(content, track_repairs=False)
+    except LexerError:
+        return
+
+    assert _outcome(tokens, True) == _outcome(tokens, False)
+
+
+@given(bodies, st.booleans())
+def test_events_match_recursive_parser(body, envelope):
+    """The document rebuilt from iter_events() is the one parse() builds."""
+    content = "\n".join(body) + "\n"
+    if envelope:
+        content = "===TEST===\n" + content + "===END===\n"
+    try:
+        tokens, _ = tokenize(content, track_repairs=False)
+    except LexerError:
+        return
+
+    try:
+        outcome = build_document(iter_events(tokens))
+    except Exception as exc:
+        outcome = type(exc), str(exc)
+    assert outcome == _outcome(tokens, False)
+
+
+SELECTIVE_LINES = LINES + ['TEXT::"multi', 'LINE::end"', "LIST::[a,", "b]", "§1::SECTION", "META:", "  TYPE::X"]
+KEYS = ["KEY", "BLOCK", "OTHER", "COUNT", "TAGS", "TEXT", "LIST", "LINE", "b"]
+
+selective_lines = st.tuples(st.integers(min_value=0, max_value=3), st.sampled_from(SELECTIVE_LINES)).map(
+    lambda line: " " * line[0] * 2 + line[1] if line[1] else ""
+)
+
+
+@given(st.lists(selective_lines, max_size=40), st.lists(st.sampled_from(KEYS), max_size=3))
+def test_selective_parse_matches_full_projection(body, keys):
+    """Skipping unneeded top-level items never changes the projected document."""
+    content = "===TEST===\n" + "\n".join(body) + "\n===END===\n"
+    try:
+        full = parse(content)
+    except Exception:
+        return
+
+    assert _filter_fields(parse(content, only_keys=keys), keys) == _filter_fields(full, keys)
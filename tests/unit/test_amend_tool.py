@@ -13,6 +13,9 @@ import tempfile
 
 import pytest
 
+from octave_mcp.core import emitter
+from octave_mcp.core.emitter import emit
+from octave_mcp.mcp import amend
 from octave_mcp.mcp.amend import AmendTool
 from octave_mcp.mcp.create import CreateTool
 
@@ -145,6 +148,154 @@ class TestAmendTool:
                 assert "FIELD2::value2" in updated_content  # Unchanged
                 assert "FIELD3::updated3" in updated_content
 
+    @pytest.mark.asyncio
+    async def test_amend_nested_fields_by_path(self):
+        """Test amending nested fields addressed by dotted path."""
+        create_tool = CreateTool()
+        amend_tool = AmendTool()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target_path = os.path.join(tmpdir, "test.oct.md")
+
+            create_result = await create_tool.execute(
+                content="===TEST===\nCONFIG:\n  TIMEOUT::30\n  RETRY:\n    COUNT::3\nTIMEOUT::5\n===END===",
+                target_path=target_path,
+            )
+            assert create_result["status"] == "success"
+
+            amend_result = await amend_tool.execute(
+                target_path=target_path,
+                changes={"CONFIG.TIMEOUT": 60, "CONFIG.RETRY.COUNT": 5},
+            )
+
+            assert amend_result["status"] == "success"
+            with open(target_path) as f:
+                updated_content = f.read()
+                assert "  TIMEOUT::60" in updated_content
+                assert "    COUNT::5" in updated_content
+                assert "\nTIMEOUT::5" in updated_content  # Top-level field with the same key is unchanged
+
+    @pytest.mark.asyncio
+    async def test_consecutive_amends_re_emit_only_the_changed_subtree(self, monkeypatch):
+        """Test that each amend splices the emitted text of every block it did not change."""
+        create_tool = CreateTool()
+        amend_tool = AmendTool()
+        blocks = [f"BLOCK_{index}:\n  CHILD:\n    KEY::{index}" for index in range(400)]
+
+        rendered = []
+        container_header = emitter._container_header
+
+        def counting_emit(doc, reuse=False):
+            # Count the blocks rendered rather than spliced while the amend emits its result
+            monkeypatch.setattr(
+                emitter, "_container_header", lambda node: rendered.append(node.key) or container_header(node)
+            )
+            try:
+                return emit(doc, reuse)
+            finally:
+                monkeypatch.setattr(emitter, "_container_header", container_header)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target_path = os.path.join(tmpdir, "test.oct.md")
+            await create_tool.execute(
+                content="===TEST===\n" + "\n".join(blocks) + "\n===END===", target_path=target_path
+            )
+            monkeypatch.setattr(amend, "emit", counting_emit)
+
+            for count, index in enumerate((7, 300, 7)):
+                rendered.clear()
+                amend_result = await amend_tool.execute(
+                    target_path=target_path,
+                    changes={f"BLOCK_{index}.CHILD.KEY": f"changed_{count}"},
+                )
+
+                assert amend_result["status"] == "success"
+                assert rendered == [f"BLOCK_{index}", "CHILD"]
+
+            with open(target_path) as f:
+                content = f.read()
+            assert "BLOCK_7:\n  CHILD:\n    KEY::changed_2\n" in content
+            assert "BLOCK_300:\n  CHILD:\n    KEY::changed_1\n" in content
+            assert content.count("changed_") == 2
+
+    @pytest.mark.asyncio
+    async def test_amend_restating_values_reuses_canonical_text(self, monkeypatch):
+        """Test that changes keeping every field's digest skip re-emission."""
+        create_tool = CreateTool()
+        amend_tool = AmendTool()
+
+        def fail_emit(*args, **kwargs):
+            raise AssertionError("emit() called for an amend that changes nothing")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target_path = os.path.join(tmpdir, "test.oct.md")
+
+            await create_tool.execute(
+                content="===TEST===\nKEY::value1\nCONFIG:\n  TIMEOUT::30\n===END===",
+                target_path=target_path,
+            )
+            monkeypatch.setattr(amend, "emit", fail_emit)
+
+            amend_result = await amend_tool.execute(
+                target_path=target_path,
+                changes={"KEY": "value1", "CONFIG.TIMEOUT": 30},
+            )
+
+            assert amend_result["status"] == "success"
+            assert amend_result["diff"] == "No changes"
+
+    @pytest.mark.asyncio
+    async def test_amend_rejects_paths_that_name_no_field(self):
+        """Test that unknown paths and block paths are reported and nothing is written."""
+        create_tool = CreateTool()
+        amend_tool = AmendTool()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target_path = os.path.join(tmpdir, "test.oct.md")
+
+            await create_tool.execute(
+                content="===TEST===\nCONFIG:\n  TIMEOUT::30\n  RETRY:\n    COUNT::3\n===END===",
+                target_path=target_path,
+            )
+            with open(target_path) as f:
+                original_content = f.read()
+
+            amend_result = await amend_tool.execute(
+                target_path=target_path,
+                changes={"CONFIG.TIMEOUT": 60, "CONFIG.RETRY": "block", "MISSING": 1},
+            )
+
+            assert amend_result["status"] == "error"
+            assert [error["code"] for error in amend_result["errors"]] == ["E_APPLY", "E_APPLY"]
+            assert "CONFIG.RETRY" in amend_result["errors"][0]["message"]
+            assert "MISSING" in amend_result["errors"][1]["message"]
+            with open(target_path) as f:
+                assert f.read() == original_content
+
+    @pytest.mark.asyncio
+    async def test_amend_rejects_ambiguous_dotted_paths(self):
+        """Test that a path matching both a dotted key and a nested path is reported."""
+        create_tool = CreateTool()
+        amend_tool = AmendTool()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target_path = os.path.join(tmpdir, "test.oct.md")
+
+            await create_tool.execute(
+                content="===TEST===\nA.B::1\nA:\n  B::2\n  C::3\n===END===",
+                target_path=target_path,
+            )
+
+            amend_result = await amend_tool.execute(target_path=target_path, changes={"A.B": 9})
+            assert amend_result["status"] == "error"
+            assert amend_result["errors"][0]["code"] == "E_APPLY"
+            assert "ambiguous" in amend_result["errors"][0]["message"]
+
+            amend_result = await amend_tool.execute(target_path=target_path, changes={"A.C": 9})
+            assert amend_result["status"] == "success"
+            with open(target_path) as f:
+                assert f.read() == "===TEST===\nA.B::1\nA:\n  B::2\n  C::9\n===END==="
+
     @pytest.mark.asyncio
     async def test_amend_nonexistent_file_errors(self):
         """Test that amending nonexistent file returns error."""
@@ -236,7 +387,7 @@ TIMEOUT::30
 
             # Create initial file
             await create_tool.execute(
-                content="===TEST===\nKEY::value1\n===END===",
+                content="===TEST===\nKEY::value1\nFLOW::start\n===END===",
                 target_path=target_path,
             )
 
@@ -0,0 +1,221 @@
+"""Tests for AST nodes: dotted-path lookup, copy-on-write updates and Merkle digests."""
+
+from dataclasses import replace
+
+import pytest
+
+from octave_mcp.core import ast_nodes
+from octave_mcp.core.ast_nodes import Assignment, Block
+from octave_mcp.core.parser import parse
+from tests.benchmarks.corpus import generate_document, generate_nested_document
+
+
+class TestPathIndex:
+    """Test dotted-path lookup on Document."""
+
+    CONTENT = """===TEST===
+STATUS::draft
+CONFIG:
+  TIMEOUT::30
+  RETRY:
+    COUNT::3
+CONFIG:
+  TIMEOUT::99
+§2b::DETAILS
+  OWNER::team
+===END===
+"""
+
+    def test_maps_paths_to_nodes_and_parents(self):
+        """Should index nested keys by dotted path with their parents."""
+        doc = parse(self.CONTENT)
+        config = doc.sections[1]
+        assert doc.index["STATUS"] is doc.sections[0]
+        assert doc.index["CONFIG"] is config
+        assert doc.index["CONFIG.RETRY.COUNT"].value == 3
+        assert doc.index.parent("CONFIG.RETRY.COUNT") is config.children[1]
+        assert doc.index.parent("STATUS") is doc
+        assert doc.index["DETAILS.OWNER"].value == "team"
+        assert doc.index.get("CONFIG.MISSING") is None
+        assert "CONFIG.TIMEOUT" in doc.index
+
+    def test_first_node_wins_and_order_is_document_order(self):
+        """Should keep the first of duplicate paths and list paths in document order."""
+        doc = parse(self.CONTENT)
+        assert doc.index["CONFIG.TIMEOUT"].value == 30
+        assert list(doc.index) == [
+            "STATUS",
+            "CONFIG",
+            "CONFIG.TIMEOUT",
+            "CONFIG.RETRY",
+            "CONFIG.RETRY.COUNT",
+            "DETAILS",
+            "DETAILS.OWNER",
+        ]
+
+    def test_flags_paths_from_keys_split_differently(self):
+        """Should flag a path shared by a dotted key and a nested path, but not duplicate keys."""
+        doc = parse(self.CONTENT.replace("§2b", "A.B:\n  X::1\nA:\n  B:\n    X::2\n  C::3\n§2b"))
+        assert doc.index["A.B.X"].value == 1  # First in document order
+        assert [path for path in doc.index if doc.index.ambiguous(path)] == ["A.B", "A.B.X"]
+        assert not doc.index.ambiguous("A.C")
+        assert not doc.index.ambiguous("CONFIG.TIMEOUT")  # Duplicate CONFIG blocks
+
+    def test_section_by_id(self):
+        """Should look up § sections by section id."""
+        doc = parse(self.CONTENT)
+        assert doc.section("2b").key == "DETAILS"
+        with pytest.raises(KeyError):
+            doc.section("3")
+
+    def test_built_once_and_invalidated(self):
+        """Should build the index once and rebuild it after in-place structural changes."""
+        doc = parse(self.CONTENT)
+        assert doc.index is doc.index
+        doc.index["STATUS"].value = "final"  # Value changes keep the index valid
+        assert doc.index["STATUS"].value == "final"
+
+        config = doc.index["CONFIG"]
+        config.children.append(Assignment(key="EXTRA", value=2))
+        assert "CONFIG.EXTRA" not in doc.index  # Stale until invalidated
+        doc.invalidate_caches("CONFIG")
+        assert doc.index["CONFIG.EXTRA"].value == 2
+
+        doc.sections.remove(config)
+        doc.invalidate_caches()
+        assert doc.index["CONFIG.TIMEOUT"].value == 99
+
+        doc.sections = doc.sections[:1]  # Reassigning sections drops the index
+        assert list(doc.index) == ["STATUS"]
+
+    def test_not_part_of_equality_or_pickles(self):
+        """Should not affect equality, copies or pickled documents."""
+        import pickle
+
+        doc = parse(self.CONTENT)
+        indexed = parse(self.CONTENT)
+        assert indexed.index
+        assert indexed == doc
+        assert pickle.loads(pickle.dumps(indexed)) == doc
+        assert replace(indexed, name="COPY").index["STATUS"] is indexed.sections[0]
+
+    def test_deep_documents(self):
+        """Should index documents nested beyond the recursion limit."""
+        doc = parse(generate_nested_document(1500), iterative=True)
+        path = ".".join(f"LEVEL_{level}" for level in range(1500)) + ".FIELD_1"
+        assert doc.index[path].value == 1499 * 2 + 1
+
+
+class TestWithValues:
+    """Test copy-on-write value updates on Document."""
+
+    CONTENT = TestPathIndex.CONTENT
+
+    def test_copies_only_the_spine(self):
+        """Should copy changed assignments and their ancestors and share everything else."""
+        doc = parse(self.CONTENT)
+        updated = doc.with_values({"CONFIG.RETRY.COUNT": 5, "DETAILS.OWNER": "ops"})
+
+        config, new_config = doc.sections[1], updated.sections[1]
+        assert new_config is not config
+        assert new_config.children[1] is not config.children[1]
+        assert new_config.children[0] is config.children[0]  # Sibling of the spine
+        assert updated.sections[0] is doc.sections[0]
+        assert updated.sections[2] is doc.sections[2]  # Second CONFIG block
+        assert updated.index["CONFIG.RETRY.COUNT"].value == 5
+        assert updated.index["DETAILS.OWNER"].value == "ops"
+        assert updated.section("2b") is updated.sections[3]
+
+    def test_leaves_original_unchanged(self):
+        """Should not modify the source document or its index."""
+        doc = parse(self.CONTENT)
+        assert doc.index["STATUS"].value == "draft"  # Built before the update
+        updated = doc.with_value("STATUS", "final")
+        assert doc == parse(self.CONTENT)
+        assert doc.index["STATUS"].value == "draft"
+        assert updated == replace(doc, sections=[replace(doc.sections[0], value="final"), *doc.sections[1:]])
+
+    def test_rejects_missing_paths_and_containers(self):
+        """Should raise KeyError for unknown paths and TypeError for blocks."""
+        doc = parse(self.CONTENT)
+        with pytest.raises(KeyError):
+            doc.with_value("CONFIG.MISSING", 1)
+        with pytest.raises(TypeError):
+            doc.with_value("CONFIG.RETRY", 1)
+
+    def test_deep_documents(self):
+        """Should update documents nested beyond the recursion limit."""
+        doc = parse(generate_nested_document(1500), iterative=True)
+        path = ".".join(f"LEVEL_{level}" for level in range(1500)) + ".FIELD_1"
+        updated = doc.with_value(path, "changed")
+        assert updated.index[path].value == "changed"
+        assert doc.index[path].value == 1499 * 2 + 1
+
+
+class TestDigests:
+    """Test Merkle digests and change detection on AST nodes."""
+
+    CONTENT = TestPathIndex.CONTENT
+
+    def test_equal_canonical_forms_have_equal_digests(self):
+        """Digests should ignore positions and comments and follow canonical text."""
+        doc = parse(self.CONTENT)
+        moved = parse("\n" + self.CONTENT.replace("CONFIG:\n", "CONFIG:  // settings\n", 1))
+        assert moved.digest == doc.digest
+        assert moved.sections[1].digest == doc.sections[1].digest
+        assert doc.sections[1].digest != doc.sections[2].digest  # Same key, different children
+        assert parse(self.CONTENT.replace("===TEST===", "===OTHER===")).digest != doc.digest
+
+    def test_digests_follow_in_place_changes(self):
+        """Digests should reflect nodes changed in place without any invalidation."""
+        doc = parse(self.CONTENT)
+        before = doc.digest
+        doc.index["CONFIG.RETRY.COUNT"].value = 4
+        assert doc.digest == doc.with_value("CONFIG.RETRY.COUNT", 4).digest != before
+        assert doc.digest == parse(self.CONTENT.replace("COUNT::3", "COUNT::4")).digest
+
+        doc.index["CONFIG.RETRY"].children.append(Assignment(key="DELAY", value=1))
+        assert doc.digest == parse(self.CONTENT.replace("COUNT::3", "COUNT::4\n    DELAY::1")).digest
+        doc.sections = doc.sections[:1]
+        assert doc.digest == parse("===TEST===\nSTATUS::draft\n===END===\n").digest
+
+    def test_changed_paths(self):
+        """Should report added, removed, changed and moved nodes at their deepest path."""
+        doc = parse(self.CONTENT)
+        other = parse(
+            self.CONTENT.replace("COUNT::3", "COUNT::4")
+            .replace("STATUS::draft\n", "")
+            .replace("§2b::DETAILS", "STATUS::draft\n§2c::DETAILS")
+            .replace("  OWNER::team\n", "  OWNER::team\n  EXTRA::1\n")
+        )
+        assert doc.changed_paths(doc) == []
+        assert doc.changed_paths(other) == ["STATUS", "CONFIG.RETRY.COUNT", "DETAILS"]
+        assert doc.changed_paths(doc.with_value("CONFIG.TIMEOUT", 31)) == ["CONFIG.TIMEOUT"]
+
+    def test_changed_paths_skips_shared_subtrees(self, monkeypatch):
+        """Should hash only the subtrees with_values() copied, each node once."""
+        doc = parse(generate_document(sections=50, fields=5))
+        updated = doc.with_value("BLOCK_7.BLOCK_7_CHILD.COUNT_1", -1)
+        hashed = []
+        hash_node = ast_nodes._hash_node
+        monkeypatch.setattr(ast_nodes, "_hash_node", lambda node, *args: hashed.append(node) or hash_node(node, *args))
+
+        assert doc.changed_paths(updated) == ["BLOCK_7.BLOCK_7_CHILD.COUNT_1"]
+        assert len({id(node) for node in hashed}) == len(hashed)
+        assert {node.key for node in hashed if isinstance(node, Block)} >= {"BLOCK_7", "BLOCK_7_CHILD"}
+        assert all(node.key.startswith("BLOCK_7") for node in hashed if isinstance(node, Block))
+
+    def test_shadowed_path_updates_and_invalidates(self):
+        """Should follow the real parents of a node under a duplicate (shadowed) container."""
+        doc = parse("BLOCK:\nBLOCK:\n  KEY::value\n")
+        updated = doc.with_value("BLOCK.KEY", "changed")
+        assert updated.sections[1].children[0].value == "changed"
+        assert updated.sections[0] is doc.sections[0]
+        assert doc.changed_paths(updated) == ["BLOCK.KEY"]
+
+    def test_deep_documents(self):
+        """Should hash and diff documents nested beyond the recursion limit."""
+        doc = parse(generate_nested_document(1500), iterative=True)
+        path = ".".join(f"LEVEL_{level}" for level in range(1500)) + ".FIELD_1"
+        assert doc.digest == parse(generate_nested_document(1500), iterative=True).digest
+        assert doc.changed_paths(doc.with_value(path, "changed")) == [path]
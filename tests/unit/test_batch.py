@@ -0,0 +1,116 @@
+"""Tests for parallel parsing of many documents."""
+
+import pickle
+
+import pytest
+
+from octave_mcp.core.batch import ParseResult, parse_many
+from octave_mcp.core.lexer import LexerError
+from octave_mcp.core.parser import ParserError, iter_documents, parse
+
+STREAM = """===FIRST===
+KEY::1
+===END===
+===SECOND===
+BLOCK:
+  CHILD::2
+===END===
+"""
+
+BROKEN = """===GOOD===
+KEY::1
+===END===
+===BAD===
+KEY: value
+===END===
+===AFTER===
+KEY::3
+===END===
+"""
+
+
+class TestParseMany:
+    """Test parse_many() in-process and across worker processes."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_in_input_order(self, tmp_path, workers):
+        """Should return one result per item, in input order, matching a serial parse."""
+        path = tmp_path / "doc.oct.md"
+        path.write_text("===FILE===\nKEY::file\n===END===\n", encoding="utf-8")
+
+        results = parse_many([path], [STREAM, "KEY::value\n"], workers=workers)
+
+        assert [result.source for result in results] == [str(path), "<text 0>", "<text 1>"]
+        assert all(result.ok for result in results)
+        assert [doc.name for doc in results[0].documents] == ["FILE"]
+        assert results[1].documents == list(iter_documents(STREAM))
+        assert results[2].documents == [parse("KEY::value\n")]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_reports_errors_per_item(self, tmp_path, workers):
+        """Should keep parsing other items and report each item's first error."""
+        missing = tmp_path / "missing.oct.md"
+
+        absent, good, broken, tabs = parse_many([missing], [STREAM, BROKEN, "KEY::\tvalue\n"], workers=workers)
+
+        assert good.ok and len(good.documents) == 2
+        assert isinstance(broken.error, ParserError)
+        assert broken.error.error_code == "E001"
+        assert broken.error.token is not None and broken.error.token.line == 5
+        assert [doc.name for doc in broken.documents] == ["GOOD"]
+        assert isinstance(absent.error, FileNotFoundError)
+        assert isinstance(tabs.error, LexerError)
+        assert not tabs.documents
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_str_paths_are_opened(self, tmp_path, workers):
+        """Paths given as str should be read as files, never parsed as text."""
+        paths = []
+        for name in ("ONE", "TWO"):
+            path = tmp_path / f"{name}.oct.md"
+            path.write_text(f"==={name}===\nKEY::1\n===END===\n", encoding="utf-8")
+            paths.append(str(path))
+
+        results = parse_many(paths=paths, workers=workers)
+
+        assert [result.source for result in results] == paths
+        assert [[doc.name for doc in result.documents] for result in results] == [["ONE"], ["TWO"]]
+
+    def test_rejects_a_single_str(self, tmp_path):
+        """A lone str for paths or texts should be rejected rather than iterated by character."""
+        with pytest.raises(TypeError):
+            parse_many(str(tmp_path / "doc.oct.md"))
+        with pytest.raises(TypeError):
+            parse_many(tmp_path / "doc.oct.md")
+        with pytest.raises(TypeError):
+            parse_many(texts=STREAM)
+
+    def test_empty_input(self):
+        """Should return no results for no items."""
+        assert parse_many(workers=2) == []
+        assert parse_many([], [], workers=2) == []
+
+    def test_result_defaults(self):
+        """A result without error should be ok."""
+        assert ParseResult("<text 0>").ok
+
+
+class TestErrorPickling:
+    """Test that parse errors survive the trip back from a worker process."""
+
+    def test_parser_error_round_trips(self):
+        """Should keep message, code and token."""
+        with pytest.raises(ParserError) as exc_info:
+            parse("KEY: value\n")
+        error = pickle.loads(pickle.dumps(exc_info.value))
+        assert str(error) == str(exc_info.value)
+        assert error.error_code == exc_info.value.error_code
+        assert error.token == exc_info.value.token
+
+    def test_lexer_error_round_trips(self):
+        """Should keep message, position and code."""
+        with pytest.raises(LexerError) as exc_info:
+            parse("KEY::\tvalue\n")
+        error = pickle.loads(pickle.dumps(exc_info.value))
+        assert str(error) == str(exc_info.value)
+        assert (error.line, error.column, error.error_code) == (1, 6, "E005")
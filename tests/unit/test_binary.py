@@ -0,0 +1,118 @@
+"""Tests for the binary AST encoding."""
+
+import mmap
+import struct
+
+import pytest
+
+from octave_mcp.core import binary
+from octave_mcp.core.ast_nodes import Assignment, Block, Comment, Document, InlineMap, Section
+from octave_mcp.core.emitter import emit
+from octave_mcp.core.parser import parse
+from tests.benchmarks.corpus import generate_document, generate_nested_document, load_fixture_corpus
+
+CONTENT = """===BINARY===
+META:
+  TYPE::"TEST"
+  VERSION::"1.0"
+---
+§1::OVERVIEW[core,draft]
+  STATUS::active
+  FLOW::A→B→C
+  TAGS::[a, "two words", [nested, 3], []]
+  OPTIONS::[mode::fast, retries::2]
+§2b::DETAILS
+  EMPTY::""
+  NOTHING::null
+  FLAGS::[true, false]
+  NUMBERS::[0, -1, 3.14, -1e10, 123456789012345678901234567890]
+BLOCK:
+  CHILD:
+    KEY::"ünïcödé ✓"
+===END===
+"""
+
+
+class TestRoundTrip:
+    """Test that loads(dumps(doc)) rebuilds the document."""
+
+    def test_all_node_and_value_types(self):
+        """Should keep nodes, positions, values and their types."""
+        doc = parse(CONTENT)
+        decoded = binary.loads(binary.dumps(doc))
+
+        assert decoded == doc
+        assert emit(decoded) == emit(doc)
+        numbers = decoded.section("2b").children[3].value.items
+        assert [type(number) for number in numbers] == [int, int, float, float, int]
+        assert isinstance(decoded.section("1").children[3].value.items[0], InlineMap)
+        assert decoded.meta == {"TYPE": "TEST", "VERSION": "1.0"}
+
+    def test_hand_built_nodes(self):
+        """Should keep comments, annotation-less sections and empty containers."""
+        doc = Document(
+            name="HAND",
+            sections=[
+                Comment(line=1, text="note"),
+                Section(section_id="3", key="EMPTY"),
+                Block(key="OUTER", children=[Block(key="INNER"), Assignment(key="MAP", value=InlineMap())]),
+                Assignment(key="BIG", value=-(2**80)),
+            ],
+        )
+        assert binary.loads(binary.dumps(doc)) == doc
+
+    def test_fixtures_and_synthetic_documents(self):
+        """Should round-trip every fixture and large and deep synthetic documents."""
+        documents = [parse(content) for content in load_fixture_corpus().values()]
+        documents.append(parse(generate_document(sections=200)))
+        for doc in documents:
+            decoded = binary.loads(binary.dumps(doc))
+            assert decoded == doc
+            assert emit(decoded) == emit(doc)
+
+        # Too deep for == and emit(), which recurse
+        deep = parse(generate_nested_document(1500), iterative=True)
+        decoded = binary.loads(binary.dumps(deep))
+        assert decoded.digest == deep.digest
+        assert list(decoded.index) == list(deep.index)
+
+    def test_shares_repeated_strings(self):
+        """Repeated keys should decode to one string object, as from the parser."""
+        decoded = binary.loads(binary.dumps(parse("A:\n  KEY::1\nB:\n  KEY::2\n")))
+        assert decoded.sections[0].children[0].key is decoded.sections[1].children[0].key
+
+    def test_loads_from_buffers(self, tmp_path):
+        """Should decode from memoryview and mmap without copying them first."""
+        doc = parse(CONTENT)
+        data = binary.dumps(doc)
+        assert binary.loads(memoryview(bytearray(data))) == doc
+
+        path = tmp_path / "doc.octb"
+        path.write_bytes(data)
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert binary.loads(mapped) == doc
+
+
+class TestErrors:
+    """Test rejection of data that is not a valid encoding."""
+
+    def test_rejects_other_data(self):
+        """Should raise ValueError for foreign, truncated or corrupt data."""
+        data = binary.dumps(parse(CONTENT))
+        with pytest.raises(ValueError, match="Not an encoded"):
+            binary.loads(b"XXXX" + data[4:])
+        for broken in (data[:10], data[:-1], data + b"\0", b""):
+            with pytest.raises(ValueError, match="Truncated or corrupt"):
+                binary.loads(broken)
+
+    def test_rejects_other_versions(self):
+        """Should raise ValueError for another format version."""
+        data = bytearray(binary.dumps(parse(CONTENT)))
+        struct.pack_into("<H", data, 4, binary.FORMAT_VERSION + 1)
+        with pytest.raises(ValueError, match="version"):
+            binary.loads(data)
+
+    def test_rejects_unknown_values(self):
+        """Should raise TypeError for values the parser never produces."""
+        with pytest.raises(TypeError, match="object"):
+            binary.dumps(Document(sections=[Assignment(key="KEY", value=object())]))
@@ -1,5 +1,7 @@
 """Tests for CLI (P1.7)."""
 
+from pathlib import Path
+
 from click.testing import CliRunner
 
 from octave_mcp.cli.main import cli
@@ -14,3 +16,45 @@ class TestCLI:
         result = runner.invoke(cli, ["--help"])
         assert result.exit_code == 0
         assert "OCTAVE command-line tools" in result.output
+
+    def test_validate_valid_file(self):
+        """Should report a valid fixture as valid."""
+        fixture = Path(__file__).resolve().parents[1] / "fixtures" / "test_valid.oct.md"
+        runner = CliRunner()
+        result = runner.invoke(cli, ["validate", str(fixture)])
+        assert result.exit_code == 0
+        assert "Valid" in result.output
+
+    def test_validate_reports_lexer_error_position(self, tmp_path):
+        """Should report lexer errors with character positions for non-ASCII files."""
+        path = tmp_path / "doc.oct.md"
+        path.write_text('===DOC===\nNAME::"café"\tX\n===END===', encoding="utf-8")
+        runner = CliRunner()
+        result = runner.invoke(cli, ["validate", str(path)])
+        assert result.exit_code != 0
+        assert "line 2, column 13" in result.output
+
+    def test_validate_many_files(self, tmp_path):
+        """Should validate every file and name the file of each error."""
+        good = tmp_path / "good.oct.md"
+        good.write_text("===DOC===\nKEY::value\n===END===\n", encoding="utf-8")
+        bad = tmp_path / "bad.oct.md"
+        bad.write_text("===DOC===\nKEY: value\n===END===\n", encoding="utf-8")
+        runner = CliRunner()
+
+        assert runner.invoke(cli, ["validate", str(good), str(good)]).exit_code == 0
+        result = runner.invoke(cli, ["validate", str(good), str(bad)])
+        assert result.exit_code != 0
+        assert f"{bad}: Error: E001" in result.output
+        assert str(good) not in result.output
+
+    def test_validate_with_cache_dir(self, tmp_path):
+        """Should give the same result with a parse cache, and fill it."""
+        fixture = Path(__file__).resolve().parents[1] / "fixtures" / "test_valid.oct.md"
+        cache_dir = tmp_path / "cache"
+        runner = CliRunner()
+        for _ in range(2):
+            result = runner.invoke(cli, ["validate", str(fixture), "--cache-dir", str(cache_dir)])
+            assert result.exit_code == 0
+            assert "Valid" in result.output
+        assert len(list(cache_dir.glob("*.ast"))) == 1
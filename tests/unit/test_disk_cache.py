@@ -0,0 +1,147 @@
+"""Tests for the persistent on-disk parse cache."""
+
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from octave_mcp.core import binary
+from octave_mcp.core.disk_cache import _ENTRY, DiskCache
+from octave_mcp.core.parser import ParserError, parse
+
+CONTENT = """===DOC===
+META:
+  TYPE::"TEST"
+---
+BLOCK:
+  KEY::[a, b]
+===END===
+"""
+
+
+class _Planted:
+    """Pickles to a call that creates a marker file when unpickled."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __reduce__(self):
+        return (open, (self.path, "w"))
+
+
+@pytest.fixture
+def source(tmp_path):
+    """An OCTAVE file to parse."""
+    path = tmp_path / "doc.oct.md"
+    path.write_text(CONTENT, encoding="utf-8")
+    return path
+
+
+class TestDiskCache:
+    """Test DiskCache.parse_file()."""
+
+    def test_reuses_entry_across_instances(self, tmp_path, source, monkeypatch):
+        """A new cache over the same directory should load the document without parsing."""
+        from octave_mcp.core import disk_cache
+
+        first = DiskCache(tmp_path / "cache")
+        assert first.parse_file(source) == parse(CONTENT)
+        assert (first.hits, first.misses) == (0, 1)
+
+        monkeypatch.setattr(disk_cache, "parse", lambda content: pytest.fail("parsed again"))
+        second = DiskCache(tmp_path / "cache")
+        assert second.parse_file(source) == parse(CONTENT)
+        assert (second.hits, second.misses) == (1, 0)
+
+    def test_returns_independent_documents(self, tmp_path, source):
+        """Modifying a returned document should not change the cached one."""
+        cache = DiskCache(tmp_path / "cache")
+        cache.parse_file(source).sections.clear()
+        assert cache.parse_file(source) == parse(CONTENT)
+
+    def test_reparses_changed_content(self, tmp_path, source):
+        """A changed file should be parsed again."""
+        cache = DiskCache(tmp_path / "cache")
+        cache.parse_file(source)
+        source.write_text(CONTENT.replace("[a, b]", "[c]"), encoding="utf-8")
+        assert cache.parse_file(source).sections[0].children[0].value.items == ["c"]
+        assert cache.misses == 2
+
+    def test_touched_file_matches_by_hash(self, tmp_path, source):
+        """A file with a new mtime but the same content should still hit."""
+        cache = DiskCache(tmp_path / "cache")
+        cache.parse_file(source)
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.parse_file(source) == parse(CONTENT)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_invalidated_by_parser_version(self, tmp_path, source, monkeypatch):
+        """Entries written by another parser version should not be used."""
+        from octave_mcp.core import disk_cache
+
+        DiskCache(tmp_path / "cache").parse_file(source)
+        monkeypatch.setattr(disk_cache, "PARSER_VERSION", "other")
+        cache = DiskCache(tmp_path / "cache")
+        cache.parse_file(source)
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_recovers_from_corrupt_entry(self, tmp_path, source):
+        """A truncated entry should be treated as missing and replaced."""
+        cache = DiskCache(tmp_path / "cache")
+        cache.parse_file(source)
+        (entry,) = (tmp_path / "cache").glob("*.ast")
+        entry.write_bytes(entry.read_bytes()[:10])
+
+        assert cache.parse_file(source) == parse(CONTENT)
+        assert entry.read_bytes()[:4] == b"OCTC"
+        assert binary.loads(entry.read_bytes()[_ENTRY.size :]) == parse(CONTENT)
+
+    def test_recovers_from_corrupt_document(self, tmp_path, source):
+        """An entry whose encoded document does not decode should be replaced."""
+        cache = DiskCache(tmp_path / "cache")
+        cache.parse_file(source)
+        (entry,) = (tmp_path / "cache").glob("*.ast")
+        entry.write_bytes(entry.read_bytes()[:-3])
+
+        assert cache.parse_file(source) == parse(CONTENT)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_never_unpickles_entries(self, tmp_path, source):
+        """A pickle planted as an entry should be replaced without being loaded."""
+        cache = DiskCache(tmp_path / "cache")
+        cache.parse_file(source)
+        (entry,) = (tmp_path / "cache").glob("*.ast")
+        marker = tmp_path / "unpickled"
+        entry.write_bytes(pickle.dumps(_Planted(str(marker))))
+
+        assert cache.parse_file(source) == parse(CONTENT)
+        assert not marker.exists()
+        assert entry.read_bytes()[:4] == b"OCTC"
+
+    def test_errors_are_not_cached(self, tmp_path):
+        """Files that fail to parse should raise every time and leave no entry."""
+        path = tmp_path / "bad.oct.md"
+        path.write_text("KEY: value\n", encoding="utf-8")
+        cache = DiskCache(tmp_path / "cache")
+        for _ in range(2):
+            with pytest.raises(ParserError):
+                cache.parse_file(path)
+        assert not list((tmp_path / "cache").iterdir())
+
+    def test_concurrent_writers(self, tmp_path, source):
+        """Concurrent writers should leave one complete entry and no temp files."""
+        caches = [DiskCache(tmp_path / "cache") for _ in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            docs = list(executor.map(lambda cache: cache.parse_file(source), caches))
+        assert all(doc == parse(CONTENT) for doc in docs)
+        assert [path.suffix for path in (tmp_path / "cache").iterdir()] == [".ast"]
+
+    def test_clear(self, tmp_path, source):
+        """Clearing should delete entries and reset counters."""
+        cache = DiskCache(tmp_path / "cache")
+        cache.parse_file(source)
+        cache.clear()
+        assert not list((tmp_path / "cache").iterdir())
+        assert (cache.hits, cache.misses) == (0, 0)
@@ -9,7 +9,11 @@ Tests projection modes:
 
 import pytest
 
+from octave_mcp.core.export import to_dict
+from octave_mcp.core.parser import iter_events, parse
 from octave_mcp.mcp.eject import EjectTool
+from tests.benchmarks.corpus import generate_nested_document, load_fixture_corpus
+from tests.benchmarks.legacy_export import ast_to_dict
 
 
 class TestEjectTool:
@@ -286,3 +290,66 @@ DEPS::[lib1, lib2]
         assert "TESTS" not in parsed, "TESTS field should be filtered out in executive mode"
         assert "CI" not in parsed, "CI field should be filtered out in executive mode"
         assert "DEPS" not in parsed, "DEPS field should be filtered out in executive mode"
+
+
+class TestSelectiveProjection:
+    """Test that projections only parse the fields they keep."""
+
+    @pytest.mark.asyncio
+    async def test_executive_output_matches_full_parse(self):
+        """Should give the same output as projecting a fully parsed document."""
+        from octave_mcp.core.emitter import emit
+        from octave_mcp.core.projector import _filter_fields
+
+        content = """===TEST===
+META:
+  TYPE::"TEST"
+STATUS::active
+TESTS:
+  UNIT::passing
+PLAN:
+  RISKS::[late]
+  OTHER::1
+DECISIONS::[ship]
+===END===
+"""
+        result = await EjectTool().execute(content=content, schema="TEST", mode="executive")
+        expected = _filter_fields(parse(content), ["STATUS", "RISKS", "DECISIONS"])
+        assert result["output"] == emit(expected)
+        assert "RISKS::[late]" in result["output"]
+        assert "UNIT" not in result["output"]
+
+
+class TestEventExport:
+    """Test JSON/YAML export built from parser events."""
+
+    def test_events_to_dict_matches_ast_to_dict(self):
+        """Should build the same dictionary as converting the AST, and as eject used to."""
+        documents = list(load_fixture_corpus().values())
+        documents.append(generate_nested_document(20))
+        documents.append(generate_nested_document(5, sections=True))
+        documents.append("""===TEST===
+META:
+  TYPE::"TEST"
+KEY::[a, [b, c], x::1]
+§1::FIRST
+  INNER:
+    KEY::2
+OUTER:
+  §2::NESTED[draft]
+    KEY::3
+  KEY::value
+KEY::overridden
+===END===
+""")
+        for content in documents:
+            assert to_dict(iter_events(content)) == to_dict(parse(content)) == ast_to_dict(parse(content))
+        assert to_dict(parse(documents[-1]))["§1::FIRST"]["OUTER"]["§2::NESTED[draft]"] == {"KEY": 3}
+
+    @pytest.mark.asyncio
+    async def test_parse_error_in_json_export(self):
+        """Should report parse errors like the AST path."""
+        content = "===TEST===\nBLOCK:\n  KEY: value\n===END===\n"
+        result = await EjectTool().execute(content=content, schema="TEST", format="json")
+        assert result["output"].startswith("# Parse error: E001")
+        assert result["lossy"] is False
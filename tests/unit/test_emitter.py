@@ -8,9 +8,13 @@ Tests AST → canonical OCTAVE string emission with:
 - Idempotence
 """
 
-from octave_mcp.core.ast_nodes import Assignment, Block, Document, ListValue
-from octave_mcp.core.emitter import emit
+import io
+
+from octave_mcp.core import binary
+from octave_mcp.core.ast_nodes import Assignment, Block, Comment, Document, ListValue, Section
+from octave_mcp.core.emitter import emit, emit_block, emit_section, emit_to, export_text_cache, restore_text_cache
 from octave_mcp.core.parser import parse
+from tests.benchmarks.corpus import generate_document, generate_nested_document, load_fixture_corpus
 
 
 class TestCanonicalEmission:
@@ -158,3 +162,121 @@ class TestBlockEmission:
         doc = Document(name="TEST", sections=[Block(key="EMPTY", children=[])])
         result = emit(doc)
         assert "EMPTY:" in result
+
+
+class TestStreamingEmission:
+    """Test emit_to() writing to a text sink."""
+
+    class RecordingSink:
+        """Text sink that records each write."""
+
+        def __init__(self):
+            self.writes = []
+
+        def write(self, text):
+            self.writes.append(text)
+            return len(text)
+
+    def test_matches_emit(self, tmp_path):
+        """Should write exactly the text emit() returns, to any text stream."""
+        documents = [parse(content) for content in load_fixture_corpus().values()]
+        documents.append(parse(generate_document(sections=300)))
+        for doc in documents:
+            output = io.StringIO()
+            emit_to(doc, output)
+            assert output.getvalue() == emit(doc)
+
+        path = tmp_path / "out.oct.md"
+        with open(path, "w", encoding="utf-8") as f:
+            emit_to(documents[-1], f)
+        assert path.read_text(encoding="utf-8") == emit(documents[-1])
+
+    def test_writes_in_batches(self):
+        """Should write large documents in a few batches rather than line by line."""
+        doc = Document(name="TEST", sections=[Assignment(key=f"KEY_{i}", value=i) for i in range(5000)])
+        sink = self.RecordingSink()
+        emit_to(doc, sink)
+        assert 1 < len(sink.writes) < 10
+        assert "".join(sink.writes) == emit(doc)
+
+    def test_deep_documents(self):
+        """Should emit documents nested beyond the recursion limit."""
+        doc = parse(generate_nested_document(1500), iterative=True)
+        lines = emit(doc).split("\n")
+        assert len(lines) == 4 + 1500 * 3 + 1
+        assert lines[-4:] == [
+            "  " * 1499 + "LEVEL_1499:",
+            "  " * 1500 + "FIELD_0::2998",
+            "  " * 1500 + "FIELD_1::2999",
+            "===END===",
+        ]
+
+    def test_nested_emitters_and_skipped_nodes(self):
+        """emit_block() and emit_section() should indent and skip comments as before."""
+        block = Block(key="OUTER", children=[Comment(text="note"), Block(key="INNER", children=[])])
+        assert emit_block(block, 1) == "  OUTER:\n    INNER:"
+        section = Section(section_id="2b", key="NAME", annotation="x", children=[Assignment(key="K", value=1)])
+        assert emit_section(section) == "§2b::NAME[x]\n  K::1"
+
+
+class TestIncrementalEmission:
+    """Test reuse of the text cached on blocks and sections."""
+
+    CONTENT = generate_document(sections=3, fields=3, depth=2)
+
+    def test_reemits_only_changed_subtrees(self):
+        """After with_values(), unchanged subtrees should be spliced from the cache."""
+        doc = parse(self.CONTENT)
+        emit(doc, reuse=True)
+        updated = doc.with_value("BLOCK_1.BLOCK_1_CHILD.COUNT_1", 99)
+
+        assert emit(updated, reuse=True) == emit(binary.loads(binary.dumps(updated)))
+        assert updated.sections[0]._text is doc.sections[0]._text
+        assert updated.sections[2]._text is doc.sections[2]._text
+        assert "COUNT_1::99" in updated.sections[1]._text[1]
+        assert "COUNT_1::99" not in doc.sections[1]._text[1]
+
+    def test_invalidate_caches_after_in_place_changes(self):
+        """In-place changes should be emitted once the changed node's caches are dropped."""
+        doc = parse(self.CONTENT)
+        emit(doc, reuse=True)
+        doc.index["BLOCK_2.BLOCK_2_CHILD.BLOCK_2_CHILD_CHILD.NAME_0"].value = "renamed"
+        doc.invalidate_caches("BLOCK_2.BLOCK_2_CHILD.BLOCK_2_CHILD_CHILD.NAME_0")
+
+        assert emit(doc) == emit(binary.loads(binary.dumps(doc)))
+        assert "NAME_0::renamed" in emit(doc, reuse=True)
+
+    def test_plain_emission_ignores_the_cache(self):
+        """Without reuse, emission should neither keep text nor splice stale text."""
+        doc = parse("===T===\nB:\n  K::1\n===END===")
+        emit(doc)
+        assert doc.sections[0]._text is None
+
+        emit(doc, reuse=True)
+        doc.sections[0].children[0].value = 2
+        doc.sections[0].children.append(Assignment(key="ADDED", value=3))
+        assert emit(doc) == "===T===\nB:\n  K::2\n  ADDED::3\n===END==="
+        with io.StringIO() as sink:
+            emit_to(doc, sink)
+            assert sink.getvalue() == emit(doc)
+
+    def test_text_cached_at_another_indent_is_not_reused(self):
+        """A node emitted at one indent should be rendered again at another."""
+        block = Block(key="OUTER", children=[Block(key="INNER", children=[Assignment(key="K", value=1)])])
+        assert emit_block(block, 1) == "  OUTER:\n    INNER:\n      K::1"
+        assert emit_block(block) == "OUTER:\n  INNER:\n    K::1"
+        assert emit(Document(name="TEST", sections=[block])) == "===TEST===\nOUTER:\n  INNER:\n    K::1\n===END==="
+
+    def test_restores_text_on_copies(self):
+        """Text exported from an emitted document should be reused by an identical copy."""
+        doc = parse(self.CONTENT)
+        canonical = emit(doc, reuse=True)
+        copy = binary.loads(binary.dumps(doc))
+        restore_text_cache(copy, export_text_cache(doc))
+
+        assert copy.sections[0]._text is doc.sections[0]._text
+        assert copy.sections[0].children[3]._text is doc.sections[0].children[3]._text
+        assert emit(copy, reuse=True) == canonical
+        assert emit(copy.with_value("BLOCK_0.NAME_0", "x"), reuse=True) == emit(
+            parse(canonical).with_value("BLOCK_0.NAME_0", "x")
+        )
@@ -0,0 +1,320 @@
+"""Tests for streaming JSON, YAML and Markdown export."""
+
+import io
+import json
+import math
+
+import pytest
+import yaml
+
+from octave_mcp.core.ast_nodes import Assignment, Block, Document, InlineMap, ListValue, Section
+from octave_mcp.core.export import (
+    section_key,
+    to_dict,
+    to_json,
+    to_markdown,
+    to_yaml,
+    write_json,
+    write_markdown,
+    write_yaml,
+)
+from octave_mcp.core.parser import ParserError, iter_events, parse
+from octave_mcp.mcp.eject import EjectTool
+from tests.benchmarks.corpus import generate_document, generate_nested_document, load_fixture_corpus
+from tests.benchmarks.legacy_export import ast_to_dict, ast_to_markdown
+
+SECTIONS = """===TEST===
+META:
+  TYPE::"TEST"
+§1::OVERVIEW
+  STATUS::active
+  INNER:
+    §2b::NESTED[draft]
+      KEY::2
+§CONTEXT::
+KEY::value
+===END===
+"""
+
+
+class TestJsonExport:
+    """Test to_json() and write_json() on ASTs and event streams."""
+
+    def test_matches_json_dumps(self):
+        """Should write exactly what json.dumps() writes for the document's dict form."""
+        for content in load_fixture_corpus().values():
+            data = ast_to_dict(parse(content))
+            expected = json.dumps(data, indent=2, ensure_ascii=False)
+            assert to_json(parse(content)) == expected
+            assert to_json(iter_events(content)) == expected
+
+            compact = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            assert to_json(parse(content), compact=True) == compact
+            assert to_json(iter_events(content), compact=True) == compact
+
+    def test_exports_sections(self):
+        """Should export § sections as objects keyed by their header."""
+        data = json.loads(to_json(parse(SECTIONS)))
+        assert data == {
+            "META": {"TYPE": "TEST"},
+            "§1::OVERVIEW": {"STATUS": "active", "INNER": {"§2b::NESTED[draft]": {"KEY": 2}}},
+            "§CONTEXT::CONTEXT": {},
+            "KEY": "value",
+        }
+        assert to_json(iter_events(SECTIONS)) == to_json(parse(SECTIONS))
+        assert section_key(Section(section_id="3", key="NAME")) == "§3::NAME"
+
+    def test_values(self):
+        """Should encode every OCTAVE value type as json.dumps() does at any depth."""
+        value = ListValue(
+            [1, -2.5, 10**30, None, True, 'say "hi"\n', "→", ListValue([]), InlineMap({"k": ListValue(["v"])})]
+        )
+        doc = Document(
+            name="TEST",
+            meta={"TAGS": ListValue(["a"])},
+            sections=[
+                Block(key="OUTER", children=[Assignment(key="VALUE", value=value)]),
+                Assignment(key="F", value=1e100),
+            ],
+        )
+        data = {
+            "META": {"TAGS": ["a"]},
+            "OUTER": {"VALUE": [1, -2.5, 10**30, None, True, 'say "hi"\n', "→", [], {"k": ["v"]}]},
+            "F": 1e100,
+        }
+        assert to_json(doc) == json.dumps(data, indent=2, ensure_ascii=False)
+        assert to_json(doc, compact=True) == json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    def test_duplicate_keys_in_document_order(self):
+        """Should write repeated keys where they occur, so parsers read the last value."""
+        content = "===TEST===\nKEY::1\nBLOCK:\n  A::1\nKEY::2\nBLOCK:\n  B::2\n===END===\n"
+        output = to_json(parse(content), compact=True)
+        assert output == '{"KEY":1,"BLOCK":{"A":1},"KEY":2,"BLOCK":{"B":2}}'
+        assert json.loads(output) == to_dict(parse(content))
+
+    def test_deep_documents(self):
+        """Should export documents nested beyond the recursion limit."""
+        content = generate_nested_document(1500)
+        output = to_json(parse(content, iterative=True), compact=True)
+        assert output == to_json(iter_events(content), compact=True)
+        assert output.startswith('{"META":{"TYPE":"BENCHMARK"},"LEVEL_0":{"FIELD_0":0,"FIELD_1":1,"LEVEL_1":{')
+        assert output.endswith('"FIELD_1":2999' + "}" * 1501)
+
+    def test_writes_to_sink_in_batches(self):
+        """Should write large documents to the sink in several writes."""
+        doc = Document(name="TEST", sections=[Assignment(key=f"KEY_{i}", value=i) for i in range(5000)])
+        sink = io.StringIO()
+        writes = []
+        sink.write = lambda text: writes.append(text) or len(text)
+        write_json(doc, sink)
+        assert 1 < len(writes) < 100
+        assert "".join(writes) == to_json(doc)
+
+    def test_event_errors_propagate(self):
+        """Should raise parse errors from an event stream when reached."""
+        with pytest.raises(ParserError):
+            to_json(iter_events("===TEST===\nBLOCK:\n  KEY: value\n===END===\n"))
+
+
+class TestYamlExport:
+    """Test to_yaml() and write_yaml() on ASTs and event streams."""
+
+    def test_round_trips(self):
+        """Should read back with yaml.safe_load() as the document's dict form."""
+        documents = list(load_fixture_corpus().values())
+        documents.append(generate_document(sections=20, fields=5))
+        documents.append(generate_nested_document(5, sections=True))
+        documents.append(SECTIONS)
+        for content in documents:
+            output = to_yaml(parse(content))
+            assert yaml.safe_load(output) == to_dict(parse(content)) == ast_to_dict(parse(content))
+            assert to_yaml(iter_events(content)) == output
+
+    def test_matches_yaml_dump_layout(self):
+        """Should lay out mappings and sequences as yaml.dump() does in block style."""
+        data = {
+            "META": {"TYPE": "TEST"},
+            "LIST": ["a", ["b", "c"], {"k": "v", "num": 1}, [], {}],
+            "OUTER": {"EMPTY": {}, "INNER": {"KEY": None}},
+        }
+        doc = Document(
+            name="TEST",
+            meta={"TYPE": "TEST"},
+            sections=[
+                Assignment(
+                    key="LIST",
+                    value=ListValue(
+                        ["a", ListValue(["b", "c"]), InlineMap({"k": "v", "num": 1}), ListValue([]), InlineMap()]
+                    ),
+                ),
+                Block(
+                    key="OUTER",
+                    children=[Block(key="EMPTY"), Block(key="INNER", children=[Assignment(key="KEY", value=None)])],
+                ),
+            ],
+        )
+        assert to_yaml(doc) == yaml.dump(data, allow_unicode=True, sort_keys=False, default_flow_style=False)
+
+    def test_quotes_scalars_that_would_change(self):
+        """Should quote operators, reserved words and number-like strings so they read back as strings."""
+        strings = [
+            "A→B",
+            "A⊕B",
+            "§1::A",
+            "x: y",
+            "a #b",
+            " lead",
+            "trail ",
+            "- dash",
+            "[list]",
+            "{map}",
+            "*alias",
+            "&anchor",
+            "!tag",
+            "%dir",
+            "@at",
+            "`tick",
+            "'quote'",
+            'say "hi"',
+            "back\\slash",
+            "line\nnext",
+            "tab\tstop",
+            "\u2028",
+            "",
+            "1.0",
+            "0x1F",
+            "1e3",
+            ".inf",
+            "~",
+            "yes",
+            "No",
+            "ON",
+            "null",
+            "True",
+            "y",
+            "2024-01-01",
+            "café",
+            "x" * 1000 + "→",
+        ]
+        values = [*strings, 0, -7, 10**30, 1.5, -0.0, 1e100, float("inf"), None, True, False]
+        doc = Document(name="TEST", sections=[Assignment(key=f"KEY_{i}", value=v) for i, v in enumerate(values)])
+        doc.sections.append(Assignment(key="LIST", value=ListValue(values)))
+        doc.sections.append(Block(key="A→B", children=[Assignment(key="yes", value="no")]))
+        loaded = yaml.safe_load(to_yaml(doc))
+        assert loaded == to_dict(doc)
+        assert all(type(loaded[f"KEY_{i}"]) is type(v) for i, v in enumerate(values))
+        assert 'KEY_0: "A→B"\n' in to_yaml(doc)
+
+    def test_nan(self):
+        """Should write NaN as YAML's .nan."""
+        output = to_yaml(Document(name="TEST", sections=[Assignment(key="F", value=float("nan"))]))
+        assert output == "F: .nan\n"
+        assert math.isnan(yaml.safe_load(output)["F"])
+
+    def test_empty_containers(self):
+        """Should write empty documents, blocks and sections as empty flow mappings."""
+        assert to_yaml(Document(name="TEST")) == "{}\n"
+        doc = Document(name="TEST", sections=[Block(key="BLOCK"), Section(section_id="1", key="EMPTY")])
+        assert to_yaml(doc) == 'BLOCK: {}\n"§1::EMPTY": {}\n'
+
+    def test_deep_documents(self):
+        """Should export documents nested beyond the recursion limit."""
+        content = generate_nested_document(1500)
+        output = to_yaml(parse(content, iterative=True))
+        assert output == to_yaml(iter_events(content))
+        assert output.endswith("  " * 1500 + "FIELD_1: 2999\n")
+
+    def test_writes_to_sink_in_batches(self):
+        """Should write large documents to the sink in several writes."""
+        doc = Document(
+            name="TEST", sections=[Block(key=f"BLOCK_{i}", children=[Block(key="INNER")]) for i in range(5000)]
+        )
+        doc.sections.append(Assignment(key="KEY", value=1))
+        sink = io.StringIO()
+        writes = []
+        sink.write = lambda text: writes.append(text) or len(text)
+        write_yaml(doc, sink)
+        assert len(writes) > 1
+        assert "".join(writes) == to_yaml(doc)
+        assert yaml.safe_load(to_yaml(doc))["BLOCK_0"] == {"INNER": {}}
+
+
+class TestMarkdownExport:
+    """Test to_markdown() and write_markdown() on ASTs and event streams."""
+
+    def test_matches_previous_layout(self):
+        """Should lay out documents of string values exactly as eject used to."""
+        content = """===TEST===
+META:
+  TYPE::"TEST"
+  VERSION::"1.0"
+STATUS::active
+OUTER:
+  KEY::value
+  INNER:
+    DEEP::"quoted text"
+  AFTER::value
+NEXT::"done"
+EMPTY:
+===END===
+"""
+        doc = parse(content)
+        assert to_markdown(doc) == ast_to_markdown(doc)
+        assert to_markdown(iter_events(content)) == to_markdown(doc)
+        assert to_markdown(Document(name="TEST")) == ast_to_markdown(Document(name="TEST")) == "# TEST\n"
+
+    def test_values_and_sections(self):
+        """Should write non-string values in canonical form and § sections as headings."""
+        output = to_markdown(parse(SECTIONS.replace("KEY::2", "KEY::[a, true]")))
+        assert "\n## §1::OVERVIEW\n\n- **STATUS**: active\n### INNER\n\n#### §2b::NESTED[draft]\n" in output
+        assert "- **KEY**: [a,true]" in output
+        assert output.endswith("## §CONTEXT::CONTEXT\n\n**KEY**: value\n")
+
+    def test_streams_from_events(self):
+        """Should write the same text from events as from the AST, in batches to a sink."""
+        for content in [*load_fixture_corpus().values(), generate_nested_document(5, sections=True)]:
+            assert to_markdown(iter_events(content)) == to_markdown(parse(content))
+
+        content = generate_document(sections=500, fields=5)
+        sink = io.StringIO()
+        writes = []
+        sink.write = lambda text: writes.append(text) or len(text)
+        write_markdown(iter_events(content), sink)
+        assert len(writes) > 1
+        assert "".join(writes) == to_markdown(parse(content))
+
+
+class TestEjectJson:
+    """Test JSON output of the eject tool."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["canonical", "executive"])
+    async def test_compact_and_sections(self, mode):
+        """Should export sections and honor compact in both the event and AST paths."""
+        content = SECTIONS.replace("KEY::value", "STATUS::done")
+        result = await EjectTool().execute(content=content, schema="TEST", mode=mode, format="json", compact=True)
+        assert "\n" not in result["output"]
+        assert json.loads(result["output"])["STATUS"] == "done"
+        if mode == "canonical":
+            assert json.loads(result["output"])["§1::OVERVIEW"]["INNER"]["§2b::NESTED[draft]"] == {"KEY": 2}
+
+
+class TestEjectYamlMarkdown:
+    """Test YAML and Markdown output of the eject tool."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["canonical", "executive"])
+    async def test_yaml_round_trips(self, mode):
+        """Should write YAML that reads back as the projected document in both the event and AST paths."""
+        content = SECTIONS.replace("KEY::value", "STATUS::A→B")
+        result = await EjectTool().execute(content=content, schema="TEST", mode=mode, format="yaml")
+        data = yaml.safe_load(result["output"])
+        assert data["STATUS"] == "A→B"
+        if mode == "canonical":
+            assert data == to_dict(parse(content))
+
+    @pytest.mark.asyncio
+    async def test_markdown(self):
+        """Should write Markdown from the projected document."""
+        result = await EjectTool().execute(content=SECTIONS, schema="TEST", format="markdown")
+        assert result["output"] == to_markdown(parse(SECTIONS))
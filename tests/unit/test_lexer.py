@@ -2,7 +2,17 @@
 
 import pytest
 
-from octave_mcp.core.lexer import LexerError, TokenType, tokenize
+from octave_mcp.core.lexer import (
+    LexerError,
+    Token,
+    TokenType,
+    iter_tokens,
+    relex,
+    tokenize,
+    tokenize_buffer,
+    tokenize_bytes,
+    tokenize_file,
+)
 
 
 class TestLexerBasicTokenization:
@@ -363,3 +373,436 @@ class TestHyphenatedIdentifiers:
         number_tokens = [t for t in tokens if t.type == TokenType.NUMBER]
         assert len(number_tokens) == 1
         assert number_tokens[0].value == -42
+
+
+def _assert_matches_legacy(content):
+    """Assert tokenize() agrees with the original lexer and reports true positions."""
+    from tests.benchmarks import legacy_lexer
+
+    tokens, repairs = tokenize(content)
+    expected_tokens, expected_repairs = legacy_lexer.tokenize(content)
+    assert legacy_lexer.signature(tokens, repairs) == legacy_lexer.signature(expected_tokens, expected_repairs)
+
+    offsets = legacy_lexer.positions(content)
+    actual = [(token.line, token.column) for token in tokens]
+    assert actual == [offsets[token.offset] for token in tokens]
+    assert [(repair["line"], repair["column"]) for repair in repairs] == [
+        (token.line, token.column) for token in tokens if token.normalized_from
+    ]
+    if not legacy_lexer.has_position_quirks(content):
+        assert actual == [(token.line, token.column) for token in expected_tokens]
+
+
+class TestCompiledLexerEngine:
+    """Test the compiled dispatch engine against the original pattern-by-pattern lexer."""
+
+    SAMPLES = [
+        "",
+        "KEY::value",
+        '===DOC===\nMETA:\n  TYPE::"SPEC"\n---\nFLOW::A->B→C\n===END===',
+        "A+B ⊕ C~D⧺E@F vs G⇌H|I∨J&K∧L",
+        '#1::OVERVIEW\n§2b::RULES[hints,"x"]\n  KEY::[a, b, c]',
+        'TEXT::"escaped \\"quote\\" and \\\\ slash\\n"',
+        'MULTI::"spans\nlines"  AFTER::x',
+        "NUMS::[42, -1, 3.14, -1e10, 2E5, 7.]",
+        "FLAGS::[true, false, null, trueish, nullable, vsx]",
+        "// leading comment\nKEY::value // trailing\n",
+        "   \n  \nKEY::v\n    NESTED::w\n",
+        "my-tool->next-step pkg.tool::value",
+        "+5 +x",
+        "A::1vs B",
+    ]
+
+    @pytest.mark.parametrize("content", SAMPLES)
+    def test_matches_legacy_lexer(self, content):
+        """Compiled engine should produce identical tokens and repairs."""
+        _assert_matches_legacy(content)
+
+    @pytest.mark.parametrize("content", ["KEY::\tvalue", "A::b\nC::(d)", "-invalid", "KEY::$"])
+    def test_errors_match_legacy_lexer(self, content):
+        """Compiled engine should raise the same errors at the same positions."""
+        from tests.benchmarks.legacy_lexer import tokenize as legacy_tokenize
+
+        with pytest.raises(LexerError) as expected:
+            legacy_tokenize(content)
+        with pytest.raises(LexerError) as actual:
+            tokenize(content)
+        assert str(actual.value) == str(expected.value)
+
+    def test_spec_corpus_matches_legacy_lexer(self):
+        """Compiled engine should match the legacy lexer on the specs corpus."""
+        from tests.benchmarks.corpus import load_spec_corpus
+
+        for content in load_spec_corpus().values():
+            _assert_matches_legacy(content)
+
+
+class TestStreamingTokenizer:
+    """Test iter_tokens over strings, file objects and chunked input."""
+
+    DOCUMENT = (
+        "===STREAM===\n"
+        "META:\n"
+        '  TYPE::"SPEC"\n'
+        "---\n"
+        "FLOW::A->B→C // note\n"
+        'TEXT::"multi\nline \\"string\\""\n'
+        "  LIST::[1, -2.5, true, null, x vs y]\n"
+        "§2b::RULES\n"
+        "===END==="
+    )
+
+    def test_string_source_matches_tokenize(self):
+        """iter_tokens on a string should yield the tokenize() stream."""
+        tokens, _ = tokenize(self.DOCUMENT)
+        assert list(iter_tokens(self.DOCUMENT)) == tokens
+
+    def test_every_two_chunk_split_matches_tokenize(self):
+        """Chunk boundaries inside operators, strings and envelopes should not change tokens."""
+        expected_tokens, expected_repairs = tokenize(self.DOCUMENT)
+        for split in range(len(self.DOCUMENT) + 1):
+            repairs: list = []
+            chunks = [self.DOCUMENT[:split], self.DOCUMENT[split:]]
+            streamed = list(iter_tokens(chunks, repairs))
+            assert streamed == expected_tokens, split
+            assert [(t.line, t.column) for t in streamed] == [(t.line, t.column) for t in expected_tokens], split
+            assert repairs == expected_repairs, split
+
+    def test_single_character_chunks_match_tokenize(self):
+        """One-character chunks should still produce identical tokens."""
+        tokens, _ = tokenize(self.DOCUMENT)
+        assert list(iter_tokens(iter(self.DOCUMENT))) == tokens
+
+    def test_file_object_source(self, tmp_path):
+        """iter_tokens should read file objects incrementally."""
+        path = tmp_path / "doc.oct.md"
+        path.write_text(self.DOCUMENT, encoding="utf-8")
+        tokens, _ = tokenize(self.DOCUMENT)
+        with open(path, encoding="utf-8") as f:
+            assert list(iter_tokens(f)) == tokens
+
+    def test_empty_source_yields_eof(self):
+        """Empty input should yield only EOF."""
+        assert [t.type for t in iter_tokens([])] == [TokenType.EOF]
+
+    def test_tab_error_position_across_chunks(self):
+        """Tab errors should report document positions regardless of chunking."""
+        with pytest.raises(LexerError) as exc_info:
+            list(iter_tokens(["A::b\nC::d\n", "E::\tf\n"]))
+        assert exc_info.value.line == 3
+        assert exc_info.value.column == 4
+
+    def test_streaming_memory_stays_flat(self, tmp_path):
+        """Lexing a multi-megabyte file should not hold the file in memory."""
+        import tracemalloc
+
+        path = tmp_path / "large.oct.md"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("===LARGE===\n")
+            for index in range(10_000):
+                f.write(f'FIELD_{index}::"{"generated payload " * 12}"\n')
+            f.write("===END===\n")
+        size = path.stat().st_size
+        assert size > 2_000_000
+
+        tracemalloc.start()
+        try:
+            with open(path, encoding="utf-8") as f:
+                count = sum(1 for _ in iter_tokens(f))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert count > 40_000
+        assert peak < size / 4
+
+
+class TestCanonicalFastPath:
+    """Test the canonical fast path and optional repair tracking."""
+
+    def test_track_repairs_false_keeps_tokens(self):
+        """Disabling repair tracking should not change the token stream."""
+        content = "A->B+C\n#1::X\nD::[a|b, c&d, e~f, g vs h]"
+        tokens, repairs = tokenize(content)
+        untracked_tokens, untracked_repairs = tokenize(content, track_repairs=False)
+        assert repairs
+        assert untracked_repairs == []
+        assert untracked_tokens == tokens
+
+    def test_canonical_input_has_no_repairs(self):
+        """Canonical input should lex through the fast path without repairs."""
+        content = '===DOC===\nFLOW::A→B⊕C\nTEXT::"café"\n===END==='
+        tokens, repairs = tokenize(content)
+        assert repairs == []
+        assert all(t.normalized_from is None for t in tokens)
+
+    def test_decomposed_input_is_still_normalized(self):
+        """Non-NFC input should not take the fast path."""
+        import unicodedata
+
+        decomposed = unicodedata.normalize("NFD", 'KEY::"café"')
+        tokens, _ = tokenize(decomposed)
+        assert tokens[2].value == "café"
+
+    def test_alias_inside_later_chunk_is_tracked(self):
+        """A chunk with aliases after a canonical chunk should still record repairs."""
+        repairs: list = []
+        tokens = list(iter_tokens(["A::B→C\n", "D::E->F\n"], repairs))
+        assert [r["original"] for r in repairs] == ["->"]
+        assert tokens[-3].normalized_from is None
+        assert [t.normalized_from for t in tokens if t.normalized_from] == ["->"]
+
+
+class TestTokenBuffer:
+    """Test the compact struct-of-arrays token buffer."""
+
+    CONTENT = '===DOC===\nMETA:\n  TYPE::"SPEC"\n---\nFLOW::A->B+C // note\nLIST::[1, -2.5, true, null]\n===END==='
+
+    def test_buffer_materializes_tokenize_stream(self):
+        """Iterating and indexing a buffer should yield the tokenize() tokens."""
+        tokens, repairs = tokenize(self.CONTENT)
+        buffer = tokenize_buffer(self.CONTENT)
+        assert len(buffer) == len(tokens)
+        assert list(buffer) == tokens
+        assert [buffer[i] for i in range(len(buffer))] == tokens
+        assert buffer.repairs() == repairs
+
+    def test_sequence_protocol(self):
+        """Buffer should support negative indexes, slices and bounds checks."""
+        tokens, _ = tokenize(self.CONTENT)
+        buffer = tokenize_buffer(self.CONTENT)
+        assert buffer[-1] == tokens[-1]
+        assert buffer[-1].type == TokenType.EOF
+        assert buffer[2:7] == tokens[2:7]
+        assert buffer[::3] == tokens[::3]
+        assert buffer.type_at(0) == TokenType.ENVELOPE_START
+        assert buffer.text_at(0) == "===DOC==="
+        with pytest.raises(IndexError):
+            buffer[len(buffer)]
+
+    def test_compact_storage(self):
+        """Token types and positions should live in compact arrays."""
+        buffer = tokenize_buffer("KEY::value")
+        assert isinstance(buffer.types, bytearray)
+        assert buffer.starts.typecode == "I"
+        assert list(buffer.starts) == [0, 3, 5, 10]
+        assert list(buffer.ends) == [3, 5, 10, 10]
+
+    def test_parser_consumes_buffer(self):
+        """Parser should accept a TokenBuffer in place of a token list."""
+        from octave_mcp.core.parser import parse
+
+        tokens, _ = tokenize(self.CONTENT)
+        assert parse(tokenize_buffer(self.CONTENT)) == parse(tokens)
+
+    def test_buffer_uses_five_times_less_memory(self):
+        """A buffer for the largest fixture should be at least 5x smaller than a token list."""
+        import tracemalloc
+        from pathlib import Path
+
+        fixtures = Path(__file__).resolve().parents[1] / "fixtures"
+        largest = max(fixtures.glob("*.oct.md"), key=lambda path: path.stat().st_size)
+        content = largest.read_text(encoding="utf-8")
+        tokenize(content)  # Warm up caches so they are not attributed to either measurement
+
+        tracemalloc.start()
+        try:
+            buffer = tokenize_buffer(content)
+            buffer_size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            tracemalloc.clear_traces()
+            tokens, _ = tokenize(content)
+            list_size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(tokens) == len(buffer)
+        assert list_size >= 5 * buffer_size
+
+
+class TestTokenPositions:
+    """Test offset-based token positions resolved through the shared line index."""
+
+    def test_tokens_carry_offsets(self):
+        """Tokens should record their source offset and share one line index."""
+        tokens, _ = tokenize("A::b\nCC::d")
+        assert [t.offset for t in tokens] == [0, 1, 3, 4, 5, 7, 9, 10]
+        assert len({id(t.line_index) for t in tokens}) == 1
+        assert (tokens[5].line, tokens[5].column) == (2, 3)
+
+    def test_lines_advance_inside_multiline_strings(self):
+        """Tokens after a multi-line string should report their true line and column."""
+        tokens, _ = tokenize('A::"one\ntwo" B\nC::d')
+        after = [t for t in tokens if t.value in ("B", "C")]
+        assert [(t.line, t.column) for t in after] == [(2, 6), (3, 1)]
+
+    def test_newline_after_whitespace_only_line(self):
+        """The newline ending a line of spaces should report the column after the spaces."""
+        tokens, _ = tokenize("A::b\n   \nC::d")
+        newlines = [t for t in tokens if t.type == TokenType.NEWLINE]
+        assert [(t.line, t.column) for t in newlines] == [(1, 5), (2, 4)]
+
+    def test_repair_positions(self):
+        """Repair records should resolve positions through the same index."""
+        _, repairs = tokenize('A::"x\ny"\nB::c->d')
+        assert [(r["line"], r["column"]) for r in repairs] == [(3, 5)]
+
+    def test_error_position_after_multiline_string(self):
+        """Lexer errors should report the true position of the offending character."""
+        with pytest.raises(LexerError) as exc_info:
+            tokenize('A::"x\ny"\nB::$')
+        assert (exc_info.value.line, exc_info.value.column) == (3, 4)
+
+    def test_parser_error_position(self):
+        """Parser errors should resolve positions from token offsets."""
+        from octave_mcp.core.parser import ParserError, parse
+
+        with pytest.raises(ParserError) as exc_info:
+            parse("===DOC===\nA::b\n  KEY: value")
+        assert exc_info.value.token.line == 3
+
+    def test_token_without_index(self):
+        """A token built without a line index should treat its offset as a column on line 1."""
+        token = Token(TokenType.IDENTIFIER, "x", 4)
+        assert (token.line, token.column) == (1, 5)
+
+
+class TestIncrementalRelex:
+    """Test re-lexing only the lines touched by an edit."""
+
+    CONTENT = '===DOC===\nA::1\nB::"two\nlines"\nC::x->y\nD::[a, b]\n===END==='
+
+    def _edit(self, old, new):
+        buffer = tokenize_buffer(self.CONTENT)
+        start = self.CONTENT.index(old)
+        result = relex(buffer, start, start + len(old), new)
+        expected = tokenize_buffer(self.CONTENT.replace(old, new, 1))
+        assert list(result) == list(expected)
+        assert [(t.line, t.column) for t in result] == [(t.line, t.column) for t in expected]
+        assert result.repairs() == expected.repairs()
+        return buffer, result
+
+    def test_value_edit(self):
+        """Changing one value should match a full re-lex."""
+        buffer, result = self._edit("1", "12345")
+        assert list(buffer)[-1].offset + 4 == list(result)[-1].offset
+
+    def test_edit_inside_multiline_string(self):
+        """Editing the second line of a multi-line string should re-lex the whole string."""
+        self._edit("lines", "more\nlines")
+
+    def test_edit_inserting_multiline_string(self):
+        """An edit that adds lines should shift positions of the following tokens."""
+        self._edit("x->y", '"x\n->\ny"')
+
+    def test_edit_closing_a_string_early(self):
+        """Removing the end of a multi-line string should re-lex the lines it covered."""
+        self._edit('two\nlines"', 'two"\nlines')
+
+    def test_edit_removing_alias(self):
+        """Repairs should follow the edited text."""
+        _, result = self._edit("->", "→")
+        assert result.repairs() == []
+
+    def test_original_buffer_unchanged(self):
+        """relex() should return a new buffer and leave the input untouched."""
+        buffer = tokenize_buffer(self.CONTENT)
+        before = list(buffer)
+        relex(buffer, 0, len(self.CONTENT), "")
+        assert list(buffer) == before
+
+    def test_invalid_span(self):
+        """Spans outside the source should be rejected."""
+        buffer = tokenize_buffer("A::b")
+        with pytest.raises(ValueError):
+            relex(buffer, 3, 10, "x")
+
+    def test_tab_in_replacement(self):
+        """Tabs introduced by an edit should report their document position."""
+        buffer = tokenize_buffer(self.CONTENT)
+        start = self.CONTENT.index("D::")
+        with pytest.raises(LexerError) as exc_info:
+            relex(buffer, start, start, "\t")
+        assert (exc_info.value.line, exc_info.value.column) == (6, 1)
+
+
+class TestByteLexer:
+    """Test the bytes-mode lexer over memory-mapped files."""
+
+    CONTENT = '===DOC===\nMETA:\n  TYPE::"café"\n---\nFLOW::A->B→C // naïve\nLIST::[1, -2.5, true, null]\n===END==='
+
+    def test_file_is_memory_mapped(self, tmp_path):
+        """tokenize_file should lex a read-only mmap of the file."""
+        import mmap
+
+        path = tmp_path / "doc.oct.md"
+        path.write_text(self.CONTENT, encoding="utf-8")
+        buffer = tokenize_file(path)
+        assert isinstance(buffer.source, mmap.mmap)
+
+    def test_matches_text_lexer(self):
+        """Values, positions and repairs should match the text lexer."""
+        buffer = tokenize_bytes(self.CONTENT.encode("utf-8"))
+        tokens, repairs = tokenize(self.CONTENT)
+        assert [(t.type, t.value, t.normalized_from, t.line, t.column) for t in buffer] == [
+            (t.type, t.value, t.normalized_from, t.line, t.column) for t in tokens
+        ]
+        assert buffer.repairs() == repairs
+
+    def test_offsets_are_byte_positions(self):
+        """Token offsets should index the UTF-8 bytes while columns count characters."""
+        data = 'A::"é"→B'.encode()
+        buffer = tokenize_bytes(data)
+        flow = buffer[3]
+        assert flow.type == TokenType.FLOW
+        assert flow.offset == data.index("→".encode())
+        assert flow.column == 7
+
+    def test_empty_file(self, tmp_path):
+        """An empty file cannot be mapped but should still lex to EOF."""
+        path = tmp_path / "empty.oct.md"
+        path.write_bytes(b"")
+        assert [t.type for t in tokenize_file(path)] == [TokenType.EOF]
+
+    def test_errors_match_text_lexer(self):
+        """Errors should be reported exactly as the text lexer reports them."""
+        for content in ['A::"é"\nB::\tc', 'A::"x\ny" é', "K::x$"]:
+            with pytest.raises(LexerError) as expected:
+                tokenize_buffer(content)
+            with pytest.raises(LexerError) as actual:
+                tokenize_bytes(content.encode("utf-8"))
+            assert str(actual.value) == str(expected.value)
+
+    def test_invalid_utf8(self):
+        """Undecodable input should fail as reading the file as text would."""
+        with pytest.raises(UnicodeDecodeError):
+            tokenize_bytes(b'A::"\xff"')
+
+    def test_nfc_only_input_falls_back_to_text(self):
+        """Input that is only valid after NFC normalization should lex like the text lexer."""
+        content = "\u212aEY::1"  # KELVIN SIGN normalizes to K
+        buffer = tokenize_bytes(content.encode("utf-8"))
+        assert [t.value for t in buffer][:3] == ["KEY", "::", 1]
+
+    def test_file_is_not_decoded_whole(self, tmp_path):
+        """Lexing a multi-megabyte file should not allocate a decoded copy of it."""
+        import tracemalloc
+
+        path = tmp_path / "large.oct.md"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("===LARGE===\n")
+            for index in range(10_000):
+                f.write(f'FIELD_{index}::"{"généré payload " * 12}"\n')
+            f.write("===END===\n")
+        size = path.stat().st_size
+        assert size > 2_000_000
+
+        tracemalloc.start()
+        try:
+            buffer = tokenize_file(path)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(buffer) > 40_000
+        assert peak < size / 4
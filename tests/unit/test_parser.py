@@ -4,10 +4,18 @@ Tests lenient parsing with envelope completion, whitespace normalization,
 and nested block structure.
 """
 
+import io
+import tracemalloc
+
 import pytest
 
-from octave_mcp.core.ast_nodes import Assignment, Block, ListValue
-from octave_mcp.core.parser import ParserError, parse
+from octave_mcp.core import events
+from octave_mcp.core.ast_nodes import Assignment, Block, ListValue, Section
+from octave_mcp.core.lexer import LexerError, iter_tokens
+from octave_mcp.core.parser import ParserError, iter_documents, iter_events, parse, select_top_level
+from octave_mcp.core.projector import _filter_fields
+from tests.benchmarks.corpus import generate_document, generate_nested_document, load_fixture_corpus
+from tests.properties.test_parser_equivalence import build_document
 
 
 class TestEnvelopeInference:
@@ -104,6 +112,38 @@ LEVEL1:
         assert level2.key == "LEVEL2"
         assert len(level2.children) > 0
 
+    def test_ends_block_at_column_zero_sibling(self):
+        """Should end a block when the next key starts at column 0."""
+        content = """===TEST===
+FIRST:
+  CHILD::1
+
+SECOND::2
+THIRD:
+  CHILD::3
+===END===
+"""
+        doc = parse(content)
+        assert [section.key for section in doc.sections] == ["FIRST", "SECOND", "THIRD"]
+        assert [child.key for child in doc.sections[0].children] == ["CHILD"]
+        assert parse(content, iterative=True) == doc
+
+    def test_ends_block_at_column_zero_line_right_after_children(self):
+        """Should not nest a column-0 key that directly follows a block's children (regression)."""
+        content = "===TEST===\nA:\n  X::1\nB::2\n===END===\n"
+        doc = parse(content)
+        assert [section.key for section in doc.sections] == ["A", "B"]
+        assert [child.key for child in doc.sections[0].children] == ["X"]
+        assert parse(content, iterative=True) == doc
+        assert [type(event) for event in iter_events(content)] == [
+            events.StartDocument,
+            events.StartBlock,
+            events.Assignment,
+            events.EndBlock,
+            events.Assignment,
+            events.EndDocument,
+        ]
+
     def test_enforces_2_space_indentation(self):
         """Should validate 2-space indentation (tabs caught by lexer)."""
         content = """===TEST===
@@ -116,6 +156,39 @@ BLOCK:
         assert len(doc.sections) > 0
 
 
+class TestNodeStorage:
+    """Test the memory layout of parsed nodes."""
+
+    CONTENT = """===TEST===
+FIRST:
+  STATUS::ACTIVE
+  TAGS::[a, b]
+SECOND:
+  STATUS::ACTIVE
+===END===
+"""
+
+    def test_nodes_have_no_instance_dict(self):
+        """Should build slotted nodes that reject unknown attributes."""
+        doc = parse(self.CONTENT)
+        for node in [doc, doc.sections[0], doc.sections[0].children[0], doc.sections[0].children[1].value]:
+            assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            doc.sections[0].extra = True
+
+    def test_repeated_identifiers_share_storage(self):
+        """Should share one string per distinct key and identifier value."""
+        first, second = parse(self.CONTENT).sections
+        assert first.children[0].key is second.children[0].key
+        assert first.children[0].value is second.children[0].value
+
+    def test_parse_results_match_with_all_token_sources(self):
+        """Should build equal trees from text, streamed tokens and token lists."""
+        doc = parse(self.CONTENT)
+        assert parse(list(iter_tokens(self.CONTENT))) == doc
+        assert parse(self.CONTENT, iterative=True) == doc
+
+
 class TestMetaBlock:
     """Test META block parsing."""
 
@@ -225,6 +298,331 @@ KEY::value
         doc = parse(content)
         assert doc.name == "TEST"
 
+    @pytest.mark.parametrize("iterative", [False, True])
+    def test_errors_on_unterminated_list(self, iterative):
+        """Should raise at EOF inside a list rather than loop forever (regression)."""
+        with pytest.raises(ParserError, match="LIST_END"):
+            parse("===TEST===\nTAGS::[a, b\n", iterative=iterative)
+
+
+class TestIterativeParser:
+    """Test the explicit-stack parser mode against the recursive parser."""
+
+    def test_matches_recursive_parser_on_fixtures(self):
+        """Should build the same AST for every parseable fixture."""
+        for name, content in load_fixture_corpus().items():
+            assert parse(content, iterative=True) == parse(content), name
+
+    def test_matches_recursive_parser_on_synthetic_documents(self):
+        """Should build the same AST for mixed blocks and nested § sections."""
+        for content in (
+            generate_document(sections=20, depth=4),
+            generate_nested_document(40),
+            generate_nested_document(40, sections=True),
+        ):
+            assert parse(content, iterative=True) == parse(content)
+
+    def test_section_siblings_and_children(self):
+        """Should split § sections into children and siblings by indentation."""
+        content = """===TEST===
+§1::OUTER
+  KEY::value
+  §1b::INNER
+    DEEP:
+      LEAF::1
+  AFTER::2
+§2::NEXT
+  KEY::value
+§3::LAST[a,b]
+===END===
+"""
+        doc = parse(content, iterative=True)
+        assert doc == parse(content)
+        assert [section.key for section in doc.sections] == ["OUTER", "NEXT", "LAST"]
+        outer = doc.sections[0]
+        assert [child.key for child in outer.children] == ["KEY", "INNER", "AFTER"]
+        inner = outer.children[1]
+        assert isinstance(inner, Section)
+        assert inner.section_id == "1b"
+        assert [child.key for child in inner.children] == ["DEEP"]
+
+    def test_parses_nesting_beyond_recursion_limit(self):
+        """Should parse 1000 nested blocks, where the recursive parser runs out of stack."""
+        content = generate_nested_document(1000)
+        with pytest.raises(RecursionError):
+            parse(content)
+
+        node = parse(content, iterative=True).sections[0]
+        depth = 1
+        while isinstance(node.children[-1], Block):
+            assert [child.key for child in node.children[:-1]] == ["FIELD_0", "FIELD_1"]
+            node = node.children[-1]
+            depth += 1
+        assert depth == 1000
+        assert node.key == "LEVEL_999"
+
+    def test_raises_same_errors(self):
+        """Should report single-colon assignments exactly like the recursive parser."""
+        content = """===TEST===
+OUTER:
+  INNER:
+    KEY: value
+===END===
+"""
+        with pytest.raises(ParserError) as recursive:
+            parse(content)
+        with pytest.raises(ParserError) as iterative:
+            parse(content, iterative=True)
+        assert iterative.value.error_code == "E001"
+        assert str(iterative.value) == str(recursive.value)
+
+
+class TestIterEvents:
+    """Test the SAX-style event stream."""
+
+    def test_yields_structure_events_in_order(self):
+        """Should bracket blocks and sections with start and end events."""
+        content = """===TEST===
+META:
+  TYPE::DOC
+---
+KEY::value
+§1::INTRO
+  NOTE::"text"
+  CONFIG:
+    NESTED::1
+===END===
+"""
+        stream = list(iter_events(content))
+        assert [type(event) for event in stream] == [
+            events.StartDocument,
+            events.Meta,
+            events.Assignment,
+            events.StartSection,
+            events.Assignment,
+            events.StartBlock,
+            events.Assignment,
+            events.EndBlock,
+            events.EndSection,
+            events.EndDocument,
+        ]
+        assert stream[0] == events.StartDocument(name="TEST", has_separator=True)
+        assert stream[1] == events.Meta(fields={"TYPE": "DOC"})
+        assert (stream[3].section_id, stream[3].key) == ("1", "INTRO")
+        assert (stream[5].key, stream[5].line, stream[5].column) == ("CONFIG", 8, 3)
+        assert stream[6].value == 1
+
+    def test_matches_parse_on_fixtures(self):
+        """Should describe exactly the AST parse() builds."""
+        documents = list(load_fixture_corpus().values())
+        documents += [generate_document(sections=20, depth=4), generate_nested_document(40, sections=True)]
+        for content in documents:
+            assert build_document(iter_events(content)) == parse(content)
+
+    def test_accepts_file_objects_and_token_iterators(self):
+        """Should stream from a text file or lazily produced tokens."""
+        content = generate_document(sections=5)
+        expected = list(iter_events(content))
+        assert list(iter_events(io.StringIO(content))) == expected
+        assert list(iter_events(iter_tokens(content))) == expected
+
+    def test_raises_errors_when_reached(self):
+        """Should yield the events before a syntax error, then raise it."""
+        content = """===TEST===
+FIRST::1
+BLOCK:
+  KEY: value
+===END===
+"""
+        stream = iter_events(content)
+        assert isinstance(next(stream), events.StartDocument)
+        assert next(stream).key == "FIRST"
+        with pytest.raises(ParserError) as exc_info:
+            list(stream)
+        assert exc_info.value.error_code == "E001"
+
+    def test_handles_nesting_beyond_recursion_limit(self):
+        """Should stream 1000 nested blocks."""
+        stream = list(iter_events(generate_nested_document(1000)))
+        assert sum(isinstance(event, events.StartBlock) for event in stream) == 1000
+        assert sum(isinstance(event, events.EndBlock) for event in stream) == 1000
+
+    def test_memory_does_not_grow_with_document(self):
+        """Should scan documents in memory bounded by the lexer chunk, not the document size."""
+        small = generate_document(sections=100)
+        large = generate_document(sections=400)
+
+        def peak(func):
+            tracemalloc.start()
+            try:
+                func()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        def scan(source):
+            for _ in iter_events(source):
+                pass
+
+        scan(small)  # Warm up compiled patterns
+        # Create the file objects untraced: StringIO holds its own copy of the text
+        small_file, large_file = io.StringIO(small), io.StringIO(large)
+        small_peak = peak(lambda: scan(small_file))
+        large_peak = peak(lambda: scan(large_file))
+        assert large_peak < small_peak * 1.5
+        assert large_peak < peak(lambda: parse(large)) / 10
+
+
+class TestSelectiveParsing:
+    """Test parse(only_keys=...) skipping of unneeded top-level items."""
+
+    CONTENT = """===TEST===
+META:
+  TYPE::"TEST"
+---
+STATUS::active
+BULK:
+  FIELD::1
+  MORE:
+    DEEP::"text"
+RISKS:
+  ITEM::high
+HOLDER:
+  DECISIONS::[ship]
+NOTES::"spans
+TAIL::not_a_key"
+LIST::[a,
+b]
+DECISIONS::final
+===END===
+"""
+
+    def test_keeps_matching_items_at_their_positions(self):
+        """Should keep matching items exactly as a full parse builds them."""
+        doc = parse(self.CONTENT, only_keys={"STATUS", "RISKS"})
+        full = parse(self.CONTENT)
+        assert doc.meta == {"TYPE": "TEST"}
+        assert doc.has_separator is True
+        assert [section.key for section in doc.sections] == ["STATUS", "RISKS"]
+        assert doc.sections == [full.sections[0], full.sections[2]]
+
+    def test_projection_matches_full_parse(self):
+        """Should keep items that mention a key so nested matches survive filtering."""
+        for keys in (["STATUS", "RISKS", "DECISIONS"], ["DEEP"], ["TAIL"], ["b"], []):
+            expected = _filter_fields(parse(self.CONTENT), keys)
+            assert _filter_fields(parse(self.CONTENT, only_keys=keys), keys) == expected
+
+    def test_does_not_split_multiline_strings_or_lists(self):
+        """Should treat column-0 lines inside strings and lists as part of their item."""
+        selected = select_top_level(self.CONTENT, {"NOTES", "LIST"})
+        assert '"spans\nTAIL::not_a_key"' in selected
+        assert "[a,\nb]" in selected
+        assert "BULK" not in selected
+        assert selected.count("\n") == self.CONTENT.count("\n")
+
+    def test_keeps_everything_after_first_section(self):
+        """Should not skip column-0 lines that may be § section children."""
+        content = """===TEST===
+SKIPPED::1
+§1::INTRO
+CHILD::2
+OTHER:
+  KEY::3
+===END===
+"""
+        doc = parse(content, only_keys={"NONE"})
+        assert [section.key for section in doc.sections] == ["INTRO", "CHILD", "OTHER"]
+        assert doc.sections == parse(content).sections[1:]
+
+    def test_keeps_item_after_block_without_children(self):
+        """Should keep the item that ends an empty block, which decides its position."""
+        content = """===TEST===
+EMPTY:
+// no children
+NEXT::1
+LAST::2
+===END===
+"""
+        selected = select_top_level(content, {"EMPTY"})
+        assert "NEXT::1" in selected
+        assert "LAST" not in selected
+        assert parse(content, only_keys={"EMPTY"}).sections[0] == parse(content).sections[0]
+
+    def test_skipped_items_are_not_tokenized(self):
+        """Should not report syntax errors inside skipped items."""
+        content = "===TEST===\nKEEP::1\nBROKEN:\n  KEY::x$\n===END===\n"
+        with pytest.raises(LexerError):
+            parse(content)
+        assert [section.key for section in parse(content, only_keys={"KEEP"}).sections] == ["KEEP"]
+
+    def test_falls_back_to_full_parse(self):
+        """Should leave content unchanged when it cannot be split safely."""
+        for content in ('KEEP::1\nOTHER::"open\n', "KEEP::1\nOTHER::[a\n", "KEEP::1\nOTHER::a]\n"):
+            assert select_top_level(content, {"KEEP"}) == content
+
+
+class TestIterDocuments:
+    """Test lazy parsing of concatenated envelopes."""
+
+    STREAM = """// export
+===FIRST===
+META:
+  TYPE::"A"
+---
+KEY::1
+===END===
+
+===SECOND===
+BLOCK:
+  CHILD::[a, b]
+===END===
+// trailing
+"""
+
+    def test_yields_each_envelope(self):
+        """Should parse every envelope, not only the first."""
+        docs = list(iter_documents(self.STREAM))
+        assert [doc.name for doc in docs] == ["FIRST", "SECOND"]
+        assert docs[0].meta == {"TYPE": "A"}
+        assert docs[1].sections[0].children[0].value.items == ["a", "b"]
+
+    def test_positions_refer_to_the_stream(self):
+        """Should report lines of the whole stream."""
+        second = list(iter_documents(self.STREAM))[1]
+        assert second.sections[0].children[0].line == 11
+
+    def test_matches_parsing_each_envelope(self):
+        """Should build the same documents as parsing each envelope's text alone."""
+        first, second = self.STREAM.split("\n\n")
+        docs = list(iter_documents(self.STREAM))
+        assert _filter_fields(docs[0], ["KEY"]) == _filter_fields(parse(first), ["KEY"])
+        assert docs[1].sections[0].key == parse(second).sections[0].key
+
+    def test_splits_at_start_when_end_is_missing(self):
+        """Should start a new document at an envelope line when ===END=== is missing."""
+        content = "===A===\nX::1\n===B===\nY::2\n===END===\n"
+        docs = list(iter_documents(content))
+        assert [(doc.name, doc.sections[0].key) for doc in docs] == [("A", "X"), ("B", "Y")]
+
+    def test_content_without_envelope(self):
+        """Should parse text without envelopes as one document, like parse()."""
+        assert list(iter_documents("KEY::value\n")) == [parse("KEY::value\n")]
+        assert list(iter_documents("\n// nothing\n")) == []
+
+    def test_reads_file_lazily(self):
+        """Should yield a document before reading the rest of the stream."""
+        stream = io.StringIO(self.STREAM)
+        docs = iter_documents(stream)
+        assert next(docs).name == "FIRST"
+        assert stream.tell() == self.STREAM.index("\n\n") + 1
+
+    def test_reports_errors_when_reached(self):
+        """Should yield documents before a later one that fails to parse."""
+        docs = iter_documents("===A===\nX::1\n===END===\n===B===\nLIST::[a\n===END===\n")
+        assert next(docs).name == "A"
+        with pytest.raises(ParserError):
+            next(docs)
+
 
 class TestSchemaSelection:
     """Test schema selection errors (E002)."""
@@ -0,0 +1,236 @@
+"""Tests for the single-pass processing pipeline."""
+
+import sys
+
+import pytest
+
+from octave_mcp.core.ast_nodes import Assignment
+from octave_mcp.core.emitter import emit
+from octave_mcp.core.lexer import LexerError, tokenize
+from octave_mcp.core.parser import parse
+from octave_mcp.core.pipeline import PIPELINE_CACHE, PipelineCache, PipelineError, PipelineResult, process
+from tests.benchmarks.corpus import generate_document
+
+CONTENT = """===DOC===
+META:
+  TYPE::"TEST"
+---
+FLOW::A->B+C
+§1::OVERVIEW
+STATUS::active
+===END==="""
+
+
+class TestProcess:
+    """Test process() against the separate tokenize/parse/emit stages."""
+
+    def test_matches_separate_stages(self):
+        """Tokens, repairs, AST and canonical text should match the individual stages."""
+        result = process(CONTENT)
+        tokens, repairs = tokenize(CONTENT)
+        assert isinstance(result, PipelineResult)
+        assert list(result.tokens) == tokens
+        assert result.repairs == repairs
+        assert result.doc == parse(CONTENT)
+        assert result.canonical == emit(parse(CONTENT))
+
+    def test_lexes_once(self, monkeypatch):
+        """Content should be tokenized exactly once."""
+        from octave_mcp.core import pipeline
+
+        calls = []
+        original = pipeline.tokenize_buffer
+
+        def counting(content):
+            calls.append(content)
+            return original(content)
+
+        monkeypatch.setattr(pipeline, "tokenize_buffer", counting)
+        assert process(CONTENT).canonical
+        assert calls == [CONTENT]
+
+    def test_canonical_is_emitted_once(self, monkeypatch):
+        """Canonical text should be emitted once, while processing."""
+        from octave_mcp.core import pipeline
+
+        calls = []
+
+        def counting(doc, reuse=False):
+            calls.append(doc)
+            return emit(doc, reuse)
+
+        monkeypatch.setattr(pipeline, "emit", counting)
+        result = process(CONTENT)
+        assert calls == [result.doc]
+        assert result.canonical is result.canonical
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("served", ["uncached", "miss", "hit"])
+    def test_canonical_ignores_later_changes_to_doc(self, served):
+        """Canonical text should be that of the content, however the caller changes doc."""
+        cache = PipelineCache()
+        if served == "hit":
+            process(CONTENT, cache=cache)
+        result = process(CONTENT, cache=None if served == "uncached" else cache)
+        result.doc.sections.clear()
+        result.doc.name = "CHANGED"
+        assert result.canonical == emit(parse(CONTENT))
+
+    def test_lexer_error_propagates(self):
+        """Lexer errors should be raised unchanged."""
+        with pytest.raises(LexerError):
+            process("KEY::\tvalue")
+
+    def test_parse_error_keeps_repairs(self):
+        """Parse failures should carry the repairs found while lexing."""
+        with pytest.raises(PipelineError) as exc_info:
+            process("A->B\n§This is bad")
+        error = exc_info.value
+        assert [r["original"] for r in error.repairs] == ["->"]
+        assert error.tokens
+        assert str(error) == str(error.error)
+        assert error.__cause__ is error.error
+
+
+class TestPipelineCache:
+    """Test the content-hash keyed result cache."""
+
+    def test_repeat_content_hits(self, monkeypatch):
+        """Content processed again should be served without lexing."""
+        from octave_mcp.core import pipeline
+
+        calls = []
+        original = pipeline.tokenize_buffer
+
+        def counting(content):
+            calls.append(content)
+            return original(content)
+
+        monkeypatch.setattr(pipeline, "tokenize_buffer", counting)
+        cache = PipelineCache()
+        first = process(CONTENT, cache=cache)
+        second = process(CONTENT, cache=cache)
+
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == cache.stats()["misses"] == cache.stats()["entries"] == 1
+        assert second.doc == first.doc == parse(CONTENT)
+        assert second.repairs == first.repairs
+        assert list(second.tokens) == list(first.tokens)
+        assert second.canonical == first.canonical == emit(parse(CONTENT))
+
+    def test_results_own_their_ast(self):
+        """Modifying a result's AST should not change later results."""
+        cache = PipelineCache()
+        first = process(CONTENT, cache=cache)
+        first.doc.sections.clear()
+        second = process(CONTENT, cache=cache)
+        second.doc.name = "CHANGED"
+        second.repairs.clear()
+
+        third = process(CONTENT, cache=cache)
+        assert third.doc == parse(CONTENT)
+        assert third.repairs
+        assert third.canonical == emit(parse(CONTENT))
+
+    @pytest.mark.parametrize("hit", [False, True])
+    def test_results_carry_emitted_text(self, hit):
+        """ASTs from a miss or a hit should re-emit incrementally."""
+        content = "===DOC===\nFIRST:\n  KEY::1\nSECOND:\n  NESTED:\n    KEY::2\n===END==="
+        cache = PipelineCache()
+        result = process(content, cache=cache)
+        if hit:
+            result = process(content, cache=cache)
+        doc = result.doc
+        assert result.canonical == emit(parse(content))
+        assert doc.sections[0]._text == (0, "FIRST:\n  KEY::1")
+
+        updated = doc.with_value("SECOND.NESTED.KEY", 3)
+        assert updated.sections[0]._text is doc.sections[0]._text
+        assert emit(updated, reuse=True) == emit(parse(content.replace("KEY::2", "KEY::3")))
+
+    def test_hits_emit_in_place_changes(self):
+        """Plain emission of a served AST should ignore the restored text after in-place changes."""
+        content = "===DOC===\nFIRST:\n  KEY::1\n===END==="
+        cache = PipelineCache()
+        process(content, cache=cache)
+        doc = process(content, cache=cache).doc
+        doc.sections[0].children[0].value = 2
+        doc.sections[0].children.append(Assignment(key="ADDED", value=3))
+        assert emit(doc) == "===DOC===\nFIRST:\n  KEY::2\n  ADDED::3\n===END==="
+
+    def test_key_includes_selection_and_version(self, monkeypatch):
+        """Different only_keys selections and parser versions should not share entries."""
+        from octave_mcp.core import pipeline
+
+        cache = PipelineCache()
+        process(CONTENT, cache=cache)
+        process(CONTENT, only_keys=["STATUS"], cache=cache)
+        process(CONTENT, only_keys=[], cache=cache)
+        monkeypatch.setattr(pipeline, "PARSER_VERSION", "test")
+        process(CONTENT, cache=cache)
+        assert (cache.hits, cache.misses, len(cache)) == (0, 4, 4)
+
+    def test_evicts_least_recently_used(self):
+        """Entries should be evicted oldest-use first once the size bound is exceeded."""
+        documents = [f"KEY::{index}\n" for index in range(3)]
+        probe = PipelineCache()
+        process(documents[0], cache=probe)
+        cache = PipelineCache(max_bytes=2 * probe.size)
+        process(documents[0], cache=cache)
+        process(documents[1], cache=cache)
+        process(documents[0], cache=cache)
+        process(documents[2], cache=cache)  # Evicts documents[1]
+
+        assert len(cache) == 2
+        assert cache.size <= cache.max_bytes
+        process(documents[0], cache=cache)
+        process(documents[1], cache=cache)
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_weighs_what_entries_hold(self):
+        """Entries should be weighed by their snapshot, tokens, repairs and emitted text, not their content."""
+        content = generate_document(sections=20, fields=5)
+        cache = PipelineCache()
+        result = process(content, cache=cache)
+        (entry,) = cache._entries.values()
+        tokens = result.tokens
+        repairs = sum(sys.getsizeof(repair) for repair in entry.repairs)
+        texts = sum(len(text[1]) for text in entry.texts if text is not None)
+        assert entry.tokens is tokens
+        assert repairs > 0
+        assert texts > 0
+        assert (
+            cache.size
+            == entry.size
+            == len(entry.snapshot) + len(tokens.source) + tokens.nbytes + repairs + len(result.canonical) + texts
+        )
+
+    def test_skips_oversized_content_and_errors(self):
+        """Content larger than the cache and content that fails to parse should not be kept."""
+        cache = PipelineCache(max_bytes=10)
+        process(CONTENT, cache=cache)
+        with pytest.raises(PipelineError):
+            process("§bad", cache=cache)
+        assert len(cache) == 0
+        assert cache.misses == 2
+
+    def test_clear(self):
+        """Clearing should drop entries and reset counters."""
+        cache = PipelineCache()
+        process(CONTENT, cache=cache)
+        process(CONTENT, cache=cache)
+        cache.clear()
+        assert cache.stats() == {"hits": 0, "misses": 0, "entries": 0, "bytes": 0}
+
+    @pytest.mark.asyncio
+    async def test_shared_by_tools(self):
+        """Content sent to several MCP tools should be parsed once."""
+        from octave_mcp.mcp.eject import EjectTool
+        from octave_mcp.mcp.ingest import IngestTool
+
+        PIPELINE_CACHE.clear()
+        content = CONTENT.replace("DOC", "SHARED")
+        await IngestTool().execute(content=content, schema="TEST")
+        await IngestTool().execute(content=content, schema="TEST", fix=True)
+        await EjectTool().execute(content=content, schema="TEST", mode="canonical")
+        assert (PIPELINE_CACHE.hits, PIPELINE_CACHE.misses) == (2, 1)
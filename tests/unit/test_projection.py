@@ -1,7 +1,7 @@
 """Tests for projection modes (P1.9)."""
 
 from octave_mcp.core.parser import parse
-from octave_mcp.core.projector import project
+from octave_mcp.core.projector import _filter_fields, project
 
 
 class TestProjectionModes:
@@ -179,3 +179,18 @@ TESTS::pytest_suite
 
         # Should keep TESTS
         assert "TESTS::pytest_suite" in result.output
+
+
+class TestProjectionSharing:
+    """Test that projections share kept subtrees with the source document."""
+
+    def test_kept_subtrees_are_shared(self):
+        """Kept blocks should be the source's nodes; only their non-kept ancestors are copied."""
+        doc = parse("===TEST===\nSTATUS:\n  PHASE::build\nOTHER::1\nOUTER:\n  RISKS::low\n  NOISE::2\n===END===")
+        filtered = _filter_fields(doc, ["STATUS", "RISKS"])
+
+        status, outer = filtered.sections
+        assert status is doc.sections[0]
+        assert outer is not doc.sections[2]
+        assert outer.children == [doc.sections[2].children[0]]
+        assert outer.children[0] is doc.sections[2].children[0]
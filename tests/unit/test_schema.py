@@ -1,7 +1,9 @@
 """Tests for schema validation (P1.5)."""
 
-from octave_mcp.core.parser import parse
-from octave_mcp.core.validator import validate
+import pytest
+
+from octave_mcp.core.parser import ParserError, iter_events, parse
+from octave_mcp.core.validator import validate, validate_events
 
 
 class TestRequiredFields:
@@ -158,3 +160,42 @@ META:
         # Should succeed because "ACT" only matches "ACTIVE"
         status_errors = [e for e in errors if "STATUS" in e.field_path]
         assert len(status_errors) == 0
+
+
+class TestEventValidation:
+    """Test validation from the parser event stream."""
+
+    def test_matches_ast_validation(self):
+        """Should report the same errors as validating the parsed Document."""
+        schema = {
+            "META": {
+                "required": ["TYPE", "VERSION"],
+                "fields": {"TYPE": {"type": "STRING"}, "STATUS": {"type": "ENUM", "values": ["ACTIVE", "ACTIVATING"]}},
+            }
+        }
+
+        content = """===TEST===
+META:
+  TYPE::TEST_DOC
+  STATUS::ACTIV
+  EXTRA::value
+BODY:
+  KEY::value
+===END===
+"""
+        for strict in (False, True):
+            expected = validate(parse(content), schema, strict=strict)
+            assert expected
+            assert validate_events(iter_events(content), schema, strict=strict) == expected
+
+    def test_consumes_whole_stream(self):
+        """Should surface syntax errors after META."""
+        content = """===TEST===
+META:
+  TYPE::TEST_DOC
+BODY:
+  KEY: value
+===END===
+"""
+        with pytest.raises(ParserError):
+            validate_events(iter_events(content), {"META": {"fields": {"TYPE": {"type": "STRING"}}}})